@@ -0,0 +1,274 @@
+"""
+Benchmark runner for the Morse Code Converter hot paths.
+
+Mide el rendimiento de la conversión, la validación, la generación de audio y
+la E/S de archivos para distintos tamaños de entrada, escribe los resultados
+en JSON y los compara con una línea base guardada.
+
+Example:
+    $ python benchmarks/run_benchmarks.py --output results.json
+    $ python benchmarks/run_benchmarks.py --save-baseline
+    $ python benchmarks/run_benchmarks.py --sizes 10B,1KB,100MB --threshold 0.15
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+from morse_converter.core.audio import AudioGenerator  # noqa: E402
+from morse_converter.core.converter import MorseConverter  # noqa: E402
+from morse_converter.core.validator import InputValidator  # noqa: E402
+from morse_converter.utils.file_handler import FileHandler  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_SIZES = "10B,1KB,100KB,1MB"
+DEFAULT_AUDIO_MAX_SIZE = "1KB"
+
+# Texto base para generar entradas de cualquier tamaño
+SAMPLE_TEXT = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG 0123456789 "
+
+_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+def parse_size(value: str) -> int:
+    """
+    Parses a human readable size such as ``10B``, ``100KB`` or ``1MB``.
+
+    Parameters:
+        value (str): The size to parse.
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    value = value.strip().upper()
+    for unit in sorted(_UNITS, key=len, reverse=True):
+        if value.endswith(unit):
+            return int(float(value[:-len(unit)]) * _UNITS[unit])
+    return int(value)
+
+def format_size(size: int) -> str:
+    """Formats a size in bytes using the largest exact unit."""
+    for unit in ("GB", "MB", "KB"):
+        if size >= _UNITS[unit] and size % _UNITS[unit] == 0:
+            return f"{size // _UNITS[unit]}{unit}"
+    return f"{size}B"
+
+def make_text(size: int) -> str:
+    """Builds valid plain text of exactly ``size`` characters."""
+    repeats = size // len(SAMPLE_TEXT) + 1
+    text = (SAMPLE_TEXT * repeats)[:size]
+    # Evitar un espacio final para que la validación lo acepte
+    return text[:-1] + "E" if text.endswith(" ") else text
+
+def make_morse(size: int, converter: MorseConverter) -> str:
+    """Builds valid Morse code of about ``size`` characters."""
+    unit = converter.text_to_morse(SAMPLE_TEXT.strip()) + "  "
+    morse = (unit * (size // len(unit) + 1))[:size]
+    # Cortar en un límite de letra para que la secuencia sea válida
+    cut = morse.rfind(" ") if len(morse) > 1 else -1
+    morse = morse[:cut].rstrip() if cut > 0 else "."
+    return morse
+
+def measure(func: Callable[[], Any], min_time: float, max_runs: int) -> List[float]:
+    """Runs ``func`` repeatedly and returns the duration of every run in seconds."""
+    timings: List[float] = []
+    deadline = time.perf_counter() + min_time
+    while len(timings) < max_runs:
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+        if time.perf_counter() >= deadline:
+            break
+    return timings
+
+def build_cases(size: int, audio_max_size: int, work_dir: Path) -> Dict[str, Tuple[Callable[[], Any], int]]:
+    """
+    Prepares the benchmark cases for one input size.
+
+    Returns:
+        Dict[str, Tuple[Callable, int]]: Callable per benchmark name and the
+        number of input bytes it processes.
+    """
+    converter = MorseConverter()
+    validator = InputValidator()
+    handler = FileHandler()
+
+    text = make_text(size)
+    morse = make_morse(size, converter)
+    # La validación limita la longitud; ampliarla para medir entradas grandes
+    validator.MAX_INPUT_LENGTH = max(len(text), len(morse))
+    file_path = work_dir / f"bench_{size}.txt"
+    # Registros cortos (palabras) para la conversión por lotes
+    records = text.split()
+    morse_records = converter.encode_many(records)
+
+    cases: Dict[str, Tuple[Callable[[], Any], int]] = {
+        "text_to_morse": (lambda: converter.text_to_morse(text), len(text)),
+        "morse_to_text": (lambda: converter.morse_to_text(morse), len(morse)),
+        "encode_many": (lambda: converter.encode_many(records), len(text)),
+        "decode_many": (lambda: converter.decode_many(morse_records), sum(map(len, morse_records))),
+        "validate_text_input": (lambda: validator.validate_text_input(text), len(text)),
+        "validate_morse_input": (lambda: validator.validate_morse_input(morse), len(morse)),
+        "write_file": (lambda: handler.write_file(str(file_path), text), len(text)),
+        "read_file": (lambda: handler.read_file(str(file_path)), len(text)),
+    }
+    if size <= audio_max_size:
+        generator = AudioGenerator()
+        cases["generate_audio"] = (lambda: generator.generate_audio(morse), len(morse))
+    handler.write_file(str(file_path), text)
+    return cases
+
+def run_benchmarks(
+    sizes: List[int],
+    audio_max_size: int,
+    min_time: float,
+    max_runs: int,
+    only: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Runs every benchmark for every size.
+
+    Returns:
+        Dict[str, Any]: Machine-readable results with environment metadata.
+    """
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            for name, (func, processed) in build_cases(size, audio_max_size, Path(tmp)).items():
+                if only and name not in only:
+                    continue
+                timings = measure(func, min_time, max_runs)
+                median = statistics.median(timings)
+                result = {
+                    "name": name,
+                    "size": size,
+                    "label": format_size(size),
+                    "bytes": processed,
+                    "runs": len(timings),
+                    "min": min(timings),
+                    "median": median,
+                    "mean": statistics.fmean(timings),
+                    "throughput_bps": processed / median if median > 0 else None,
+                }
+                results.append(result)
+                print(f"{name:<22} {result['label']:>7}  median {median * 1000:10.3f} ms  "
+                      f"({result['runs']} runs)", file=sys.stderr)
+
+    return {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+        },
+        "results": results,
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compares results against a baseline.
+
+    Parameters:
+        current (Dict[str, Any]): Results of this run.
+        baseline (Dict[str, Any]): Stored baseline results.
+        threshold (float): Allowed relative slowdown of the median (0.1 = 10%).
+
+    Returns:
+        List[Dict[str, Any]]: One entry per benchmark present in both runs,
+        with the median ratio and whether it is a regression.
+    """
+    reference = {(r["name"], r["size"]): r for r in baseline.get("results", [])}
+    comparison = []
+    for result in current["results"]:
+        base = reference.get((result["name"], result["size"]))
+        if base is None or not base["median"]:
+            continue
+        ratio = result["median"] / base["median"]
+        comparison.append({
+            "name": result["name"],
+            "size": result["size"],
+            "label": result["label"],
+            "baseline_median": base["median"],
+            "median": result["median"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return comparison
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses the command-line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the Morse Code Converter hot paths.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Comma-separated input sizes, 10B to 100MB (default: {DEFAULT_SIZES})")
+    parser.add_argument("--audio-max-size", default=DEFAULT_AUDIO_MAX_SIZE,
+                        help=f"Largest Morse input rendered to audio (default: {DEFAULT_AUDIO_MAX_SIZE})")
+    parser.add_argument("--only", default=None,
+                        help="Comma-separated benchmark names to run (default: all)")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Minimum measuring time per benchmark in seconds (default: 0.2)")
+    parser.add_argument("--max-runs", type=int, default=50,
+                        help="Maximum repetitions per benchmark (default: 50)")
+    parser.add_argument("--output", "-o", type=Path, default=None,
+                        help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help=f"Baseline JSON to compare against (default: {DEFAULT_BASELINE.name})")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store these results as the new baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed relative slowdown before failing (default: 0.10)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmarks and compares them with the baseline.
+
+    Returns:
+        int: Exit code (0 when there are no regressions, 1 otherwise)
+    """
+    args = parse_args(argv)
+    # Silenciar el logging para medir sólo el trabajo de conversión
+    logging.disable(logging.CRITICAL)
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    only = args.only.split(",") if args.only else None
+    report = run_benchmarks(sizes, parse_size(args.audio_max_size), args.min_time, args.max_runs, only)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+    elif args.baseline.exists():
+        comparison = compare(report, json.loads(args.baseline.read_text()), args.threshold)
+        report["comparison"] = {"baseline": str(args.baseline), "threshold": args.threshold,
+                                "results": comparison}
+        for entry in comparison:
+            status = "REGRESSION" if entry["regression"] else "ok"
+            print(f"{entry['name']:<22} {entry['label']:>7}  x{entry['ratio']:.2f}  {status}",
+                  file=sys.stderr)
+    else:
+        print(f"No baseline found at {args.baseline}; run with --save-baseline to create one",
+              file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+    regressions = [e for e in report.get("comparison", {}).get("results", []) if e["regression"]]
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,7 @@ from morse_converter.core import (
     MorseConverter,
     AudioGenerator,
     AudioPlayer,
+    AudioDecoder,
     InputValidator,
     ValidationError,
     AudioError,
@@ -53,6 +54,7 @@ __all__ = [
     'MorseConverter',
     'AudioGenerator',
     'AudioPlayer',
+    'AudioDecoder',
     'InputValidator',
     
     # Exceptions
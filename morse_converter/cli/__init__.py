@@ -10,6 +10,7 @@ Functions:
     text_to_morse: Convierte texto a código Morse
     morse_to_text: Convierte código Morse a texto
     play_morse: Reproduce código Morse como audio
+    repl: Sesión interactiva que mantiene el estado cargado
     main: Punto de entrada principal de la aplicación
     load_config: Carga la configuración desde archivo JSON
     validate_frequency: Valida el rango de frecuencia de audio
@@ -23,6 +24,7 @@ from morse_converter.cli.interface import (
     text_to_morse,
     morse_to_text,
     play_morse,
+    repl,
     main,
     load_config,
     validate_frequency,
@@ -36,6 +38,7 @@ __all__ = [
     'text_to_morse',
     'morse_to_text',
     'play_morse',
+    'repl',
     'main',
     'load_config',
     'validate_frequency',
@@ -1,44 +1,64 @@
+import copy
 import typer
 import signal
-import json
+import sys
+import cProfile
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
-from rich.console import Console
-from rich.progress import Progress
+from typing import Optional, Dict, Any, Callable, List
 from morse_converter.core.converter import MorseConverter
+from morse_converter.core.code_tables import available_tables
+from morse_converter.core.parallel import DEFAULT_CHUNK_SIZE, MORSE_TO_TEXT, TEXT_TO_MORSE, ParallelConverter, last_boundary
 from morse_converter.core.audio import AudioGenerator, AudioPlayer
-from morse_converter.utils import FileHandler, setup_logger
+from morse_converter.core.render import BatchRenderer, RenderResult, read_messages
+from morse_converter.core.batch import STATUS_DONE as BATCH_DONE, STATUS_FAILED as BATCH_FAILED, STATUS_SKIPPED as BATCH_SKIPPED, BatchJob, BatchResult
+from morse_converter.core.watcher import DEFAULT_POLL_INTERVAL, STATUS_DONE as WATCH_DONE, DirectoryWatcher, WatchResult
+from morse_converter.utils import FileHandler, setup_logger, metrics
+from morse_converter.utils.metrics import MetricsServer, write_prometheus
+from morse_converter.utils.cache import CacheError, ConversionCache, file_key, table_fingerprint
 from morse_converter.core.validator import InputValidator, ValidationError
+from morse_converter.config import DEFAULT_CONFIG, Config, get_config, get_service, watch_config
+from morse_converter.cli.repl import Repl, prompt_lines
+from morse_converter.cli.output import FORMAT_JSON, FORMAT_RICH, OUTPUT_FORMATS, Output
 
 # Configuración inicial
 app = typer.Typer(
     help="Morse Code Converter CLI - Convert text to Morse code and vice versa, with audio playback capabilities"
 )
-console = Console()
+# Rich sólo se importa al mostrar salida en formato rich
+output = Output()
 logger = setup_logger(__name__)
 
 # Configuración global
 config: Dict[str, Any] = {}
 
+# Bytes leídos de stdin por lectura en modo tubería
+PIPE_CHUNK_SIZE = 64 * 1024
+
+# Argumento que indica leer de stdin
+STDIN_ARGUMENT = "-"
+
 def load_config() -> Dict[str, Any]:
-    """Cargar configuración desde archivo JSON."""
+    """Obtener la configuración validada del servicio compartido."""
     try:
-        config_path = Path(__file__).parent.parent / "config" / "config.json"
-        with open(config_path) as f:
-            return json.load(f)
-    except Exception as e:
+        return get_config()
+    except ValueError as e:
         logger.warning(f"Could not load config file: {e}. Using defaults.")
-        return {
-            "audio": {
-                "frequency": 800,
-                "volume": 0.5
-            }
-        }
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+def refresh_config(new_config: Config) -> None:
+    """Mantener la configuración del CLI al día cuando el servicio la recarga."""
+    global config
+    config = new_config.model_dump()
+
+# Las recargas sólo ocurren con watch_config activado (comandos de larga
+# duración como repl); en el resto la configuración se lee una vez al arrancar
+get_service().subscribe(refresh_config)
 
 def signal_handler(signum: int, frame: Any) -> None:
     """Manejador de señales para limpieza al salir."""
     logger.info("Received signal to terminate")
-    console.print("\n[yellow]Cleaning up and exiting...[/yellow]")
+    output.print("\n[yellow]Cleaning up and exiting...[/yellow]")
     raise typer.Exit()
 
 # Registrar manejadores de señales
@@ -68,7 +88,8 @@ def get_file_handler():
     """Obtener instancia de file_handler."""
     global file_handler
     if file_handler is None:
-        file_handler = FileHandler()
+        # Escrituras atómicas: un archivo de salida existente siempre está completo
+        file_handler = FileHandler(atomic=True)
     return file_handler
 
 def validate_frequency(frequency: int) -> int:
@@ -82,11 +103,272 @@ validator = get_validator()
 converter = get_converter()
 file_handler = get_file_handler()
 
+def print_profile_report(profiler: Optional[cProfile.Profile], profile_output: Optional[Path]) -> None:
+    """Mostrar el desglose por etapa y volcar las estadísticas de cProfile."""
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(str(profile_output))
+        logger.info(f"cProfile statistics written to {profile_output}")
+
+    rows = [
+        (
+            row["name"],
+            str(row["calls"]),
+            f"{row['total'] * 1000:.3f}",
+            f"{row['mean'] * 1000:.3f}",
+            f"{row['max'] * 1000:.3f}",
+            f"{row['share']:.1%}",
+        )
+        for row in metrics.summary()
+    ]
+    output.table("Profile", ("Stage", "Calls", "Total (ms)", "Mean (ms)", "Max (ms)", "Share"), rows)
+
+    if profiler is not None:
+        output.print(f"[blue]cProfile output saved to:[/blue] {profile_output}")
+        output.print(f"[blue]Inspect with:[/blue] python -m pstats {profile_output}")
+    metrics.disable()
+
+def stream_pipe(
+    convert_many: Callable[[List[str]], List[str]],
+    output_file: Optional[Path] = None,
+    chunk_size: int = PIPE_CHUNK_SIZE,
+    direction: str = TEXT_TO_MORSE
+) -> int:
+    """
+    Converts stdin to stdout (or a file) line by line.
+
+    Input is read in chunks of whatever is available, so output follows
+    input without waiting for a full buffer. The complete lines of each chunk
+    are converted in one batch, and every converted line is written without
+    Rich formatting: one line per input line, one JSON object per line in
+    ndjson format, or a JSON array written incrementally in json format.
+
+    A line longer than the chunk size is converted in parts cut at word
+    boundaries (any space for text, a word gap for Morse code), so memory
+    use is bounded by the chunk size and the longest word. In plain format
+    the parts are written on the same output line; in JSON formats every
+    part is a record with the same ``line`` number and a ``part`` index,
+    whose outputs concatenate to the converted line.
+
+    Parameters:
+        convert_many (Callable): Batch conversion, e.g. ``converter.encode_many``.
+        output_file (Path, optional): Write here instead of stdout.
+        chunk_size (int): Bytes read from stdin at a time (default: 64 KiB)
+        direction (str): ``TEXT_TO_MORSE`` or ``MORSE_TO_TEXT``, for the word
+            boundaries of long lines (default: text to Morse)
+
+    Returns:
+        int: Number of lines converted.
+
+    Raises:
+        ValueError: If a line cannot be converted; the message includes the
+            line number and every previous line has been written.
+    """
+    stdin = sys.stdin.buffer
+    if output_file is not None:
+        writer = get_file_handler().open_writer(str(output_file))
+        write, close, abort = writer.write, writer.close, writer.abort
+    else:
+        stdout = sys.stdout.buffer
+
+        def write(text: str) -> None:
+            stdout.write(text.encode('utf-8'))
+            stdout.flush()
+        close, abort = stdout.flush, lambda: None
+
+    lines_done = 0
+    records_written = 0
+    # Partes ya escritas de la línea en curso y separador con la siguiente
+    parts = 0
+    pending = ''
+    # En JSON la salida es un único array que se escribe a medida que avanza
+    as_array = output.format == FORMAT_JSON
+
+    def emit(lines: List[str], results: List[str], tail_gap: Optional[str] = None) -> None:
+        nonlocal records_written
+        if not results:
+            return
+        pieces = []
+        for i, (line, result) in enumerate(zip(lines, results)):
+            continuing = i == 0 and parts > 0
+            partial = tail_gap is not None and i == len(lines) - 1
+            if continuing and result:
+                result = pending + result
+            if output.is_json:
+                record = {"line": lines_done + i + 1, "input": line, "output": result}
+                if continuing or partial:
+                    record["part"] = parts if continuing else 0
+                pieces.append(output.dumps(record) + ('' if as_array else '\n'))
+            else:
+                pieces.append(result + ('' if partial else '\n'))
+        if as_array:
+            text = (',\n' if records_written else '') + ',\n'.join(pieces)
+        else:
+            text = ''.join(pieces)
+        records_written += len(pieces)
+        write(text)
+
+    def convert(lines: List[str], tail_gap: Optional[str] = None) -> None:
+        nonlocal lines_done, parts, pending
+        try:
+            results = convert_many(lines)
+        except ValueError:
+            # Localizar la línea que falla y escribir las anteriores
+            results = []
+            for line in lines:
+                try:
+                    results.extend(convert_many([line]))
+                except ValueError as e:
+                    emit(lines, results)
+                    message = str(e).split(': ', 1)[-1] if str(e).startswith("Record ") else str(e)
+                    raise ValueError(f"Line {lines_done + len(results) + 1}: {message}") from None
+        emit(lines, results, tail_gap)
+        if tail_gap is None:
+            lines_done += len(lines)
+            parts = 0
+        else:
+            lines_done += len(lines) - 1
+            parts = (parts if len(lines) == 1 else 0) + 1
+            pending = tail_gap
+
+    try:
+        if as_array:
+            write('[\n')
+        carry = b''
+        while True:
+            data = stdin.read1(chunk_size)
+            if not data:
+                break
+            data = carry + data
+            end = data.rfind(b'\n')
+            if end < 0:
+                carry = data
+            else:
+                carry = data[end + 1:]
+                text = data[:end].decode('utf-8')
+                if '\r' in text:
+                    text = text.replace('\r\n', '\n')
+                convert(text.split('\n'))
+            # Una línea más larga que el bloque se convierte hasta su último límite de palabra
+            if len(carry) > chunk_size:
+                boundary = last_boundary(carry, direction)
+                if boundary is not None:
+                    run_start, run_end, gap = boundary
+                    separator = '  ' if direction == TEXT_TO_MORSE else ' ' * (gap // 2)
+                    convert([carry[:run_start].decode('utf-8')], separator)
+                    carry = carry[run_end:]
+        if carry or parts:
+            convert([carry.decode('utf-8').rstrip('\r')])
+        if as_array:
+            write('\n]\n' if records_written else ']\n')
+    except BaseException:
+        abort()
+        raise
+    close()
+    logger.info(f"Converted {lines_done} lines from stdin")
+    return lines_done
+
+def run_pipe(convert_many: Callable[[List[str]], List[str]], output_file: Optional[Path],
+             direction: str = TEXT_TO_MORSE) -> None:
+    """Runs ``stream_pipe`` and reports errors on stderr without Rich markup."""
+    try:
+        stream_pipe(convert_many, output_file, PIPE_CHUNK_SIZE, direction)
+    except (ValueError, UnicodeDecodeError) as e:
+        logger.error(f"Pipe conversion error: {str(e)}")
+        if output.is_json:
+            output.record({"error": "Error", "message": str(e)}, sys.stderr)
+        else:
+            typer.echo(f"Error: {str(e)}", err=True)
+        raise typer.Exit(1)
+    except BrokenPipeError:
+        # El lector cerró la tubería (p. ej. head): terminar sin error
+        logger.info("Output pipe closed")
+
+def conversion_metadata(source: str, result: str, elapsed: float, output_file: Optional[Path]) -> Dict[str, Any]:
+    """Campos del registro JSON de una conversión: entrada, salida, tamaños y tiempo."""
+    return {
+        "input": source,
+        "output": result,
+        "input_size": len(source.encode('utf-8')),
+        "output_size": len(result.encode('utf-8')),
+        "elapsed_ms": round(elapsed * 1000, 3),
+        "output_file": str(output_file) if output_file else None,
+    }
+
+def report_file_conversion(input_file: Path, output_file: Path, direction: str,
+                           written: int, cached: bool, start: float) -> None:
+    """Mostrar el resultado de convert-file en el formato seleccionado."""
+    suffix = ", cached" if cached else ""
+    output.result("convert-file", str(output_file), {
+        "input_file": str(input_file),
+        "output_file": str(output_file),
+        "direction": direction,
+        "input_size": input_file.stat().st_size,
+        "output_size": written,
+        "cached": cached,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+    }, [f"[blue]Output saved to:[/blue] {output_file} ({written} bytes{suffix})"])
+
 @app.callback()
-def app_callback():
+def app_callback(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Print a per-stage timing breakdown after the command"
+    ),
+    profile_output: Optional[Path] = typer.Option(
+        None,
+        "--profile-output",
+        help="Also run cProfile and dump pstats output to this file"
+    ),
+    metrics_port: Optional[int] = typer.Option(
+        None,
+        "--metrics-port",
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics while running"
+    ),
+    metrics_file: Optional[Path] = typer.Option(
+        None,
+        "--metrics-file",
+        help="Write Prometheus metrics to this file when the command finishes"
+    ),
+    table: Optional[str] = typer.Option(
+        None,
+        "--table", "-t",
+        help=f"Code table(s) to use, joined with '+' (available: {', '.join(available_tables())})"
+    ),
+    output_format: str = typer.Option(
+        FORMAT_RICH,
+        "--format",
+        help=f"Output format: {', '.join(OUTPUT_FORMATS)}. All but rich write plain data to stdout"
+    )
+):
     """Inicializar las dependencias cuando se ejecuta cualquier comando."""
-    global config, validator, converter, file_handler
-    if config is None:
+    global config, validator, converter, file_handler, output
+    try:
+        output = Output(output_format.lower())
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--format")
+    if metrics_port is not None or metrics_file is not None:
+        metrics.enable()
+        # Los callbacks se ejecutan en orden inverso: desactivar al final
+        ctx.call_on_close(metrics.disable)
+        if metrics_port is not None:
+            server = MetricsServer(port=metrics_port)
+            server.start()
+            logger.info(f"Serving metrics on {server.url}")
+            ctx.call_on_close(server.stop)
+        if metrics_file is not None:
+            ctx.call_on_close(lambda: write_prometheus(metrics_file))
+    if profile or profile_output:
+        metrics.reset()
+        metrics.enable()
+        profiler = None
+        if profile_output:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        ctx.call_on_close(lambda: print_profile_report(profiler, profile_output))
+    if not config:
         config = load_config()
     if validator is None:
         validator = get_validator()
@@ -94,12 +376,19 @@ def app_callback():
         converter = get_converter()
     if file_handler is None:
         file_handler = get_file_handler()
+    if table is not None:
+        try:
+            get_converter().set_table(table)
+            get_validator().set_table(table)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--table")
 
 @app.command()
 def text_to_morse(
-    text: str = typer.Argument(
-        ...,
-        help="Text to convert to Morse code. Supports A-Z, 0-9, and basic punctuation."
+    text: Optional[str] = typer.Argument(
+        None,
+        help="Text to convert to Morse code. Supports A-Z, 0-9, and basic punctuation. "
+             "Use '-' or omit it to stream stdin to stdout line by line."
     ),
     output_file: Optional[Path] = typer.Option(
         None,
@@ -116,6 +405,11 @@ def text_to_morse(
         "--frequency", "-f",
         help="Tone frequency in Hz (20-20000)",
         callback=validate_frequency
+    ),
+    wav_file: Optional[Path] = typer.Option(
+        None,
+        "--wav",
+        help="Save the Morse code audio as a 16-bit WAV file (rendered to disk, for long messages)"
     )
 ) -> None:
     """
@@ -123,7 +417,15 @@ def text_to_morse(
 
     The input text is converted to Morse code using standard International Morse Code.
     The result can be displayed, saved to a file, and/or played as audio.
+    Without a text argument (or with '-') stdin is converted to stdout.
     """
+    if text is None or text == STDIN_ARGUMENT:
+        if play:
+            raise typer.BadParameter("Audio playback is not available when reading stdin", param_hint="--play")
+        if wav_file:
+            raise typer.BadParameter("Audio export is not available when reading stdin", param_hint="--wav")
+        run_pipe(converter.encode_many, output_file)
+        return
     try:
         logger.info(f"Converting text to Morse: {text}")
         
@@ -131,25 +433,35 @@ def text_to_morse(
         validator.validate_text_input(text)
         
         # Convertir texto
+        start = time.perf_counter()
         morse_code = converter.text_to_morse(text)
-        
-        # Mostrar resultado
-        console.print(f"\n[green]Input Text:[/green] {text}")
-        console.print(f"[green]Morse Code:[/green] {morse_code}\n")
+        elapsed = time.perf_counter() - start
         
         # Guardar en archivo si se especifica
         if output_file:
             file_handler.write_file(str(output_file), morse_code)
-            console.print(f"[blue]Output saved to:[/blue] {output_file}")
+        
+        # Guardar el audio directamente en disco
+        if wav_file:
+            AudioGenerator(
+                frequency=frequency,
+                volume=config.get('audio', {}).get('volume', 0.5)
+            ).render_to_file(morse_code, wav_file)
+
+        # Mostrar resultado
+        lines = [f"\n[green]Input Text:[/green] {text}", f"[green]Morse Code:[/green] {morse_code}\n"]
+        if output_file:
+            lines.append(f"[blue]Output saved to:[/blue] {output_file}")
+        if wav_file:
+            lines.append(f"[blue]Audio saved to:[/blue] {wav_file}")
+        metadata = conversion_metadata(text, morse_code, elapsed, output_file)
+        if wav_file:
+            metadata["wav"] = str(wav_file)
+        output.result("text-to-morse", morse_code, metadata, lines)
         
         # Reproducir audio si se solicita
         if play:
-            with Progress() as progress:
-                task = progress.add_task(
-                    "[cyan]Playing audio...[/cyan]",
-                    total=100
-                )
-                
+            with output.progress("[cyan]Playing audio...[/cyan]"):
                 generator = AudioGenerator(
                     frequency=frequency,
                     volume=config.get('audio', {}).get('volume', 0.5)
@@ -158,23 +470,22 @@ def text_to_morse(
                 
                 audio_data = generator.generate_audio(morse_code)
                 player.play_audio()
-                
-                progress.update(task, completed=100)
             
     except ValidationError as e:
-        console.print(f"[red]Validation Error:[/red] {str(e)}")
+        output.error("Validation Error", str(e))
         logger.error(f"Validation error: {str(e)}")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]Error:[/red] {str(e)}")
+        output.error("Error", str(e))
         logger.error(f"Unexpected error: {str(e)}")
         raise typer.Exit(1)
 
 @app.command()
 def morse_to_text(
-    morse: str = typer.Argument(
-        ...,
-        help="Morse code to convert to text. Use dots (.) and dashes (-) separated by spaces."
+    morse: Optional[str] = typer.Argument(
+        None,
+        help="Morse code to convert to text. Use dots (.) and dashes (-) separated by spaces. "
+             "Use '-' or omit it to stream stdin to stdout line by line."
     ),
     output_file: Optional[Path] = typer.Option(
         None,
@@ -187,7 +498,11 @@ def morse_to_text(
 
     The input should be valid Morse code using dots (.) and dashes (-),
     with spaces between letters and double spaces between words.
+    Without a Morse argument (or with '-') stdin is converted to stdout.
     """
+    if morse is None or morse == STDIN_ARGUMENT:
+        run_pipe(converter.decode_many, output_file, MORSE_TO_TEXT)
+        return
     try:
         logger.info(f"Converting Morse to text: {morse}")
         
@@ -195,23 +510,26 @@ def morse_to_text(
         validator.validate_morse_input(morse)
         
         # Convertir código Morse
+        start = time.perf_counter()
         text = converter.morse_to_text(morse)
-        
-        # Mostrar resultado
-        console.print(f"\n[green]Input Morse:[/green] {morse}")
-        console.print(f"[green]Text:[/green] {text}\n")
+        elapsed = time.perf_counter() - start
         
         # Guardar en archivo si se especifica
         if output_file:
             file_handler.write_file(str(output_file), text)
-            console.print(f"[blue]Output saved to:[/blue] {output_file}")
+        
+        # Mostrar resultado
+        lines = [f"\n[green]Input Morse:[/green] {morse}", f"[green]Text:[/green] {text}\n"]
+        if output_file:
+            lines.append(f"[blue]Output saved to:[/blue] {output_file}")
+        output.result("morse-to-text", text, conversion_metadata(morse, text, elapsed, output_file), lines)
             
     except ValidationError as e:
-        console.print(f"[red]Validation Error:[/red] {str(e)}")
+        output.error("Validation Error", str(e))
         logger.error(f"Validation error: {str(e)}")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]Error:[/red] {str(e)}")
+        output.error("Error", str(e))
         logger.error(f"Unexpected error: {str(e)}")
         raise typer.Exit(1)
 
@@ -241,12 +559,8 @@ def play_morse(
         validator.validate_morse_input(morse)
         
         # Configurar y reproducir audio
-        with Progress() as progress:
-            task = progress.add_task(
-                "[cyan]Playing audio...[/cyan]",
-                total=100
-            )
-            
+        start = time.perf_counter()
+        with output.progress("[cyan]Playing audio...[/cyan]"):
             generator = AudioGenerator(
                 frequency=frequency,
                 volume=config.get('audio', {}).get('volume', 0.5)
@@ -255,18 +569,408 @@ def play_morse(
             
             audio_data = generator.generate_audio(morse)
             player.play_audio()
-            
-            progress.update(task, completed=100)
+        output.result("play-morse", None, {
+            "input": morse,
+            "frequency": frequency,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }, [])
             
     except ValidationError as e:
-        console.print(f"[red]Validation Error:[/red] {str(e)}")
+        output.error("Validation Error", str(e))
         logger.error(f"Validation error: {str(e)}")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]Error:[/red] {str(e)}")
+        output.error("Error", str(e))
         logger.error(f"Unexpected error: {str(e)}")
         raise typer.Exit(1)
 
+@app.command()
+def convert_file(
+    input_file: Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="File to convert"
+    ),
+    output_file: Path = typer.Argument(
+        ...,
+        help="Where to write the converted file"
+    ),
+    to_text: bool = typer.Option(
+        False,
+        "--to-text",
+        help="Convert Morse code to text instead of text to Morse code"
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers", "-w",
+        min=1,
+        help="Number of worker processes (default: CPU count)"
+    ),
+    chunk_size: int = typer.Option(
+        DEFAULT_CHUNK_SIZE // (1024 * 1024),
+        "--chunk-size",
+        min=1,
+        help="Chunk size in MiB"
+    ),
+    use_cache: Optional[bool] = typer.Option(
+        None,
+        "--cache/--no-cache",
+        help="Reuse the result of a previous run on the same input (default: from config)"
+    )
+) -> None:
+    """
+    Convert a large file in parallel.
+
+    The file is split at word boundaries and the chunks are converted across
+    a pool of processes. Line breaks are treated as word separators.
+    """
+    try:
+        start = time.perf_counter()
+        direction = MORSE_TO_TEXT if to_text else TEXT_TO_MORSE
+        logger.info(f"Converting file {input_file} ({direction})")
+        table = '+'.join(get_converter().table.names)
+        if use_cache is None:
+            use_cache = config.get('cache', {}).get('enabled', False)
+
+        cache = None
+        if use_cache:
+            try:
+                cache = ConversionCache.from_config(config)
+            except CacheError as e:
+                # Sin caché la conversión sigue siendo válida
+                logger.warning(f"Converting without cache: {str(e)}")
+        try:
+            if cache is not None:
+                # La clave depende del contenido, la dirección y la tabla de códigos;
+                # se guarda el texto convertido y la salida se comprime al escribirla
+                key = file_key(direction, input_file, table=table_fingerprint(get_converter().table))
+                cached = cache.get(key)
+                if cached is not None:
+                    with get_file_handler().open_writer(str(output_file), atomic=True) as writer:
+                        writer.write(cached.decode('utf-8'))
+                    report_file_conversion(input_file, output_file, direction, len(cached), True, start)
+                    return
+
+            parallel = ParallelConverter(workers=workers, chunk_size=chunk_size * 1024 * 1024, table=table)
+            written = parallel.convert_file(str(input_file), str(output_file), direction)
+            # Una salida mayor que la caché no se lee a memoria para nada
+            if cache is not None and written <= cache.max_size:
+                cache.put(key, get_file_handler().read_file(str(output_file)).encode('utf-8'), direction)
+        finally:
+            if cache is not None:
+                cache.close()
+        report_file_conversion(input_file, output_file, direction, written, False, start)
+
+    except Exception as e:
+        output.error("Error", str(e))
+        logger.error(f"Unexpected error: {str(e)}")
+        raise typer.Exit(1)
+
+@app.command()
+def watch(
+    input_dir: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        help="Spool directory to watch for new files"
+    ),
+    output_dir: Path = typer.Argument(
+        ...,
+        file_okay=False,
+        help="Directory where converted files are written"
+    ),
+    to_text: bool = typer.Option(
+        False,
+        "--to-text",
+        help="Convert Morse code to text instead of text to Morse code"
+    ),
+    workers: int = typer.Option(
+        2,
+        "--workers", "-w",
+        min=1,
+        help="Number of files converted at the same time"
+    ),
+    pattern: str = typer.Option(
+        "*",
+        "--pattern",
+        help="Only convert file names matching this glob pattern"
+    ),
+    interval: float = typer.Option(
+        DEFAULT_POLL_INTERVAL,
+        "--interval",
+        min=0.05,
+        help="Seconds between directory scans"
+    ),
+    state_file: Optional[Path] = typer.Option(
+        None,
+        "--state",
+        help="File recording the processed files (default: .morse-watch.sqlite3 in the output directory)"
+    ),
+    once: bool = typer.Option(
+        False,
+        "--once",
+        help="Convert the files present now and exit (for cron jobs)"
+    )
+) -> None:
+    """
+    Convert files as they are dropped into a directory.
+
+    New or changed files are converted on a pool of workers once they stop
+    growing, and outputs are replaced atomically. Processed files are
+    recorded so a restarted watcher does not convert them again. Progress
+    is logged and exposed through the metrics options. With --format json
+    every file is reported as one compact JSON object per line, as in ndjson.
+    """
+    direction = MORSE_TO_TEXT if to_text else TEXT_TO_MORSE
+
+    def report(result: WatchResult) -> None:
+        metadata = {
+            "input": str(result.input_path),
+            "output": str(result.output_path),
+            "status": result.status,
+            "input_bytes": result.size,
+            "output_bytes": result.written,
+            "elapsed_ms": round(result.elapsed * 1000, 3),
+        }
+        if result.error:
+            metadata["error"] = result.error
+            output.error("Error", f"{result.input_path}: {result.error}")
+            if not output.is_json:
+                return
+        output.result("watch", str(result.output_path), metadata,
+                      [f"[green]Converted[/green] {result.input_path.name} -> {result.output_path} "
+                       f"[dim]({result.elapsed * 1000:.1f} ms)[/dim]"])
+
+    try:
+        table = '+'.join(get_converter().table.names)
+        watcher = DirectoryWatcher(input_dir, output_dir, direction, workers=workers, pattern=pattern,
+                                   poll_interval=interval, state_path=state_file, table=table,
+                                   on_result=report)
+    except ValueError as e:
+        output.error("Error", str(e))
+        raise typer.Exit(1)
+
+    # El vigilante no termina: en json se escribe un registro compacto por línea
+    with watcher, output.streaming():
+        if once:
+            results = watcher.run_once()
+            if any(result.status != WATCH_DONE for result in results):
+                raise typer.Exit(1)
+            return
+        output.print(f"[cyan]Watching[/cyan] {input_dir} -> {output_dir} (Ctrl-C to stop)")
+        watcher.run()
+
+@app.command()
+def batch(
+    input_files: List[Path] = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="Files to convert"
+    ),
+    output_dir: Path = typer.Option(
+        ...,
+        "--output-dir", "-o",
+        file_okay=False,
+        help="Directory where converted files are written"
+    ),
+    to_text: bool = typer.Option(
+        False,
+        "--to-text",
+        help="Convert Morse code to text instead of text to Morse code"
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip the work recorded as finished in the manifest of a previous run"
+    ),
+    manifest_file: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        help="Job manifest (default: .morse-batch.json in the output directory)"
+    ),
+    chunk_size: int = typer.Option(
+        DEFAULT_CHUNK_SIZE // (1024 * 1024),
+        "--chunk-size",
+        min=1,
+        help="Chunk size in MiB; progress is recorded after every chunk"
+    )
+) -> None:
+    """
+    Convert a list of files as a resumable job.
+
+    Progress is recorded per file and per chunk in a manifest. SIGTERM or
+    Ctrl-C stops the job after the current chunk and saves the manifest;
+    run the same command with --resume to continue where it stopped.
+    """
+    direction = MORSE_TO_TEXT if to_text else TEXT_TO_MORSE
+
+    def report(result: BatchResult) -> None:
+        metadata = {
+            "input": str(result.input_path),
+            "output": str(result.output_path),
+            "status": result.status,
+            "output_bytes": result.written,
+        }
+        if result.error:
+            metadata["error"] = result.error
+            output.error("Error", f"{result.input_path}: {result.error}")
+            if not output.is_json:
+                return
+        finished = result.status in (BATCH_DONE, BATCH_SKIPPED)
+        color = {BATCH_DONE: "green", BATCH_SKIPPED: "blue"}.get(result.status, "yellow")
+        output.result("batch", str(result.output_path) if finished else None, metadata,
+                      [f"[{color}]{result.status.capitalize()}[/{color}] {result.input_path} -> {result.output_path}"])
+
+    try:
+        table = '+'.join(get_converter().table.names)
+        job = BatchJob(input_files, output_dir, direction, manifest_path=manifest_file, resume=resume,
+                       chunk_size=chunk_size * 1024 * 1024, table=table, on_result=report)
+    except ValueError as e:
+        output.error("Error", str(e))
+        raise typer.Exit(1)
+
+    # Terminar tras el fragmento actual en lugar de salir a mitad de escritura
+    handlers = {signum: signal.signal(signum, lambda signum, frame: job.request_stop(signum))
+                for signum in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        with output.collect() as records:
+            results = job.run()
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    # En formato json los resultados de todos los archivos forman un único array
+    if output.format == FORMAT_JSON:
+        output.record(records)
+
+    if job.stopped:
+        output.error("Interrupted", f"Progress saved to {job.manifest.path}; run again with --resume to continue")
+        raise typer.Exit(128 + (job.signal or signal.SIGTERM))
+    if any(result.status == BATCH_FAILED for result in results):
+        raise typer.Exit(1)
+
+@app.command("render-batch")
+def render_batch(
+    messages: Optional[List[str]] = typer.Argument(
+        None,
+        help="Messages to render, one WAV file each"
+    ),
+    input_file: Optional[Path] = typer.Option(
+        None,
+        "--input", "-i",
+        exists=True,
+        dir_okay=False,
+        help="File with one message per line (empty lines are skipped)"
+    ),
+    output_dir: Path = typer.Option(
+        ...,
+        "--output-dir", "-o",
+        file_okay=False,
+        help="Directory where the WAV files are written"
+    ),
+    morse: bool = typer.Option(
+        False,
+        "--morse",
+        help="The messages are already Morse code"
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers", "-w",
+        min=1,
+        help="Number of worker processes (default: CPU count)"
+    ),
+    frequency: int = typer.Option(
+        800,
+        "--frequency", "-f",
+        help="Tone frequency in Hz (20-20000)",
+        callback=validate_frequency
+    ),
+    wpm: Optional[float] = typer.Option(
+        None,
+        "--wpm",
+        min=1,
+        help="Speed in words per minute (PARIS timing)"
+    ),
+    prefix: str = typer.Option(
+        "clip",
+        "--prefix",
+        help="File name prefix; clips are named PREFIX-00001.wav, PREFIX-00002.wav, ..."
+    )
+) -> None:
+    """
+    Render many short messages to WAV files in one run.
+
+    Messages are rendered on a pool of processes that share a precomputed
+    carrier template, which is far cheaper than one process per clip.
+    Every clip reports its render time, followed by a summary.
+    """
+    if not messages and input_file is None:
+        raise typer.BadParameter("Give messages or --input FILE", param_hint="MESSAGES")
+
+    def report(result: RenderResult) -> None:
+        metadata = {
+            "index": result.index,
+            "output": str(result.output_path),
+            "samples": result.samples,
+            "duration_s": round(result.duration, 3),
+            "elapsed_ms": round(result.elapsed * 1000, 3),
+        }
+        if result.error:
+            metadata["error"] = result.error
+            output.error("Error", f"Clip {result.index}: {result.error}")
+            if not output.is_json:
+                return
+        output.result("render-batch", str(result.output_path) if not result.error else None, metadata,
+                      [f"[green]Rendered[/green] {result.output_path.name} "
+                       f"[dim]({result.duration:.1f} s of audio, {result.elapsed * 1000:.1f} ms)[/dim]"])
+
+    try:
+        renderer = BatchRenderer(
+            output_dir, workers=workers, frequency=frequency,
+            volume=config.get('audio', {}).get('volume', 0.5), wpm=wpm, morse=morse,
+            table='+'.join(get_converter().table.names), prefix=prefix, on_result=report
+        )
+        with output.collect() as clips:
+            results = renderer.render(list(messages or []) + (read_messages(input_file) if input_file else []))
+    except (OSError, ValueError) as e:
+        output.error("Error", str(e))
+        raise typer.Exit(1)
+
+    summary = BatchRenderer.summary(results)
+    # En formato json los clips y el resumen forman un único objeto
+    if output.format == FORMAT_JSON:
+        output.record({"clips": clips, "summary": summary})
+    else:
+        output.result("render-batch", None, {"summary": summary},
+                      [f"\n[cyan]{summary['clips'] - summary['failed']}/{summary['clips']} clips[/cyan] "
+                       f"({summary['audio_seconds']:.1f} s of audio) - per clip: mean {summary['mean_ms']:.1f} ms, "
+                       f"p95 {summary['p95_ms']:.1f} ms, max {summary['max_ms']:.1f} ms"])
+    if summary["failed"]:
+        raise typer.Exit(1)
+
+@app.command()
+def repl() -> None:
+    """
+    Start an interactive session for many short conversions.
+
+    The converter, validator and audio generator stay loaded between commands,
+    so each one only pays for its own work; every result shows its latency.
+    Audio settings edited in config.json are picked up without restarting.
+    Type 'help' for the available commands.
+    """
+    generator = AudioGenerator(
+        frequency=config.get('audio', {}).get('frequency', 800),
+        volume=config.get('audio', {}).get('volume', 0.5)
+    )
+    service = watch_config(True)
+    try:
+        session = Repl(converter, validator, generator, AudioPlayer(generator), output, config_service=service)
+        output.print("[green]Morse REPL[/green] - type 'help' for commands, 'quit' to leave")
+        session.run(prompt_lines(output))
+    finally:
+        watch_config(False)
+
 def main():
     """Entry point for the command-line interface."""
     global config, validator, converter, file_handler
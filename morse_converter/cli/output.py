@@ -0,0 +1,199 @@
+import json
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Union
+
+# Formatos de salida del CLI
+FORMAT_RICH = "rich"
+FORMAT_PLAIN = "plain"
+FORMAT_JSON = "json"
+FORMAT_NDJSON = "ndjson"
+OUTPUT_FORMATS = (FORMAT_RICH, FORMAT_PLAIN, FORMAT_JSON, FORMAT_NDJSON)
+
+class Output:
+    """
+    Writes CLI results in the selected output format.
+
+    ``rich`` is the interactive format with markup, tables and progress bars.
+    ``plain`` writes only the result text, ``json`` one indented document and
+    ``ndjson`` one compact JSON object per line. The machine-readable formats
+    write straight to the ``sys.stdout`` buffer and never import Rich.
+
+    Methods:
+        print(markup: str) -> None
+            Shows an informational message (rich format only).
+        result(command: str, text: str, metadata: dict, lines: List[str]) -> None
+            Writes the result of a command.
+        record(data: dict) -> None
+            Writes one JSON object.
+        collect()
+            Context manager gathering the results of a command (json format only).
+        streaming()
+            Context manager writing one compact record per line for long-running commands.
+        error(kind: str, message: str) -> None
+            Reports an error on stderr (or with markup in rich format).
+        table(title: str, columns: Sequence[str], rows: List[Sequence[str]]) -> None
+            Writes tabular data.
+        progress(description: str)
+            Context manager showing a progress bar (rich format only).
+    """
+
+    def __init__(self, output_format: str = FORMAT_RICH):
+        """
+        Initialize the Output.
+
+        Parameters:
+            output_format (str): One of "rich", "plain", "json", "ndjson" (default: "rich")
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}'. Use one of: {', '.join(OUTPUT_FORMATS)}")
+        self.format = output_format
+        self._console = None
+        # Registros reunidos por collect() en formato json
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def is_rich(self) -> bool:
+        """True for the interactive Rich format."""
+        return self.format == FORMAT_RICH
+
+    @property
+    def is_json(self) -> bool:
+        """True for the json and ndjson formats."""
+        return self.format in (FORMAT_JSON, FORMAT_NDJSON)
+
+    @property
+    def console(self):
+        """The Rich console, imported on first use."""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
+
+    @staticmethod
+    def write(text: str, stream: Optional[TextIO] = None) -> None:
+        """Writes text to the binary buffer of stdout (or ``stream``) and flushes it."""
+        stream = stream or sys.stdout
+        buffer = getattr(stream, 'buffer', None)
+        if buffer is None:
+            stream.write(text)
+        else:
+            stream.flush()
+            buffer.write(text.encode('utf-8'))
+            buffer.flush()
+
+    def dumps(self, data: Union[Dict[str, Any], List[Any]]) -> str:
+        """Serializes one JSON value in the selected format."""
+        if self.format == FORMAT_JSON:
+            return json.dumps(data, ensure_ascii=False, indent=2)
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+    def record(self, data: Union[Dict[str, Any], List[Any]], stream: Optional[TextIO] = None) -> None:
+        """Writes one JSON value followed by a newline."""
+        self.write(self.dumps(data) + '\n', stream)
+
+    def print(self, markup: str) -> None:
+        """Shows an informational message; ignored outside the rich format."""
+        if self.is_rich:
+            self.console.print(markup)
+
+    def result(self, command: str, text: Optional[str], metadata: Dict[str, Any], lines: List[str]) -> None:
+        """
+        Writes the result of a command.
+
+        Parameters:
+            command (str): Name of the command.
+            text (str, optional): The result written in plain format.
+            metadata (dict): Fields of the JSON record (timings, sizes, paths).
+            lines (List[str]): Markup lines shown in rich format.
+        """
+        if self.is_rich:
+            for line in lines:
+                self.console.print(line)
+        elif self.format == FORMAT_PLAIN:
+            if text is not None:
+                self.write(text + '\n')
+        elif self._records is not None:
+            self._records.append({"command": command, **metadata})
+        else:
+            self.record({"command": command, **metadata})
+
+    def error(self, kind: str, message: str) -> None:
+        """Reports an error, e.g. ``error("Validation Error", "...")``."""
+        if self.is_rich:
+            self.console.print(f"[red]{kind}:[/red] {message}")
+        elif self.format == FORMAT_PLAIN:
+            self.write(f"{kind}: {message}\n", sys.stderr)
+        else:
+            self.record({"error": kind, "message": message}, sys.stderr)
+
+    def table(self, title: str, columns: Sequence[str], rows: List[Sequence[str]]) -> None:
+        """
+        Writes tabular data: a Rich table, tab-separated lines or JSON objects.
+
+        Outside the rich format tables go to stderr so they do not mix with
+        the command result.
+        """
+        if self.is_rich:
+            from rich.table import Table
+            table = Table(title=title)
+            for i, column in enumerate(columns):
+                table.add_column(column, justify="left" if i == 0 else "right")
+            for row in rows:
+                table.add_row(*row)
+            self.console.print(table)
+        elif self.format == FORMAT_PLAIN:
+            lines = ['\t'.join(columns)] + ['\t'.join(row) for row in rows]
+            self.write('\n'.join(lines) + '\n', sys.stderr)
+        else:
+            self.record({title.lower(): [dict(zip(columns, row)) for row in rows]}, sys.stderr)
+
+    @contextmanager
+    def collect(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Gathers the records of ``result`` instead of writing them (json format).
+
+        A command reporting one result per item writes them as a single JSON
+        document when it finishes, e.g. ``output.record(records)``. In every
+        other format results are written as they arrive and the list stays
+        empty.
+        """
+        if self.format != FORMAT_JSON:
+            yield []
+            return
+        self._records = []
+        try:
+            yield self._records
+        finally:
+            self._records = None
+
+    @contextmanager
+    def streaming(self) -> Iterator[None]:
+        """
+        Writes one compact record per line, as in ndjson, inside the block.
+
+        A command that runs until it is stopped can never close a JSON
+        document, so the json format falls back to one record per line.
+        """
+        previous = self.format
+        if previous == FORMAT_JSON:
+            self.format = FORMAT_NDJSON
+        try:
+            yield
+        finally:
+            self.format = previous
+
+    @contextmanager
+    def progress(self, description: str) -> Iterator[None]:
+        """Shows a progress bar around a task in the rich format."""
+        if not self.is_rich:
+            yield
+            return
+        from rich.progress import Progress
+        with Progress(console=self.console) as progress:
+            task = progress.add_task(description, total=100)
+            yield
+            progress.update(task, completed=100)
@@ -0,0 +1,227 @@
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from morse_converter.cli.output import Output
+from morse_converter.config import Config, ConfigService
+from morse_converter.core.validator import ValidationError
+from morse_converter.utils import setup_logger
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+PROMPT = "morse> "
+
+# Comandos que terminan la sesión
+EXIT_COMMANDS = ("quit", "exit")
+
+HELP_ROWS = [
+    ("encode TEXT", "Convert text to Morse code"),
+    ("decode MORSE", "Convert Morse code to text"),
+    ("play [MORSE]", "Play Morse code (default: the last encoded result)"),
+    ("set-wpm N", "Set the playback speed in words per minute"),
+    ("set-frequency HZ", "Set the tone frequency (20-20000 Hz)"),
+    ("status", "Show the current audio settings"),
+    ("help", "Show this help"),
+    ("quit", "Leave the REPL (also exit or Ctrl-D)"),
+]
+
+# Sintaxis de cada comando, p. ej. "encode TEXT"
+USAGE = {usage.split(' ')[0]: usage for usage, _ in HELP_ROWS}
+
+class ReplError(Exception):
+    """Invalid command or argument typed in the REPL."""
+    pass
+
+class Repl:
+    """
+    Interactive session that keeps the conversion state warm between commands.
+
+    The converter, validator, audio generator (with its envelope caches) and
+    player are created once, so every command only pays for its own work.
+    Each result reports its latency. When a ConfigService is given, audio
+    settings changed in ``config.json`` are applied before the next command.
+
+    Methods:
+        execute(line: str) -> bool
+            Runs one command; returns False when the session should end.
+        run(lines: Iterable[str]) -> None
+            Runs commands until the input ends or the user quits.
+    """
+
+    def __init__(
+        self,
+        converter: Any,
+        validator: Any,
+        generator: Any,
+        player: Any,
+        output: Output,
+        config_service: Optional[ConfigService] = None
+    ):
+        """
+        Initialize the Repl.
+
+        Parameters:
+            converter (MorseConverter): Converter used by encode and decode.
+            validator (InputValidator): Validator applied to every input.
+            generator (AudioGenerator): Generator reused by play.
+            player (AudioPlayer): Player for the generator.
+            output (Output): Where results and errors are written.
+            config_service (ConfigService, optional): Source of audio settings to follow.
+        """
+        self.converter = converter
+        self.validator = validator
+        self.generator = generator
+        self.player = player
+        self.output = output
+        self.config_service = config_service
+        self.wpm: Optional[float] = None
+        self.last_morse: Optional[str] = None
+        self._config: Optional[Config] = None
+        self._commands: Dict[str, Callable[[str], Tuple[Optional[str], Dict[str, Any], str]]] = {
+            "encode": self._encode,
+            "decode": self._decode,
+            "play": self._play,
+            "set-wpm": self._set_wpm,
+            "set-frequency": self._set_frequency,
+            "status": self._status,
+        }
+        self._refresh_config()
+
+    def _refresh_config(self) -> None:
+        """Applies the audio settings on start and whenever the configuration is reloaded."""
+        if self.config_service is None:
+            return
+        try:
+            config = self.config_service.get()
+        except ValueError as e:
+            logger.warning(f"Configuration unavailable: {e}")
+            return
+        if config is self._config:
+            return
+        logger.info("Applying audio configuration")
+        self.generator.set_frequency(config.audio.frequency)
+        self.generator.set_wpm(config.audio.wpm)
+        self.generator.volume = config.audio.volume
+        self.wpm = config.audio.wpm
+        self._config = config
+
+    def _encode(self, argument: str) -> Tuple[Optional[str], Dict[str, Any], str]:
+        self.validator.validate_text_input(argument)
+        morse = self.converter.text_to_morse(argument)
+        self.last_morse = morse
+        return morse, {"input": argument, "output": morse}, f"[green]Morse Code:[/green] {morse}"
+
+    def _decode(self, argument: str) -> Tuple[Optional[str], Dict[str, Any], str]:
+        self.validator.validate_morse_input(argument)
+        text = self.converter.morse_to_text(argument)
+        return text, {"input": argument, "output": text}, f"[green]Text:[/green] {text}"
+
+    def _play(self, argument: str) -> Tuple[Optional[str], Dict[str, Any], str]:
+        morse = argument or self.last_morse
+        if not morse:
+            raise ReplError("Nothing to play: give Morse code or encode some text first")
+        self.validator.validate_morse_input(morse)
+        self.generator.generate_audio(morse)
+        self.player.play_audio()
+        return None, {"input": morse}, f"[cyan]Played:[/cyan] {morse}"
+
+    @staticmethod
+    def _number(argument: str, name: str) -> float:
+        try:
+            return float(argument)
+        except ValueError:
+            raise ReplError(f"{name} must be a number, got '{argument}'")
+
+    def _set_wpm(self, argument: str) -> Tuple[Optional[str], Dict[str, Any], str]:
+        wpm = self._number(argument, "Speed")
+        if not 5 <= wpm <= 60:
+            raise ReplError("Speed must be between 5 and 60 WPM")
+        self.generator.set_wpm(wpm)
+        self.wpm = wpm
+        return None, {"wpm": wpm}, f"[blue]Speed set to[/blue] {wpm:g} WPM"
+
+    def _set_frequency(self, argument: str) -> Tuple[Optional[str], Dict[str, Any], str]:
+        frequency = self._number(argument, "Frequency")
+        if not 20 <= frequency <= 20000:
+            raise ReplError("Frequency must be between 20 and 20000 Hz")
+        self.generator.set_frequency(frequency)
+        return None, {"frequency": frequency}, f"[blue]Frequency set to[/blue] {frequency:g} Hz"
+
+    def _status(self, argument: str) -> Tuple[Optional[str], Dict[str, Any], str]:
+        settings = {
+            "frequency": self.generator.frequency,
+            "wpm": self.wpm,
+            "volume": self.generator.volume,
+        }
+        wpm = "default" if self.wpm is None else f"{self.wpm:g}"
+        return None, settings, (f"[blue]Frequency:[/blue] {self.generator.frequency:g} Hz  "
+                                f"[blue]Speed:[/blue] {wpm} WPM  [blue]Volume:[/blue] {self.generator.volume:g}")
+
+    def help(self) -> None:
+        """Shows the available commands."""
+        self.output.table("Commands", ["Command", "Description"], HELP_ROWS)
+
+    def execute(self, line: str) -> bool:
+        """
+        Runs one command line.
+
+        Parameters:
+            line (str): The command and its argument, e.g. ``encode SOS``.
+
+        Returns:
+            bool: False if the command ends the session, True otherwise.
+        """
+        name, _, argument = line.strip().partition(' ')
+        name, argument = name.lower(), argument.strip()
+        if not name:
+            return True
+        if name in EXIT_COMMANDS:
+            return False
+        if name == "help":
+            self.help()
+            return True
+        command = self._commands.get(name)
+        if command is None:
+            self.output.error("Unknown Command", f"'{name}'. Type 'help' for the list of commands")
+            return True
+        usage = USAGE[name]
+        if not argument and not usage.endswith(']') and ' ' in usage:
+            self.output.error("Missing Argument", f"Usage: {usage}")
+            return True
+
+        self._refresh_config()
+        start = time.perf_counter()
+        try:
+            text, metadata, markup = command(argument)
+        except (ValidationError, ReplError) as e:
+            self.output.error("Validation Error", str(e))
+            return True
+        except Exception as e:
+            logger.error(f"REPL command '{name}' failed: {e}")
+            self.output.error("Error", str(e))
+            return True
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+        self.output.result(name, text, {**metadata, "elapsed_ms": elapsed_ms},
+                           [f"{markup} [dim]({elapsed_ms:.2f} ms)[/dim]"])
+        return True
+
+    def run(self, lines: Iterable[str]) -> None:
+        """
+        Runs commands until the input ends or a quit command is read.
+
+        Parameters:
+            lines (Iterable[str]): The command lines, e.g. ``sys.stdin``.
+        """
+        logger.info("Starting REPL session")
+        for line in lines:
+            if not self.execute(line):
+                break
+        logger.info("REPL session finished")
+
+def prompt_lines(output: Output) -> Iterable[str]:
+    """Reads lines from the terminal, showing the prompt in rich format."""
+    while True:
+        try:
+            yield input(PROMPT if output.is_rich else "")
+        except (EOFError, KeyboardInterrupt):
+            output.print("")
+            return
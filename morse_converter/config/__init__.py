@@ -4,18 +4,28 @@
 Configuration Package for Morse Code Converter.
 
 Este módulo maneja la carga y validación de la configuración del proyecto
-desde el archivo config.json.
+desde el archivo config.json. Todos los módulos obtienen la configuración
+del mismo ConfigService, que la valida una sola vez, aplica las variables
+de entorno ``MORSE_<SECCION>__<CAMPO>`` y, si se activa la vigilancia,
+la recarga cuando cambia la fecha de modificación del archivo.
 
 Example:
     >>> from morse_converter.config import load_config, get_config
     >>> config = load_config()
     >>> audio_freq = config['audio']['frequency']
+
+    $ MORSE_AUDIO__FREQUENCY=700 morse-converter play-morse "..."
 """
 
+import copy
 import json
+import logging
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+from pydantic import BaseModel, Field, ValidationError
 
 # Configuración por defecto
 DEFAULT_CONFIG = {
@@ -27,9 +37,25 @@ DEFAULT_CONFIG = {
     "system": {
         "log_level": "INFO",
         "max_log_size": "10MB"
+    },
+    "cache": {
+        "enabled": False,
+        "directory": "~/.cache/morse_converter",
+        "max_size": "256MB"
     }
 }
 
+# Variables de entorno: MORSE_CONFIG cambia el archivo y
+# MORSE_<SECCION>__<CAMPO> sobrescribe un valor
+CONFIG_PATH_ENV = "MORSE_CONFIG"
+ENV_PREFIX = "MORSE_"
+ENV_SEPARATOR = "__"
+
+# Intervalo mínimo entre comprobaciones de la fecha de modificación
+DEFAULT_CHECK_INTERVAL = 1.0  # segundos
+
+logger = logging.getLogger(__name__)
+
 class AudioConfig(BaseModel):
     """Modelo de configuración para audio."""
     frequency: int = Field(default=800, ge=20, le=20000)
@@ -41,22 +67,266 @@ class SystemConfig(BaseModel):
     log_level: str = Field(default="INFO")
     max_log_size: str = Field(default="10MB")
 
+class CacheConfig(BaseModel):
+    """Modelo de configuración de la caché de conversiones."""
+    enabled: bool = Field(default=False)
+    directory: str = Field(default="~/.cache/morse_converter")
+    max_size: str = Field(default="256MB")
+
 class Config(BaseModel):
     """Modelo principal de configuración."""
     audio: AudioConfig
     system: SystemConfig
-
-# Variable global para almacenar la configuración
-_config: Optional[Dict[str, Any]] = None
+    cache: CacheConfig = Field(default_factory=CacheConfig)
 
 def get_config_path() -> Path:
     """
     Obtiene la ruta al archivo de configuración.
 
     Returns:
-        Path: Ruta al archivo config.json
+        Path: Ruta al archivo config.json, o la indicada en MORSE_CONFIG
     """
-    return Path(__file__).parent / "config.json"
+    override = os.environ.get(CONFIG_PATH_ENV)
+    return Path(override) if override else Path(__file__).parent / "config.json"
+
+def env_overrides(environ: Mapping[str, str]) -> Dict[str, Dict[str, str]]:
+    """
+    Extrae los valores de configuración de las variables de entorno.
+
+    ``MORSE_AUDIO__FREQUENCY=700`` se convierte en ``{"audio": {"frequency": "700"}}``;
+    Pydantic convierte después cada valor al tipo del campo. Las secciones o
+    campos desconocidos se ignoran.
+
+    Args:
+        environ (Mapping[str, str]): Variables de entorno
+
+    Returns:
+        Dict[str, Dict[str, str]]: Valores por sección
+    """
+    overrides: Dict[str, Dict[str, str]] = {}
+    for name, value in environ.items():
+        if not name.startswith(ENV_PREFIX) or ENV_SEPARATOR not in name:
+            continue
+        section, _, field = name[len(ENV_PREFIX):].lower().partition(ENV_SEPARATOR)
+        model = Config.model_fields.get(section)
+        if model is None or field not in model.annotation.model_fields:
+            logger.debug(f"Ignoring unknown configuration variable {name}")
+            continue
+        overrides.setdefault(section, {})[field] = value
+    return overrides
+
+class ConfigService:
+    """
+    Carga, valida y guarda en caché la configuración.
+
+    El archivo se lee y valida una sola vez. Con ``watch`` activado, cada
+    consulta comprueba (como mucho una vez por intervalo) la fecha de
+    modificación del archivo y lo recarga si ha cambiado; si el nuevo
+    contenido no es válido se conserva la configuración anterior.
+
+    Methods:
+        get() -> Config
+            Devuelve la configuración validada.
+        as_dict() -> Dict[str, Any]
+            Devuelve la configuración como diccionario.
+        reload() -> bool
+            Vuelve a leer el archivo.
+        update(new_config: Dict[str, Any]) -> Config
+            Valida y guarda una nueva configuración.
+        subscribe(callback: Callable[[Config], None]) -> None
+            Registra una función que se llama tras cada recarga.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        environ: Optional[Mapping[str, str]] = None,
+        watch: bool = False,
+        check_interval: float = DEFAULT_CHECK_INTERVAL
+    ):
+        """
+        Inicializa el servicio sin leer todavía el archivo.
+
+        Args:
+            path (Path, optional): Archivo de configuración (por defecto get_config_path())
+            environ (Mapping[str, str], optional): Variables de entorno (por defecto os.environ)
+            watch (bool): Recargar el archivo cuando cambie (por defecto False)
+            check_interval (float): Segundos entre comprobaciones (por defecto 1.0)
+        """
+        self.path = Path(path) if path is not None else get_config_path()
+        self.environ = os.environ if environ is None else environ
+        self.watch = watch
+        self.check_interval = check_interval
+        self._config: Optional[Config] = None
+        self._dict: Optional[Dict[str, Any]] = None
+        self._mtime: Optional[int] = None
+        self._next_check = 0.0
+        self._listeners: List[Callable[[Config], None]] = []
+        self._lock = threading.RLock()
+
+    def _stat(self) -> Optional[int]:
+        """Fecha de modificación del archivo en nanosegundos, o None si no existe."""
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _read(self) -> Config:
+        """
+        Lee el archivo (creándolo si no existe), aplica el entorno y valida.
+
+        Raises:
+            ValueError: Si la configuración no es válida
+        """
+        try:
+            if not self.path.exists():
+                # Crear archivo de configuración con valores por defecto
+                self.path.write_text(json.dumps(DEFAULT_CONFIG, indent=2))
+                loaded = copy.deepcopy(DEFAULT_CONFIG)
+            else:
+                loaded = json.loads(self.path.read_text())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in config file: {e}")
+        except OSError as e:
+            raise ValueError(f"Error loading configuration: {e}")
+
+        for section, values in env_overrides(self.environ).items():
+            loaded.setdefault(section, {}).update(values)
+        try:
+            return Config(**loaded)
+        except ValidationError as e:
+            raise ValueError(f"Error loading configuration: {e}")
+
+    def _set(self, config: Config, mtime: Optional[int]) -> None:
+        """Guarda en caché una configuración validada."""
+        self._config = config
+        self._dict = config.model_dump()
+        self._mtime = mtime
+
+    def get(self) -> Config:
+        """
+        Devuelve la configuración validada, leyéndola la primera vez.
+
+        Returns:
+            Config: Configuración actual
+
+        Raises:
+            ValueError: Si la configuración inicial no es válida
+        """
+        with self._lock:
+            if self._config is None:
+                mtime = self._stat()
+                self._set(self._read(), mtime)
+                logger.debug(f"Configuration loaded from {self.path}")
+            elif self.watch and time.monotonic() >= self._next_check:
+                self._next_check = time.monotonic() + self.check_interval
+                if self._stat() != self._mtime:
+                    self.reload()
+            return self._config
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Devuelve una copia de la configuración actual como diccionario."""
+        with self._lock:
+            self.get()
+            # Una copia: quien la modifique no altera la configuración compartida
+            return copy.deepcopy(self._dict)
+
+    def reload(self) -> bool:
+        """
+        Vuelve a leer el archivo y notifica a los suscriptores.
+
+        Returns:
+            bool: True si se cargó la nueva configuración, False si no era
+            válida y se conserva la anterior
+        """
+        with self._lock:
+            mtime = self._stat()
+            try:
+                config = self._read()
+            except ValueError as e:
+                if self._config is None:
+                    raise
+                logger.warning(f"Keeping previous configuration: {e}")
+                self._mtime = mtime
+                return False
+            self._set(config, mtime)
+            logger.info(f"Configuration reloaded from {self.path}")
+            self._notify(config)
+            return True
+
+    def update(self, new_config: Dict[str, Any]) -> Config:
+        """
+        Valida una nueva configuración, la guarda en el archivo y la aplica.
+
+        Raises:
+            ValueError: Si la nueva configuración no es válida
+        """
+        try:
+            config = Config(**new_config)
+        except ValidationError as e:
+            raise ValueError(f"Invalid configuration: {e}")
+        with self._lock:
+            try:
+                self.path.write_text(json.dumps(config.model_dump(), indent=2))
+            except OSError as e:
+                raise ValueError(f"Invalid configuration: {e}")
+            self._set(config, self._stat())
+            self._notify(config)
+            return config
+
+    def subscribe(self, callback: Callable[[Config], None]) -> None:
+        """Registra una función que recibe la configuración tras cada recarga."""
+        self._listeners.append(callback)
+
+    def _notify(self, config: Config) -> None:
+        """Llama a los suscriptores; un error en uno no afecta a los demás."""
+        for callback in list(self._listeners):
+            try:
+                callback(config)
+            except Exception as e:
+                logger.error(f"Configuration listener failed: {e}")
+
+def apply_log_level(config: Config) -> None:
+    """Aplica ``system.log_level`` a todos los loggers del paquete."""
+    level = logging.getLevelName(config.system.log_level.upper())
+    if not isinstance(level, int):
+        logger.warning(f"Unknown log level '{config.system.log_level}'")
+        return
+    for name, item in list(logging.root.manager.loggerDict.items()):
+        if name.split('.')[0] == 'morse_converter' and isinstance(item, logging.Logger):
+            item.setLevel(level)
+
+# Servicio global compartido por todos los módulos
+_service: Optional[ConfigService] = None
+_service_lock = threading.Lock()
+
+def get_service() -> ConfigService:
+    """
+    Devuelve el servicio de configuración compartido.
+
+    Returns:
+        ConfigService: Servicio global; las recargas ajustan el nivel de log
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ConfigService()
+            _service.subscribe(apply_log_level)
+        return _service
+
+def watch_config(enabled: bool = True, check_interval: float = DEFAULT_CHECK_INTERVAL) -> ConfigService:
+    """
+    Activa o desactiva la recarga automática de config.json.
+
+    Pensado para procesos de larga duración: cada get_config() posterior
+    detecta los cambios del archivo sin reiniciar y avisa a los suscriptores
+    (entre ellos la configuración del CLI). Sólo el comando repl lo activa;
+    los demás comandos leen la configuración una vez al arrancar.
+    """
+    service = get_service()
+    service.watch = enabled
+    service.check_interval = check_interval
+    return service
 
 def load_config() -> Dict[str, Any]:
     """
@@ -68,35 +338,8 @@ def load_config() -> Dict[str, Any]:
 
     Raises:
         ValueError: Si la configuración no es válida
-        FileNotFoundError: Si no se puede crear el archivo de configuración
-    """
-    global _config
-    
-    if _config is not None:
-        return _config
-        
-    config_path = get_config_path()
-    
-    try:
-        if not config_path.exists():
-            # Crear archivo de configuración con valores por defecto
-            config_path.write_text(json.dumps(DEFAULT_CONFIG, indent=2))
-            _config = DEFAULT_CONFIG
-        else:
-            # Cargar configuración existente
-            with open(config_path) as f:
-                loaded_config = json.load(f)
-                
-            # Validar configuración usando Pydantic
-            validated_config = Config(**loaded_config)
-            _config = validated_config.model_dump()
-            
-        return _config
-        
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in config file: {e}")
-    except Exception as e:
-        raise ValueError(f"Error loading configuration: {e}")
+    """
+    return get_service().as_dict()
 
 def get_config() -> Dict[str, Any]:
     """
@@ -105,10 +348,7 @@ def get_config() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Configuración actual
     """
-    global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    return get_service().as_dict()
 
 def update_config(new_config: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -123,29 +363,17 @@ def update_config(new_config: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValueError: Si la nueva configuración no es válida
     """
-    global _config
-    
-    try:
-        # Validar nueva configuración
-        validated_config = Config(**new_config)
-        config_dict = validated_config.model_dump()
-        
-        # Guardar en archivo
-        config_path = get_config_path()
-        with open(config_path, 'w') as f:
-            json.dump(config_dict, f, indent=2)
-            
-        _config = config_dict
-        return _config
-        
-    except Exception as e:
-        raise ValueError(f"Invalid configuration: {e}")
+    return get_service().update(new_config).model_dump()
 
 __all__ = [
     'load_config',
     'get_config',
     'update_config',
+    'get_service',
+    'watch_config',
+    'ConfigService',
     'AudioConfig',
     'SystemConfig',
+    'CacheConfig',
     'Config'
 ]
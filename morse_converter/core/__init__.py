@@ -5,9 +5,19 @@ This module provides the main functionality for converting text to Morse code
 and vice versa, along with audio generation and input validation capabilities.
 """
 
+from .code_tables import CodeTable, CompiledTable, available_tables, compile_table, register_table
 from .converter import MorseConverter
 from .validator import InputValidator, ValidationError
-from .audio import AudioGenerator, AudioPlayer, AudioError, MorseTimings
+from .timeline import MorseTimeline
+from .audio import AudioGenerator, AudioPlayer, AudioError, MorseTimings, ToneOscillator
+from .decoder import AudioDecoder, StreamingDecoder
+from .filterbank import FilterBank
+from .packing import pack_morse, unpack_morse
+from .parallel import ParallelConverter
+from .incremental import IncrementalConverter, MorsePatch
+from .watcher import DirectoryWatcher, ProcessedStore, WatchResult
+from .batch import BatchJob, BatchResult, JobManifest
+from .render import BatchRenderer, RenderResult
 
 __version__ = "1.0.0"
 
@@ -19,6 +29,29 @@ __all__ = [
     'AudioPlayer',
     'AudioError',
     'MorseTimings',
+    'MorseTimeline',
+    'ToneOscillator',
+    'AudioDecoder',
+    'StreamingDecoder',
+    'FilterBank',
+    'CodeTable',
+    'CompiledTable',
+    'available_tables',
+    'compile_table',
+    'register_table',
+    'pack_morse',
+    'unpack_morse',
+    'ParallelConverter',
+    'IncrementalConverter',
+    'DirectoryWatcher',
+    'ProcessedStore',
+    'WatchResult',
+    'BatchJob',
+    'BatchResult',
+    'JobManifest',
+    'BatchRenderer',
+    'RenderResult',
+    'MorsePatch',
 ]
 
 # Configuración por defecto
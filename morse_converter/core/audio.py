@@ -1,8 +1,13 @@
+import struct
+import wave
 import numpy as np
 import sounddevice as sd
-from typing import Optional, List
+from pathlib import Path
+from typing import Optional, Tuple, Union
 from dataclasses import dataclass
 from morse_converter.utils import setup_logger
+from morse_converter.utils.metrics import metrics
+from morse_converter.core.timeline import MorseTimeline
 
 # Configurar logger para este módulo
 logger = setup_logger(__name__)
@@ -16,10 +21,162 @@ class MorseTimings:
     LETTER_SPACE: float = 0.3   # espacio entre letras
     WORD_SPACE: float = 0.7     # espacio entre palabras
 
+# Cabecera RIFF/WAVE de un archivo PCM mono de 16 bits
+WAV_HEADER_SIZE = 44
+# Muestras renderizadas de una vez al escribir tonos largos en disco
+RENDER_BLOCK_SIZE = 1 << 20
+# Muestras mapeadas a la vez al escribir en disco (8 MiB de PCM)
+RENDER_WINDOW_SIZE = 1 << 22
+# Tamaño máximo de los datos de un WAV: los campos de tamaño son de 32 bits
+WAV_MAX_DATA_SIZE = 0xFFFFFFFF - 36
+
 class AudioError(Exception):
     """Custom exception for audio-related errors."""
     pass
 
+class ToneOscillator:
+    """
+    Phase-continuous sine oscillator backed by a precomputed wavetable.
+
+    The oscillator keeps its phase between calls, so consecutive tones (and
+    the silences between them) form a single continuous carrier. Raised-cosine
+    attack/decay envelopes are cached per element length to avoid key clicks.
+
+    Methods:
+        render(num_samples: int) -> np.ndarray
+            Renders the next block of the carrier and advances the phase.
+        advance(num_samples: int) -> None
+            Advances the phase without rendering (keyed-off carrier).
+        envelope(num_samples: int) -> np.ndarray
+            Returns the cached raised-cosine envelope for an element.
+    """
+
+    TABLE_SIZE: int = 4096
+    # Tabla de seno con un punto de guarda para la interpolación lineal
+    _WAVETABLE: np.ndarray = np.sin(
+        2 * np.pi * np.arange(TABLE_SIZE + 1) / TABLE_SIZE
+    )
+
+    def __init__(self, frequency: float, sample_rate: int, ramp_duration: float = 0.005):
+        """
+        Initialize the ToneOscillator.
+
+        Parameters:
+            frequency (float): The carrier frequency in Hz
+            sample_rate (int): The sample rate in Hz
+            ramp_duration (float): Attack/decay ramp length in seconds (default: 0.005)
+        """
+        self.sample_rate = sample_rate
+        self.ramp_duration = ramp_duration
+        self.phase = 0.0  # posición en la tabla, en [0, TABLE_SIZE)
+        self._steps = np.arange(0, dtype=np.float64)
+        self._envelopes: dict = {}
+        self.set_frequency(frequency)
+
+    def set_frequency(self, frequency: float) -> None:
+        """Set the carrier frequency, keeping the current phase."""
+        self.frequency = frequency
+        self._increment = frequency * self.TABLE_SIZE / self.sample_rate
+
+    def reset(self) -> None:
+        """Reset the phase to zero."""
+        self.phase = 0.0
+
+    def _step_indices(self, num_samples: int) -> np.ndarray:
+        """Return a cached ``arange(num_samples)`` view."""
+        if len(self._steps) < num_samples:
+            self._steps = np.arange(max(num_samples, 2 * len(self._steps)), dtype=np.float64)
+        return self._steps[:num_samples]
+
+    def render(self, num_samples: int) -> np.ndarray:
+        """
+        Render the next block of the carrier.
+
+        Parameters:
+            num_samples (int): Number of samples to render
+
+        Returns:
+            np.ndarray: Sine samples in the range [-1.0, 1.0]
+        """
+        positions = self._step_indices(num_samples) * self._increment
+        positions += self.phase
+        np.mod(positions, self.TABLE_SIZE, out=positions)
+        index = positions.astype(np.intp)
+        fraction = positions - index
+        table = self._WAVETABLE
+        samples = table[index]
+        samples += fraction * (table[index + 1] - samples)
+        self.advance(num_samples)
+        return samples
+
+    def advance(self, num_samples: int) -> None:
+        """Advance the phase by ``num_samples`` without rendering."""
+        self.phase = (self.phase + self._increment * num_samples) % self.TABLE_SIZE
+
+    def envelope(self, num_samples: int) -> np.ndarray:
+        """
+        Return the raised-cosine envelope for an element of ``num_samples``.
+
+        Ramps are shortened to half the element for very short elements.
+        The returned array is cached and must not be modified.
+        """
+        envelope = self._envelopes.get(num_samples)
+        if envelope is None:
+            ramp = min(int(self.sample_rate * self.ramp_duration), num_samples // 2)
+            envelope = np.ones(num_samples)
+            if ramp > 0:
+                attack = 0.5 - 0.5 * np.cos(np.pi * np.arange(ramp) / ramp)
+                envelope[:ramp] = attack
+                envelope[num_samples - ramp:] = attack[::-1]
+            envelope.flags.writeable = False
+            self._envelopes[num_samples] = envelope
+        return envelope
+
+    def clear_cache(self) -> None:
+        """Drop cached envelopes (e.g. after changing the ramp duration)."""
+        self._envelopes.clear()
+
+class _MappedPCM:
+    """
+    Writes 16-bit samples into a file through a sliding memory-mapped window.
+
+    Only one window of ``window_size`` samples is mapped at a time; it is
+    flushed and unmapped before the next one is mapped, so the resident
+    memory of a render stays bounded by the window, not by the file.
+    """
+
+    def __init__(self, path: Path, offset: int, total: int, window_size: int = RENDER_WINDOW_SIZE):
+        self.path = path
+        self.offset = offset
+        self.total = total
+        self.window_size = window_size
+        self._window: Optional[np.memmap] = None
+        self._start = 0
+
+    def write(self, position: int, samples: np.ndarray) -> None:
+        """Stores ``samples`` (floats already scaled to int16) at ``position``."""
+        done = 0
+        while done < len(samples):
+            at = position + done
+            if self._window is None or not self._start <= at < self._start + len(self._window):
+                self._map(at - at % self.window_size)
+            size = min(len(samples) - done, self._start + len(self._window) - at)
+            self._window[at - self._start:at - self._start + size] = samples[done:done + size]
+            done += size
+
+    def _map(self, start: int) -> None:
+        """Unmaps the current window and maps the one beginning at ``start``."""
+        self.close()
+        self._start = start
+        self._window = np.memmap(self.path, dtype='<i2', mode='r+', offset=self.offset + 2 * start,
+                                 shape=(min(self.window_size, self.total - start),))
+
+    def close(self) -> None:
+        """Flushes and unmaps the current window."""
+        if self._window is not None:
+            self._window.flush()
+            self._window = None
+
 class AudioGenerator:
     """
     Creates audio representations of Morse code.
@@ -27,33 +184,31 @@ class AudioGenerator:
     Methods:
         generate_audio(morse: str) -> None
             Generates audio for the given Morse code.
+        timeline(morse: str) -> MorseTimeline
+            Builds the keying timeline of Morse code with the current timings.
+        render_timeline(timeline: MorseTimeline) -> None
+            Generates audio for a keying timeline.
+        render_to_file(source, file_path, raw: bool = False) -> int
+            Renders straight into a memory-mapped WAV or raw PCM file.
     """
 
-    def __init__(self, frequency: int = 800, volume: float = 0.5):
+    def __init__(self, frequency: int = 800, volume: float = 0.5, ramp_duration: float = 0.005):
         """
         Initialize the AudioGenerator.
 
         Parameters:
             frequency (int): The frequency in Hz for the tones (default: 800)
             volume (float): The volume level from 0.0 to 1.0 (default: 0.5)
+            ramp_duration (float): Raised-cosine attack/decay time in seconds (default: 0.005)
         """
         self.frequency = frequency
         self.volume = volume
         self.sample_rate = 44100
         self.timings = MorseTimings()
         self._audio_buffer = None
+        self._oscillator = ToneOscillator(frequency, self.sample_rate, ramp_duration)
 
-    def _generate_tone(self, duration: float) -> np.ndarray:
-        """Generate a sine wave tone."""
-        logger.debug(f"Generating tone with duration={duration}s")
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-        return np.sin(2 * np.pi * self.frequency * t)
-
-    def _generate_silence(self, duration: float) -> np.ndarray:
-        """Generate a period of silence."""
-        logger.debug(f"Generating silence with duration={duration}s")
-        return np.zeros(int(self.sample_rate * duration))
-
+    @metrics.timed("audio.generate_audio")
     def generate_audio(self, morse: str) -> None:
         """
         Generates audio for the given Morse code.
@@ -65,31 +220,149 @@ class AudioGenerator:
             AudioError: If audio generation fails.
         """
         logger.info(f"Generating audio for Morse code: {morse}")
+        self.render_timeline(self.timeline(morse))
+
+    def timeline(self, morse: str) -> MorseTimeline:
+        """Returns the keying timeline of Morse code with this generator's timings."""
+        return MorseTimeline.from_morse(morse, self.timings)
+
+    @metrics.timed("audio.render_timeline")
+    def render_timeline(self, timeline: MorseTimeline) -> None:
+        """
+        Renders a keying timeline into the audio buffer.
+
+        Parameters:
+            timeline (MorseTimeline): The events to render.
+
+        Raises:
+            AudioError: If the timeline is empty or rendering fails.
+        """
         try:
-            audio_segments: List[np.ndarray] = []
-            
-            for symbol in morse:
-                if symbol == '.':
-                    logger.debug("Generating dot tone")
-                    audio_segments.append(self._generate_tone(self.timings.DOT_DURATION))
-                    audio_segments.append(self._generate_silence(self.timings.SYMBOL_SPACE))
-                elif symbol == '-':
-                    logger.debug("Generating dash tone")
-                    audio_segments.append(self._generate_tone(self.timings.DASH_DURATION))
-                    audio_segments.append(self._generate_silence(self.timings.SYMBOL_SPACE))
-                elif symbol == ' ':
-                    logger.debug("Generating word space")
-                    audio_segments.append(self._generate_silence(self.timings.WORD_SPACE))
+            if len(timeline) == 0:
+                raise ValueError("No Morse symbols to render")
+            counts = timeline.sample_counts(self.sample_rate)
+            buffer = np.zeros(int(counts.sum()))
+            self._oscillator.reset()
+
+            position = 0
+            for state, num_samples in zip(timeline.states.tolist(), counts.tolist()):
+                if state:
+                    logger.debug(f"Generating tone of {num_samples} samples")
+                    tone = buffer[position:position + num_samples]
+                    tone[:] = self._oscillator.render(num_samples)
+                    tone *= self._oscillator.envelope(num_samples)
                 else:
-                    logger.warning(f"Ignoring invalid symbol: {symbol}")
+                    # El oscilador sigue girando mientras la portadora está apagada
+                    self._oscillator.advance(num_samples)
+                position += num_samples
 
-            self._audio_buffer = np.concatenate(audio_segments)
+            self._audio_buffer = buffer
             logger.info("Audio generation completed successfully")
-            
+            metrics.increment("samples_rendered_total", len(self._audio_buffer))
+
         except Exception as e:
             logger.error(f"Failed to generate audio: {str(e)}")
+            metrics.increment("errors_total", component="audio", type=type(e).__name__)
             raise AudioError(f"Failed to generate audio: {str(e)}")
 
+    @metrics.timed("audio.render_to_file")
+    def render_to_file(
+        self,
+        source: Union[str, MorseTimeline],
+        file_path: Union[str, Path],
+        raw: bool = False
+    ) -> int:
+        """
+        Renders Morse code straight into a 16-bit mono WAV or raw PCM file.
+
+        The file is sized up front and written through ``np.memmap`` one
+        window at a time: every tone is written by slice into the mapped
+        window (in blocks for very long tones), each window is flushed and
+        unmapped before the next one, and silences are left as the zeros of
+        the sparse file. Resident memory therefore stays at a few MiB
+        whatever the length of the message. The WAV header is written with
+        empty sizes and patched once rendering has finished, so an
+        interrupted render never looks like a complete file. WAV files are
+        limited to 4 GiB of samples (about 13.5 hours); use ``raw=True``
+        for longer renders. The samples match ``save_wav`` after
+        ``generate_audio``; the audio buffer is not kept.
+
+        Parameters:
+            source (str | MorseTimeline): Morse code or a keying timeline.
+            file_path (str | Path): Destination file.
+            raw (bool): Write headerless little-endian PCM instead of WAV (default: False)
+
+        Returns:
+            int: Number of samples written.
+
+        Raises:
+            AudioError: If there is nothing to render or the file cannot be written.
+        """
+        timeline = source if isinstance(source, MorseTimeline) else self.timeline(source)
+        path = Path(file_path)
+        logger.info(f"Rendering {timeline.duration:.1f}s of audio to {path}")
+        try:
+            if len(timeline) == 0:
+                raise ValueError("No Morse symbols to render")
+            counts = timeline.sample_counts(self.sample_rate)
+            total = int(counts.sum())
+            if not raw and 2 * total > WAV_MAX_DATA_SIZE:
+                raise ValueError(f"{total} samples exceed the 4 GiB limit of WAV files; use raw PCM output")
+            offset = 0 if raw else WAV_HEADER_SIZE
+            with path.open('wb') as output:
+                if not raw:
+                    output.write(_wav_header(0, self.sample_rate))
+                # El archivo queda disperso: los silencios no ocupan disco
+                output.truncate(offset + 2 * total)
+
+            pcm = _MappedPCM(path, offset, total)
+            try:
+                self._oscillator.reset()
+                position = 0
+                for state, num_samples in zip(timeline.states.tolist(), counts.tolist()):
+                    if state:
+                        envelope = self._oscillator.envelope(num_samples)
+                        for start in range(0, num_samples, RENDER_BLOCK_SIZE):
+                            size = min(RENDER_BLOCK_SIZE, num_samples - start)
+                            tone = self._oscillator.render(size)
+                            tone *= envelope[start:start + size]
+                            tone *= self.volume
+                            np.clip(tone, -1.0, 1.0, out=tone)
+                            tone *= 32767
+                            pcm.write(position + start, tone)
+                    else:
+                        self._oscillator.advance(num_samples)
+                    position += num_samples
+            finally:
+                pcm.close()
+
+            if not raw:
+                with path.open('r+b') as output:
+                    output.write(_wav_header(total, self.sample_rate))
+            logger.info(f"Wrote {total} samples to {path}")
+            metrics.increment("samples_rendered_total", total)
+            return total
+
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to render audio to {path}: {str(e)}")
+            metrics.increment("errors_total", component="audio", type=type(e).__name__)
+            raise AudioError(f"Failed to render audio: {str(e)}")
+
+    def save_wav(self, file_path: Union[str, Path]) -> None:
+        """
+        Saves the last generated audio as a 16-bit mono WAV file.
+
+        Parameters:
+            file_path (str | Path): Destination of the WAV file.
+
+        Raises:
+            AudioError: If no audio has been generated or the file cannot be written.
+        """
+        if self._audio_buffer is None:
+            logger.error("Attempted to save audio without generating it first")
+            raise AudioError("No audio has been generated yet")
+        write_wav(file_path, self._audio_buffer * self.volume, self.sample_rate)
+
     def set_frequency(self, frequency: float) -> None:
         """Set the tone frequency."""
         logger.info(f"Setting frequency to {frequency}Hz")
@@ -97,6 +370,7 @@ class AudioGenerator:
             logger.error(f"Invalid frequency value: {frequency}")
             raise ValueError("Frequency must be positive")
         self.frequency = frequency
+        self._oscillator.set_frequency(frequency)
         logger.debug("Frequency updated successfully")
 
     def set_timing(self, 
@@ -133,6 +407,96 @@ class AudioGenerator:
             self.timings.WORD_SPACE = word_space
         logger.info("Timing configurations updated successfully")
 
+    def set_wpm(self, wpm: float) -> None:
+        """
+        Set the speed in words per minute (PARIS standard, one unit = 1.2 / wpm seconds).
+
+        Parameters:
+            wpm (float): Words per minute
+
+        Raises:
+            ValueError: If wpm is not positive
+        """
+        if wpm <= 0:
+            logger.error(f"Invalid speed value: {wpm}")
+            raise ValueError("Speed must be positive")
+        unit = 1.2 / wpm
+        self.set_timing(
+            dot_duration=unit,
+            dash_duration=3 * unit,
+            symbol_space=unit,
+            letter_space=3 * unit,
+            word_space=7 * unit
+        )
+
+def _wav_header(num_samples: int, sample_rate: int) -> bytes:
+    """Builds the 44-byte header of a 16-bit mono PCM WAV file."""
+    data_size = 2 * num_samples
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, 2 * sample_rate, 2, 16,
+        b'data', data_size
+    )
+
+def write_wav(file_path: Union[str, Path], samples: np.ndarray, sample_rate: int) -> None:
+    """
+    Writes floating point samples in [-1.0, 1.0] as a 16-bit mono WAV file.
+
+    Parameters:
+        file_path (str | Path): Destination of the WAV file.
+        samples (np.ndarray): Samples to write.
+        sample_rate (int): Sample rate in Hz.
+
+    Raises:
+        AudioError: If the file cannot be written.
+    """
+    logger.info(f"Writing WAV file: {file_path}")
+    try:
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2')
+        with wave.open(str(file_path), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(pcm.tobytes())
+        logger.debug(f"Wrote {len(pcm)} samples to {file_path}")
+    except (OSError, wave.Error) as e:
+        logger.error(f"Failed to write WAV file {file_path}: {str(e)}")
+        raise AudioError(f"Failed to write WAV file: {str(e)}")
+
+def read_wav(file_path: Union[str, Path]) -> Tuple[np.ndarray, int]:
+    """
+    Reads a 16-bit PCM WAV file into floating point samples.
+
+    Multi-channel files are mixed down to mono.
+
+    Parameters:
+        file_path (str | Path): The WAV file to read.
+
+    Returns:
+        Tuple[np.ndarray, int]: The samples in [-1.0, 1.0] and the sample rate.
+
+    Raises:
+        AudioError: If the file cannot be read or is not 16-bit PCM.
+    """
+    logger.info(f"Reading WAV file: {file_path}")
+    try:
+        with wave.open(str(file_path), 'rb') as wav_file:
+            if wav_file.getsampwidth() != 2:
+                raise AudioError("Only 16-bit PCM WAV files are supported")
+            channels = wav_file.getnchannels()
+            sample_rate = wav_file.getframerate()
+            frames = wav_file.readframes(wav_file.getnframes())
+    except (OSError, EOFError, wave.Error) as e:
+        logger.error(f"Failed to read WAV file {file_path}: {str(e)}")
+        raise AudioError(f"Failed to read WAV file: {str(e)}")
+
+    samples = np.frombuffer(frames, dtype='<i2').astype(np.float64) / 32767
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    logger.debug(f"Read {len(samples)} samples at {sample_rate}Hz from {file_path}")
+    return samples, sample_rate
+
 class AudioPlayer:
     """
     Manages playback operations for Morse code audio.
@@ -156,6 +520,7 @@ class AudioPlayer:
         self._is_playing = False
         logger.debug("AudioPlayer initialized successfully")
 
+    @metrics.timed("audio.play_audio")
     def play_audio(self) -> None:
         """
         Plays the generated Morse code audio.
@@ -182,6 +547,7 @@ class AudioPlayer:
         except Exception as e:
             self._is_playing = False
             logger.error(f"Audio playback failed: {str(e)}")
+            metrics.increment("errors_total", component="audio", type=type(e).__name__)
             raise AudioError(f"Failed to play audio: {str(e)}")
 
     def stop_audio(self) -> None:
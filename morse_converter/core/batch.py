@@ -0,0 +1,335 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+from morse_converter.core.code_tables import DEFAULT_TABLE
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.parallel import DEFAULT_CHUNK_SIZE, TEXT_TO_MORSE, ParallelConverter, convert_span
+from morse_converter.utils import setup_logger
+from morse_converter.utils.file_handler import FileWriter, compression_for, detect_compression
+from morse_converter.utils.metrics import metrics
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+DEFAULT_MANIFEST_NAME = ".morse-batch.json"
+MANIFEST_VERSION = 1
+
+# Estados de cada archivo en el manifiesto
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+STATUS_INTERRUPTED = "interrupted"
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of one file of a batch job.
+
+    Attributes:
+        input_path (Path): The input file.
+        output_path (Path): The converted file.
+        status (str): ``"done"``, ``"skipped"``, ``"failed"`` or ``"interrupted"``.
+        written (int): Bytes of output written so far.
+        error (str, optional): The error message of a failed file.
+    """
+    input_path: Path
+    output_path: Path
+    status: str
+    written: int
+    error: Optional[str] = None
+
+class JobManifest:
+    """
+    JSON record of the progress of a batch job.
+
+    For every input file the manifest keeps its size and modification time,
+    the status, and for files in progress the number of chunks finished with
+    the input and output byte offsets they reach. The file is replaced
+    atomically on every flush, so a killed job leaves the last consistent
+    state behind.
+
+    Methods:
+        load(path: Path, direction: str, chunk_size: int) -> JobManifest
+            Reads a manifest, checking that it belongs to the same job.
+        entry(input_path: Path) -> Optional[Dict[str, Any]]
+            Returns the record of a file.
+        update(input_path: Path, **fields) -> Dict[str, Any]
+            Changes the record of a file.
+        flush() -> None
+            Writes the manifest to disk.
+    """
+
+    def __init__(self, path: Union[str, Path], direction: str, chunk_size: int):
+        """
+        Initialize an empty manifest.
+
+        Parameters:
+            path (str | Path): The manifest file.
+            direction (str): ``TEXT_TO_MORSE`` or ``MORSE_TO_TEXT``.
+            chunk_size (int): Chunk size in bytes; offsets are only valid for the same size.
+        """
+        self.path = Path(path)
+        self.direction = direction
+        self.chunk_size = chunk_size
+        self.files: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: Union[str, Path], direction: str, chunk_size: int) -> "JobManifest":
+        """
+        Reads a manifest, or returns an empty one if the file does not exist.
+
+        Raises:
+            ValueError: If the file is not a manifest or was written by a job
+                with another direction or chunk size.
+        """
+        manifest = cls(path, direction, chunk_size)
+        if not manifest.path.exists():
+            return manifest
+        try:
+            data = json.loads(manifest.path.read_text(encoding='utf-8'))
+            version, files = data["version"], data["files"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid job manifest {manifest.path}: {e}")
+        if version != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported job manifest version {version}")
+        if data.get("direction") != direction or data.get("chunk_size") != chunk_size:
+            raise ValueError(
+                f"Job manifest {manifest.path} was written for {data.get('direction')} with "
+                f"chunk size {data.get('chunk_size')}; start a new job without --resume"
+            )
+        manifest.files = files
+        logger.info(f"Loaded job manifest {manifest.path} with {len(files)} files")
+        return manifest
+
+    @staticmethod
+    def _key(input_path: Path) -> str:
+        return str(Path(input_path).resolve())
+
+    def entry(self, input_path: Path) -> Optional[Dict[str, Any]]:
+        """Returns the record of a file, or None."""
+        return self.files.get(self._key(input_path))
+
+    def update(self, input_path: Path, **fields: Any) -> Dict[str, Any]:
+        """Changes the record of a file (without flushing)."""
+        entry = self.files.setdefault(self._key(input_path), {})
+        entry.update(fields)
+        return entry
+
+    def flush(self) -> None:
+        """Writes the manifest atomically."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "direction": self.direction,
+            "chunk_size": self.chunk_size,
+            "updated": time.time(),
+            "files": self.files,
+        }
+        with FileWriter(self.path, atomic=True) as writer:
+            writer.write(json.dumps(data, indent=2))
+
+class BatchJob:
+    """
+    Converts a list of files, recording its progress so it can be resumed.
+
+    Plain files are converted chunk by chunk, using the same word-boundary
+    chunks as ParallelConverter, into a hidden ``.part`` file that replaces
+    the output when the file is finished. After every chunk the manifest
+    records the input and output byte offsets reached, so a resumed job
+    truncates the part file to the recorded size and continues with the next
+    chunk. Compressed files cannot be resumed midway and are converted in one
+    streaming pass.
+
+    ``request_stop`` (e.g. from a SIGTERM handler) makes the job stop after
+    the current chunk and flush the manifest.
+
+    Methods:
+        run() -> List[BatchResult]
+            Converts the files.
+        request_stop(signum: int = None) -> None
+            Asks the job to stop at the next chunk boundary.
+    """
+
+    def __init__(
+        self,
+        inputs: Sequence[Union[str, Path]],
+        output_dir: Union[str, Path],
+        direction: str = TEXT_TO_MORSE,
+        manifest_path: Optional[Union[str, Path]] = None,
+        resume: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        table: Union[str, Sequence[str]] = DEFAULT_TABLE,
+        on_result: Optional[Callable[[BatchResult], None]] = None
+    ):
+        """
+        Initialize the BatchJob.
+
+        Parameters:
+            inputs (Sequence[str | Path]): The files to convert.
+            output_dir (str | Path): Where converted files are written (created if missing).
+            direction (str): ``TEXT_TO_MORSE`` or ``MORSE_TO_TEXT`` (default: text to Morse)
+            manifest_path (str | Path, optional): The manifest (default: ``.morse-batch.json`` in output_dir)
+            resume (bool): Continue from an existing manifest (default: False)
+            chunk_size (int): Chunk size in bytes (default: 4 MiB)
+            table (str | Sequence[str]): Code table(s) to use (default: "standard")
+            on_result (Callable, optional): Called with the BatchResult of every file
+
+        Raises:
+            ValueError: If the direction is unknown, two inputs share a file name
+                or the manifest cannot be resumed.
+        """
+        ParallelConverter._check_direction(direction)
+        self.inputs = [Path(path) for path in inputs]
+        # Las salidas se nombran por el nombre base: dos entradas iguales se pisarían
+        names: Dict[str, Path] = {}
+        for path in self.inputs:
+            other = names.setdefault(path.name, path)
+            if other.resolve() != path.resolve():
+                raise ValueError(f"Input files {other} and {path} would both be written to {path.name}")
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.direction = direction
+        self.resume = resume
+        self.on_result = on_result
+        self.signal: Optional[int] = None
+        self._stop = threading.Event()
+        self._splitter = ParallelConverter(workers=1, chunk_size=chunk_size, table=table)
+        self._converter = MorseConverter(table)
+        manifest_path = Path(manifest_path or self.output_dir / DEFAULT_MANIFEST_NAME)
+        if resume:
+            self.manifest = JobManifest.load(manifest_path, direction, chunk_size)
+        else:
+            self.manifest = JobManifest(manifest_path, direction, chunk_size)
+
+    @property
+    def stopped(self) -> bool:
+        """True once a stop has been requested."""
+        return self._stop.is_set()
+
+    def request_stop(self, signum: Optional[int] = None) -> None:
+        """Asks the job to stop after the current chunk; safe to call from a signal handler."""
+        self.signal = signum
+        self._stop.set()
+
+    def run(self) -> List[BatchResult]:
+        """
+        Converts the files in order, skipping finished ones when resuming.
+
+        A file that fails is recorded and the job continues with the next one.
+
+        Returns:
+            List[BatchResult]: One result per file handled; when stopped, the
+            last one has status ``"interrupted"`` and later files are absent.
+        """
+        results: List[BatchResult] = []
+        logger.info(f"Starting batch job of {len(self.inputs)} files ({self.direction})")
+        try:
+            for input_path in self.inputs:
+                if self.stopped:
+                    break
+                result = self._convert_file(input_path)
+                metrics.increment("batch_files_total", status=result.status)
+                results.append(result)
+                if self.on_result is not None:
+                    self.on_result(result)
+        finally:
+            self.manifest.flush()
+        logger.info(f"Batch job {'interrupted' if self.stopped else 'finished'} after {len(results)} files")
+        return results
+
+    def _convert_file(self, input_path: Path) -> BatchResult:
+        """Converts one file, resuming from the manifest when possible."""
+        output_path = self.output_dir / input_path.name
+        try:
+            stat = input_path.stat()
+        except OSError as e:
+            return self._fail(input_path, output_path, {}, str(e))
+        signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        entry = self.manifest.entry(input_path) if self.resume else None
+        if entry is not None and {k: entry.get(k) for k in signature} != signature:
+            logger.info(f"{input_path} changed since the last run, converting it again")
+            entry = None
+        if entry is not None and entry.get("status") == STATUS_DONE and output_path.exists():
+            logger.info(f"Skipping finished file {input_path}")
+            return BatchResult(input_path, output_path, STATUS_SKIPPED, entry.get("output_bytes", 0))
+
+        try:
+            if detect_compression(str(input_path)) or compression_for(str(output_path)):
+                self.manifest.update(input_path, **signature, status=STATUS_RUNNING, output=str(output_path))
+                self.manifest.flush()
+                written = self._splitter.convert_stream(str(input_path), str(output_path), self.direction)
+            else:
+                written = self._convert_chunks(input_path, output_path, signature, entry)
+                if written is None:
+                    entry = self.manifest.entry(input_path)
+                    return BatchResult(input_path, output_path, STATUS_INTERRUPTED, entry["output_bytes"])
+        except (OSError, ValueError) as e:
+            return self._fail(input_path, output_path, signature, str(e))
+
+        self.manifest.update(input_path, **signature, status=STATUS_DONE, output=str(output_path),
+                             input_offset=signature["size"], output_bytes=written)
+        self.manifest.flush()
+        logger.info(f"Converted {input_path} to {output_path} ({written} bytes)")
+        return BatchResult(input_path, output_path, STATUS_DONE, written)
+
+    def _fail(self, input_path: Path, output_path: Path, signature: Dict[str, int], error: str) -> BatchResult:
+        logger.error(f"Failed to convert {input_path}: {error}")
+        metrics.increment("errors_total", component="batch", type="ConversionError")
+        self.manifest.update(input_path, **signature, status=STATUS_FAILED, error=error)
+        self.manifest.flush()
+        return BatchResult(input_path, output_path, STATUS_FAILED, 0, error)
+
+    def _convert_chunks(self, input_path: Path, output_path: Path, signature: Dict[str, int],
+                        entry: Optional[Dict[str, Any]]) -> Optional[int]:
+        """
+        Converts a plain file chunk by chunk into its part file.
+
+        Returns:
+            Optional[int]: Bytes written, or None if the job was stopped first.
+        """
+        chunks = self._splitter.split(str(input_path), self.direction)
+        part_path = output_path.with_name(f".{output_path.name}.part")
+        first, written = 0, 0
+        if (entry is not None and entry.get("status") in (STATUS_RUNNING, STATUS_INTERRUPTED)
+                and part_path.exists() and part_path.stat().st_size >= entry.get("output_bytes", 0)):
+            first, written = entry.get("chunks_done", 0), entry.get("output_bytes", 0)
+            logger.info(f"Resuming {input_path} at chunk {first}/{len(chunks)} "
+                        f"(input byte {entry.get('input_offset', 0)}, output byte {written})")
+        to_morse = self.direction == TEXT_TO_MORSE
+
+        with input_path.open('rb') as source, part_path.open('r+b' if first else 'wb') as part:
+            # Descartar lo escrito después del último punto registrado
+            part.truncate(written)
+            part.seek(written)
+            for index in range(first, len(chunks)):
+                if self.stopped:
+                    self.manifest.update(input_path, **signature, status=STATUS_INTERRUPTED,
+                                         output=str(output_path), chunks_done=index,
+                                         chunks_total=len(chunks), output_bytes=written,
+                                         input_offset=chunks[index - 1].end if index else 0)
+                    return None
+                chunk = chunks[index]
+                source.seek(chunk.start)
+                data = source.read(chunk.end - chunk.start).decode('utf-8')
+                result = convert_span(self._converter, data, self.direction, chunk.start)
+
+                # Los mismos separadores que ParallelConverter entre fragmentos
+                if to_morse:
+                    separator = '  ' if result and written else ''
+                else:
+                    separator = ' ' * (chunks[index - 1].gap // 2) if index else ''
+                encoded = (separator + result).encode('utf-8')
+                part.write(encoded)
+                part.flush()
+                written += len(encoded)
+                self.manifest.update(input_path, **signature, status=STATUS_RUNNING, output=str(output_path),
+                                     chunks_done=index + 1, chunks_total=len(chunks),
+                                     input_offset=chunk.end, output_bytes=written)
+                self.manifest.flush()
+                metrics.increment("batch_chunks_total")
+
+        os.replace(part_path, output_path)
+        return written
@@ -0,0 +1,279 @@
+import numpy as np
+from typing import List, NamedTuple, Optional, Sequence
+from numpy.lib.stride_tricks import sliding_window_view
+from morse_converter.core.code_tables import CompiledTable
+from morse_converter.utils import setup_logger
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+_SPACE, _DOT, _DASH, _NEWLINE = ord(' '), ord('.'), ord('-'), ord('\n')
+
+# Bytes válidos en Morse, incluido el separador de registros
+_MORSE_BYTES = b'.- \n'
+
+# '.' (0x2E) y '-' (0x2D) difieren en el bit menos significativo; el producto
+# reúne ese bit de cada uno de los 8 bytes de una palabra en el byte alto
+_GATHER_BITS = np.uint64(0x0102040810204080)
+_KEY_MASKS = np.array([((1 << (8 * n)) - 1) & 0x0101010101010101 for n in range(9)], dtype=np.uint64)
+
+class EncodeTable(NamedTuple):
+    """
+    Lookup tables for vectorized encoding.
+
+    Rows are indexed by ``separator * 256 + byte``, where the separator is the
+    number of spaces (0-2) written before the byte's Morse code, so a
+    token's output is the masked start of its row.
+
+    Attributes:
+        supported (np.ndarray): True for byte values that can be encoded.
+        punctuation (np.ndarray): True for bytes encoded as a separate word.
+        rows (np.ndarray): Output bytes, shape ``(3 * 256, width)``.
+        mask (np.ndarray): Columns in use per row.
+    """
+    supported: np.ndarray
+    punctuation: np.ndarray
+    rows: np.ndarray
+    mask: np.ndarray
+
+class DecodeTable(NamedTuple):
+    """
+    Lookup tables for vectorized decoding, indexed by integer letter key.
+
+    The key of a code is ``1 << len(code)`` plus its elements as bits, dot 0
+    and dash 1, first element in the least significant bit.
+
+    Attributes:
+        lookup (np.ndarray): Token index per letter key, -1 when unknown.
+        max_length (int): Length of the longest Morse code.
+        rows (np.ndarray): UTF-8 bytes per token, shape ``(tokens, width)``.
+        lengths (np.ndarray): Length in bytes of each token.
+    """
+    lookup: np.ndarray
+    max_length: int
+    rows: np.ndarray
+    lengths: np.ndarray
+
+def build_encode_table(compiled: CompiledTable) -> Optional[EncodeTable]:
+    """
+    Builds the encoding lookup tables for a compiled code table.
+
+    Returns:
+        EncodeTable | None: The tables, or None if the code table has
+        multi-character tokens and needs the tokenizer.
+    """
+    if compiled.token_starts:
+        return None
+    codes = {token: code for token, code in compiled.encode.items() if token != ' ' and token.isascii()}
+    # El salto de línea separa registros y se copia tal cual
+    codes['\n'] = '\n'
+    width = max(len(code) for code in codes.values()) + 2
+    supported = np.zeros(256, dtype=bool)
+    punctuation = np.zeros(256, dtype=bool)
+    rows = np.full((3 * 256, width), _SPACE, dtype=np.uint8)
+    mask = np.zeros((3 * 256, width), dtype=bool)
+    for token, code in codes.items():
+        value = ord(token)
+        supported[value] = True
+        punctuation[value] = token in compiled.punctuation
+        for separator in range(3):
+            row = separator * 256 + value
+            rows[row, separator:separator + len(code)] = np.frombuffer(code.encode('ascii'), dtype=np.uint8)
+            mask[row, :separator + len(code)] = True
+    return EncodeTable(supported, punctuation, rows, mask)
+
+def build_decode_table(compiled: CompiledTable) -> DecodeTable:
+    """Builds the decoding lookup tables for a compiled code table."""
+    codes = [code for code in compiled.decode if code.strip()]
+    max_length = max((len(code) for code in codes), default=0)
+    lookup = np.full(1 << (max_length + 1), -1, dtype=np.intp)
+    encoded = [compiled.decode[code].encode('utf-8') for code in codes]
+    rows = np.zeros((len(codes), max((len(token) for token in encoded), default=1)), dtype=np.uint8)
+    lengths = np.zeros(len(codes), dtype=np.intp)
+    for i, (code, token) in enumerate(zip(codes, encoded)):
+        key = 1 << len(code)
+        for j, symbol in enumerate(code):
+            key |= (symbol == '-') << j
+        lookup[key] = i
+        rows[i, :len(token)] = np.frombuffer(token, dtype=np.uint8)
+        lengths[i] = len(token)
+    return DecodeTable(lookup, max_length, rows, lengths)
+
+def _join(records: Sequence[str]) -> Optional[str]:
+    """
+    Joins the records with newlines.
+
+    Returns:
+        str | None: The joined buffer, or None if it is not ASCII or a record
+        contains a newline itself.
+
+    Raises:
+        TypeError: If a record is not a string.
+    """
+    try:
+        buffer = '\n'.join(records)
+    except TypeError:
+        raise TypeError("Input must be a string") from None
+    if not buffer.isascii() or buffer.count('\n') != len(records) - 1:
+        return None
+    return buffer
+
+def _record_at(data: np.ndarray, position: int) -> int:
+    """Returns the index of the record containing byte ``position``."""
+    return int(np.count_nonzero(data[:position] == _NEWLINE))
+
+def _letter_keys(data: np.ndarray, starts: np.ndarray, lengths: np.ndarray, max_length: int) -> np.ndarray:
+    """
+    Computes the integer key of every letter.
+
+    Parameters:
+        data (np.ndarray): Morse bytes.
+        starts (np.ndarray): Offset of each letter in ``data``.
+        lengths (np.ndarray): Length of each letter, at most ``max_length``.
+        max_length (int): Length of the longest code in the table.
+
+    Returns:
+        np.ndarray: Key per letter, see ``DecodeTable``.
+    """
+    if max_length <= 8:
+        # Leer los 8 bytes de cada letra como un entero sin alinear
+        padded = np.concatenate((data, np.zeros(8, dtype=np.uint8)))
+        words = np.ndarray(shape=data.shape, dtype='<u8', buffer=padded, strides=(1,))
+        masked = words[starts] & _KEY_MASKS[lengths]
+        bits = (masked * _GATHER_BITS) >> np.uint64(56)
+    else:
+        padded = np.concatenate((data & 1, np.zeros(max_length, dtype=np.uint8)))
+        windows = sliding_window_view(padded, max_length)[starts]
+        in_letter = np.arange(max_length) < lengths[:, None]
+        bits = (windows * in_letter).dot(1 << np.arange(max_length))
+    return bits.astype(np.intp) + (1 << lengths)
+
+def encode_batch(records: Sequence[str], table: EncodeTable) -> Optional[List[str]]:
+    """
+    Encodes many texts to Morse code in one vectorized pass.
+
+    The output for every record is identical to ``MorseConverter.text_to_morse``.
+
+    Parameters:
+        records (Sequence[str]): Texts to encode.
+        table (EncodeTable): Lookup tables from ``build_encode_table``.
+
+    Returns:
+        List[str] | None: Morse code per record in the original order, or None
+        if the batch must be encoded per record (non-ASCII text or newlines).
+
+    Raises:
+        TypeError: If a record is not a string.
+        ValueError: If a record contains unsupported characters.
+    """
+    if not records:
+        return []
+    buffer = _join(records)
+    if buffer is None:
+        return None
+    data = np.frombuffer(buffer.upper().encode('ascii'), dtype=np.uint8)
+
+    positions = np.flatnonzero(data != _SPACE)
+    if positions.size == 0:
+        return [''] * len(records)
+    chars = data[positions]
+    unsupported = ~table.supported[chars]
+    if unsupported.any():
+        position = int(positions[np.argmax(unsupported)])
+        raise ValueError(
+            f"Record {_record_at(data, position)}: "
+            f"Character '{chr(data[position])}' is not supported in Morse code"
+        )
+
+    # Separador antes de cada símbolo: dos espacios tras un espacio o junto a
+    # puntuación, uno entre letras y ninguno al inicio de un registro
+    is_newline = chars == _NEWLINE
+    punctuation = table.punctuation[chars]
+    separators = np.ones(chars.size, dtype=np.intp)
+    separators[1:][np.diff(positions) > 1] = 2
+    separators[punctuation] = 2
+    separators[1:][punctuation[:-1]] = 2
+    separators[0] = 0
+    separators[1:][is_newline[:-1]] = 0
+    separators[is_newline] = 0
+
+    rows = separators * 256 + chars
+    out = np.take(table.rows, rows, axis=0)[np.take(table.mask, rows, axis=0)]
+    return out.tobytes().decode('ascii').split('\n')
+
+def decode_batch(records: Sequence[str], table: DecodeTable) -> Optional[List[str]]:
+    """
+    Decodes many Morse strings to text in one vectorized pass.
+
+    The output for every record is identical to ``MorseConverter.morse_to_text``.
+
+    Parameters:
+        records (Sequence[str]): Morse code strings to decode.
+        table (DecodeTable): Lookup tables from ``build_decode_table``.
+
+    Returns:
+        List[str] | None: Text per record in the original order, or None if
+        the batch must be decoded per record (non-ASCII input or newlines).
+
+    Raises:
+        TypeError: If a record is not a string.
+        ValueError: If a record contains invalid Morse code.
+    """
+    if not records:
+        return []
+    buffer = _join(records)
+    if buffer is None:
+        return None
+    raw = buffer.encode('ascii')
+    if raw.translate(None, _MORSE_BYTES):
+        data = np.frombuffer(raw, dtype=np.uint8)
+        invalid = (data != _DOT) & (data != _DASH) & (data != _SPACE) & (data != _NEWLINE)
+        record = _record_at(data, int(np.argmax(invalid)))
+        raise ValueError(f"Record {record}: Invalid Morse code characters: "
+                         f"{set(records[record]) - {'.', '-', ' '}}")
+    data = np.frombuffer(raw, dtype=np.uint8)
+
+    # Rachas de puntos y rayas (letras), de espacios o saltos de línea
+    is_mark = data >= _DASH
+    is_newline = data == _NEWLINE
+    run_starts = np.ones(data.size, dtype=bool)
+    run_starts[1:] = (is_mark[1:] != is_mark[:-1]) | is_newline[1:] | is_newline[:-1]
+    run_first = np.flatnonzero(run_starts)
+    run_lengths = np.diff(run_first, append=data.size)
+    run_bytes = data[run_first]
+
+    letters = np.flatnonzero(run_bytes >= _DASH)
+    letter_lengths = run_lengths[letters]
+    letter_first = run_first[letters]
+    fits = letter_lengths <= table.max_length
+    if fits.all():
+        tokens = table.lookup[_letter_keys(data, letter_first, letter_lengths, table.max_length)]
+    else:
+        tokens = np.full(letters.size, -1, dtype=np.intp)
+        keys = _letter_keys(data, letter_first[fits], letter_lengths[fits], table.max_length)
+        tokens[fits] = table.lookup[keys]
+    unknown = tokens < 0
+    if unknown.any():
+        start = int(run_first[letters[np.argmax(unknown)]])
+        length = int(run_lengths[letters[np.argmax(unknown)]])
+        code = data[start:start + length].tobytes().decode('ascii')
+        raise ValueError(f"Record {_record_at(data, start)}: Invalid Morse code sequence: '{code}'")
+
+    # Cada racha de n espacios aporta n // 2 espacios, como split('  ')
+    item_lengths = run_lengths // 2
+    newlines = run_bytes == _NEWLINE
+    item_lengths[newlines] = 1
+    item_lengths[letters] = table.lengths[tokens]
+    item_starts = np.cumsum(item_lengths) - item_lengths
+    out = np.full(int(item_lengths.sum()), _SPACE, dtype=np.uint8)
+    out[item_starts[newlines]] = _NEWLINE
+
+    letter_starts = item_starts[letters]
+    if table.rows.shape[1] == 1:
+        out[letter_starts] = table.rows[tokens, 0]
+    else:
+        width = table.rows.shape[1]
+        token_mask = np.arange(width) < table.lengths[tokens][:, None]
+        destinations = letter_starts[:, None] + np.arange(width)
+        out[destinations[token_mask]] = table.rows[tokens][token_mask]
+    return out.tobytes().decode('utf-8').split('\n')
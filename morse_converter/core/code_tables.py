@@ -0,0 +1,308 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Pattern, Sequence, Tuple, Union
+from morse_converter.utils import setup_logger
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+# Tabla usada cuando no se indica ninguna
+DEFAULT_TABLE = "standard"
+
+@dataclass(frozen=True)
+class CodeTable:
+    """
+    A named Morse code table.
+
+    Attributes:
+        name (str): Registry name of the table.
+        mapping (Dict[str, str]): Upper-case text token to Morse code.
+        punctuation (FrozenSet[str]): Tokens encoded as a separate Morse word.
+        description (str): Human readable description.
+    """
+    name: str
+    mapping: Dict[str, str]
+    punctuation: FrozenSet[str] = field(default_factory=frozenset)
+    description: str = ""
+
+@dataclass(frozen=True)
+class CompiledTable:
+    """
+    Encode/decode structures compiled from one or more code tables.
+
+    When tables overlap, the first table listed wins for both encoding and
+    decoding.
+
+    Attributes:
+        names (Tuple[str, ...]): Names of the compiled tables, in priority order.
+        encode (Dict[str, str]): Text token to Morse code.
+        decode (Dict[str, str]): Morse code to text token.
+        punctuation (FrozenSet[str]): Tokens encoded as a separate Morse word.
+        charset (FrozenSet[str]): Characters accepted in text input, both cases.
+        text_pattern (Pattern): Regular expression matching valid text input.
+        max_code_length (int): Length of the longest Morse code in the table.
+        token_trie (Dict[str, Any]): Trie of multi-character tokens such as
+            prosigns; the ``None`` key marks the end of a token.
+        token_starts (FrozenSet[str]): First characters of multi-character tokens.
+    """
+    names: Tuple[str, ...]
+    encode: Dict[str, str]
+    decode: Dict[str, str]
+    punctuation: FrozenSet[str]
+    charset: FrozenSet[str]
+    text_pattern: Pattern
+    max_code_length: int
+    token_trie: Dict[str, Any] = field(default_factory=dict)
+    token_starts: FrozenSet[str] = frozenset()
+
+    def has_tokens(self, text: str) -> bool:
+        """Returns True if ``text`` may contain a multi-character token."""
+        return any(char in text for char in self.token_starts)
+
+    def tokenize(self, text: str) -> Iterator[str]:
+        """
+        Splits upper-case text into encodable tokens in a single pass.
+
+        Multi-character tokens are matched longest first; every other
+        character is yielded on its own.
+
+        Parameters:
+            text (str): Upper-case text.
+
+        Yields:
+            str: Tokens, each either a single character or a multi-character token.
+
+        Example:
+            >>> list(compile_table("standard+prosigns").tokenize("K <SK>"))
+            ['K', ' ', '<SK>']
+        """
+        if not self.has_tokens(text):
+            yield from text
+            return
+
+        i = 0
+        length = len(text)
+        while i < length:
+            char = text[i]
+            match_end = 0
+            if char in self.token_starts:
+                node = self.token_trie
+                j = i
+                # Recorrer el trie guardando la coincidencia más larga
+                while j < length and text[j] in node:
+                    node = node[text[j]]
+                    j += 1
+                    if None in node:
+                        match_end = j
+            if match_end:
+                yield text[i:match_end]
+                i = match_end
+            else:
+                yield char
+                i += 1
+
+_REGISTRY: Dict[str, CodeTable] = {}
+
+def register_table(table: CodeTable, replace: bool = False) -> None:
+    """
+    Registers a code table so it can be selected by name.
+
+    Parameters:
+        table (CodeTable): The table to register.
+        replace (bool): Allow replacing an existing table (default: False).
+
+    Raises:
+        ValueError: If a table with the same name exists and ``replace`` is False,
+            or if the table contains invalid Morse codes.
+    """
+    if table.name in _REGISTRY and not replace:
+        raise ValueError(f"Code table '{table.name}' is already registered")
+    for token, code in table.mapping.items():
+        if token != ' ' and (not code or set(code) - {'.', '-'}):
+            raise ValueError(f"Invalid Morse code '{code}' for '{token}' in table '{table.name}'")
+    _REGISTRY[table.name] = table
+    # Las tablas compiladas pueden depender de la tabla reemplazada
+    _compile.cache_clear()
+    logger.debug(f"Registered code table '{table.name}' with {len(table.mapping)} entries")
+
+def get_table(name: str) -> CodeTable:
+    """
+    Returns a registered code table.
+
+    Raises:
+        ValueError: If no table with that name is registered.
+    """
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown code table '{name}'. Available tables: {', '.join(available_tables())}"
+        ) from None
+
+def available_tables() -> List[str]:
+    """Returns the names of all registered code tables."""
+    return sorted(_REGISTRY)
+
+def _parse_spec(spec: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+    """Normalises ``"itu+prosigns"`` or ``["itu", "prosigns"]`` to a tuple of names."""
+    names = spec.split('+') if isinstance(spec, str) else list(spec)
+    names = tuple(name.strip() for name in names if name.strip())
+    if not names:
+        raise ValueError("At least one code table must be selected")
+    return names
+
+@lru_cache(maxsize=None)
+def _compile(names: Tuple[str, ...]) -> CompiledTable:
+    """Builds the encode/decode structures for a tuple of table names."""
+    tables = [get_table(name) for name in names]
+    encode: Dict[str, str] = {}
+    decode: Dict[str, str] = {}
+    punctuation = set()
+    for table in tables:
+        for token, code in table.mapping.items():
+            encode.setdefault(token, code)
+            decode.setdefault(code, token)
+        punctuation |= table.punctuation
+
+    charset = set()
+    token_trie: Dict[str, Any] = {}
+    for token in encode:
+        if token == ' ':
+            continue
+        charset.update(token)
+        charset.update(token.lower())
+        if len(token) > 1:
+            node = token_trie
+            for char in token:
+                node = node.setdefault(char, {})
+            node[None] = token
+    text_pattern = re.compile(
+        '^[' + ''.join(re.escape(char) for char in sorted(charset)) + r'\s]+$'
+    )
+    max_code_length = max((len(code) for token, code in encode.items() if token != ' '), default=0)
+
+    logger.debug(f"Compiled code tables {names}: {len(encode)} tokens")
+    return CompiledTable(
+        names=names,
+        encode=encode,
+        decode=decode,
+        punctuation=frozenset(punctuation),
+        charset=frozenset(charset),
+        text_pattern=text_pattern,
+        max_code_length=max_code_length,
+        token_trie=token_trie,
+        token_starts=frozenset(token_trie),
+    )
+
+def compile_table(spec: Union[str, Sequence[str]] = DEFAULT_TABLE) -> CompiledTable:
+    """
+    Compiles one or more registered tables into encode/decode structures.
+
+    Compilation is cached, so selecting the same tables again is free.
+
+    Parameters:
+        spec (str | Sequence[str]): A table name, several names joined with
+            ``+`` (e.g. ``"itu+prosigns"``) or a sequence of names.
+
+    Returns:
+        CompiledTable: The compiled structures.
+
+    Raises:
+        ValueError: If a table name is unknown.
+
+    Example:
+        >>> compile_table("itu").encode['A']
+        '.-'
+    """
+    return _compile(_parse_spec(spec))
+
+_LATIN = {
+    'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.',
+    'F': '..-.', 'G': '--.', 'H': '....', 'I': '..', 'J': '.---',
+    'K': '-.-', 'L': '.-..', 'M': '--', 'N': '-.', 'O': '---',
+    'P': '.--.', 'Q': '--.-', 'R': '.-.', 'S': '...', 'T': '-',
+    'U': '..-', 'V': '...-', 'W': '.--', 'X': '-..-', 'Y': '-.--',
+    'Z': '--..',
+}
+
+_DIGITS = {
+    '0': '-----', '1': '.----', '2': '..---', '3': '...--', '4': '....-',
+    '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.',
+}
+
+register_table(CodeTable(
+    name="standard",
+    mapping={**_LATIN, **_DIGITS, ' ': ' ',
+             '.': '.-.-.-', ',': '--..--', '?': '..--..', '!': '-.-.--',
+             '@': '.--.-.'},
+    punctuation=frozenset('.!?@,'),
+    description="Latin letters, digits and basic punctuation",
+))
+
+register_table(CodeTable(
+    name="itu",
+    mapping={**_LATIN, **_DIGITS,
+             '.': '.-.-.-', ',': '--..--', ':': '---...', '?': '..--..',
+             "'": '.----.', '-': '-....-', '/': '-..-.', '(': '-.--.',
+             ')': '-.--.-', '"': '.-..-.', '=': '-...-', '+': '.-.-.',
+             '@': '.--.-.', '&': '.-...', '!': '-.-.--', ';': '-.-.-.',
+             '_': '..--.-', '$': '...-..-'},
+    description="ITU-R M.1677 letters, digits and full punctuation",
+))
+
+register_table(CodeTable(
+    name="latin",
+    mapping={'À': '.--.-', 'Å': '.--.-', 'Ä': '.-.-', 'Æ': '.-.-',
+             'Ç': '-.-..', 'Ð': '..--.', 'È': '.-..-', 'É': '..-..',
+             'Ĝ': '--.-.', 'Ĥ': '----', 'Ĵ': '.---.', 'Ñ': '--.--',
+             'Ö': '---.', 'Ø': '---.', 'Ŝ': '...-.', 'Þ': '.--..',
+             'Ü': '..--', 'Ŭ': '..--'},
+    description="Accented and extended Latin letters",
+))
+
+register_table(CodeTable(
+    name="cyrillic",
+    mapping={'А': '.-', 'Б': '-...', 'В': '.--', 'Г': '--.', 'Д': '-..',
+             'Е': '.', 'Ж': '...-', 'З': '--..', 'И': '..', 'Й': '.---',
+             'К': '-.-', 'Л': '.-..', 'М': '--', 'Н': '-.', 'О': '---',
+             'П': '.--.', 'Р': '.-.', 'С': '...', 'Т': '-', 'У': '..-',
+             'Ф': '..-.', 'Х': '....', 'Ц': '-.-.', 'Ч': '---.', 'Ш': '----',
+             'Щ': '--.-', 'Ъ': '--.--', 'Ы': '-.--', 'Ь': '-..-', 'Э': '..-..',
+             'Ю': '..--', 'Я': '.-.-'},
+    description="Russian Cyrillic alphabet",
+))
+
+register_table(CodeTable(
+    name="greek",
+    mapping={'Α': '.-', 'Β': '-...', 'Γ': '--.', 'Δ': '-..', 'Ε': '.',
+             'Ζ': '--..', 'Η': '....', 'Θ': '-.-.', 'Ι': '..', 'Κ': '-.-',
+             'Λ': '.-..', 'Μ': '--', 'Ν': '-.', 'Ξ': '-..-', 'Ο': '---',
+             'Π': '.--.', 'Ρ': '.-.', 'Σ': '...', 'Τ': '-', 'Υ': '-.--',
+             'Φ': '..-.', 'Χ': '----', 'Ψ': '--.-', 'Ω': '.--'},
+    description="Greek alphabet",
+))
+
+register_table(CodeTable(
+    name="wabun",
+    mapping={'イ': '.-', 'ロ': '.-.-', 'ハ': '-...', 'ニ': '-.-.', 'ホ': '-..',
+             'ヘ': '.', 'ト': '..-..', 'チ': '..-.', 'リ': '--.', 'ヌ': '....',
+             'ル': '-.--.', 'ヲ': '.---', 'ワ': '-.-', 'カ': '.-..', 'ヨ': '--',
+             'タ': '-.', 'レ': '---', 'ソ': '---.', 'ツ': '.--.', 'ネ': '--.-',
+             'ナ': '.-.', 'ラ': '...', 'ム': '-', 'ウ': '..-', 'ヰ': '.-..-',
+             'ノ': '..--', 'オ': '.-...', 'ク': '...-', 'ヤ': '.--', 'マ': '-..-',
+             'ケ': '-.--', 'フ': '--..', 'コ': '----', 'エ': '-.---', 'テ': '.-.--',
+             'ア': '--.--', 'サ': '-.-.-', 'キ': '-.-..', 'ユ': '-..--', 'メ': '-...-',
+             'ミ': '..-.-', 'シ': '--.-.', 'ヱ': '.--..', 'ヒ': '--..-', 'モ': '-..-.',
+             'セ': '.---.', 'ス': '---.-', 'ン': '.-.-.', '゛': '..', '゜': '..--.',
+             'ー': '.--.-', '、': '.-.-.-', '」': '.-.-..', '（': '-.--.-', '）': '.-..-.'},
+    description="Japanese Wabun code (katakana)",
+))
+
+register_table(CodeTable(
+    name="prosigns",
+    mapping={'<AR>': '.-.-.', '<AS>': '.-...', '<BK>': '-...-.-', '<BT>': '-...-',
+             '<CL>': '-.-..-..', '<CT>': '-.-.-', '<DO>': '-..---', '<HH>': '........',
+             '<KN>': '-.--.', '<SK>': '...-.-', '<SN>': '...-.', '<SOS>': '...---...'},
+    description="Procedural signals sent as one run-together character",
+))
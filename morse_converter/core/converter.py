@@ -1,8 +1,16 @@
+from types import MappingProxyType
+from typing import Iterable, List, Sequence, Union
+from morse_converter.core.bulk import build_decode_table, build_encode_table, decode_batch, encode_batch
+from morse_converter.core.code_tables import DEFAULT_TABLE, compile_table
+from morse_converter.core.packing import build_key_table, decode_elements, pack_morse, unpack_elements
 from morse_converter.utils import setup_logger
+from morse_converter.utils.metrics import metrics
 
 # Configurar logger para este módulo
 logger = setup_logger(__name__)
 
+BytesLike = Union[bytes, bytearray, memoryview]
+
 class MorseConverter:
     """
     Main conversion engine for text-to-Morse and Morse-to-text operations.
@@ -13,28 +21,70 @@ class MorseConverter:
         
         morse_to_text(morse: str) -> str
             Converts Morse code to plain text.
+
+        set_table(table: str | Sequence[str]) -> None
+            Switches the code table used for conversion.
+
+        encode_bytes(data: bytes) -> bytes
+            Converts UTF-8 text bytes to ASCII Morse bytes.
+
+        decode_bytes(data: bytes) -> bytes
+            Converts ASCII Morse bytes to UTF-8 text bytes.
+
+        text_to_packed(text: str) -> bytes
+            Converts plain text to binary-packed Morse code.
+
+        packed_to_text(data: bytes) -> str
+            Converts binary-packed Morse code to plain text.
+
+        encode_many(texts: Iterable[str]) -> List[str]
+            Converts a batch of texts to Morse code.
+
+        decode_many(morse_codes: Iterable[str]) -> List[str]
+            Converts a batch of Morse code strings to text.
     """
-    # Dictionary to store the Morse code for each letter
-    MORSE_CODE_DICT = {
-        'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.',
-        'F': '..-.', 'G': '--.', 'H': '....', 'I': '..', 'J': '.---',
-        'K': '-.-', 'L': '.-..', 'M': '--', 'N': '-.', 'O': '---',
-        'P': '.--.', 'Q': '--.-', 'R': '.-.', 'S': '...', 'T': '-',
-        'U': '..-', 'V': '...-', 'W': '.--', 'X': '-..-', 'Y': '-.--',
-        'Z': '--..', '0': '-----', '1': '.----', '2': '..---',
-        '3': '...--', '4': '....-', '5': '.....', '6': '-....',
-        '7': '--...', '8': '---..', '9': '----.', ' ': ' ',
-        '.': '.-.-.-', ',': '--..--', '?': '..--..', '!': '-.-.--',
-        '@': '.--.-.'
-    }
+    # Dictionary to store the Morse code for each letter (read-only, shared by every instance)
+    MORSE_CODE_DICT = MappingProxyType(dict(compile_table(DEFAULT_TABLE).encode))
     
     # Crear diccionario inverso para la conversión de Morse a texto
-    MORSE_TO_TEXT = {value: key for key, value in MORSE_CODE_DICT.items()}
+    MORSE_TO_TEXT = MappingProxyType({value: key for key, value in MORSE_CODE_DICT.items()})
+
+    def __init__(self, table: Union[str, Sequence[str]] = DEFAULT_TABLE):
+        """
+        Initialize the MorseConverter.
+
+        Parameters:
+            table (str | Sequence[str]): Code table(s) to use, e.g. ``"itu"`` or
+                ``"itu+prosigns"`` (default: "standard")
+        """
+        self.set_table(table)
+
+    def set_table(self, table: Union[str, Sequence[str]]) -> None:
+        """
+        Switches the code table used for conversion.
+
+        Compiled tables are cached, so switching back and forth is cheap.
+
+        Parameters:
+            table (str | Sequence[str]): Code table(s) to use.
+
+        Raises:
+            ValueError: If a table name is unknown.
+        """
+        self.table = compile_table(table)
+        # Los diccionarios compilados se comparten entre convertidores: sólo lectura
+        self.MORSE_CODE_DICT = MappingProxyType(self.table.encode)
+        self.MORSE_TO_TEXT = MappingProxyType(self.table.decode)
+        self._key_table = None
+        # Tablas de búsqueda para conversión por lotes, creadas bajo demanda
+        self._bulk_tables = {}
+        logger.debug(f"Using code tables: {'+'.join(self.table.names)}")
 
     def _is_punctuation(self, char: str) -> bool:
         """Helper method to check if a character is punctuation."""
-        return char in '.!?@,'
+        return char in self.table.punctuation
 
+    @metrics.timed("converter.text_to_morse")
     def text_to_morse(self, text: str) -> str:
         """
         Converts plain text to Morse code.
@@ -48,6 +98,10 @@ class MorseConverter:
         Raises:
             TypeError: If input is not a string
             ValueError: If the input text contains unsupported characters.
+
+        Example:
+            >>> MorseConverter("standard+prosigns").text_to_morse("CQ <SK>")
+            '-.-. --.-  ...-.-'
         """
         logger.info(f"Converting text to Morse: {text}")
         try:
@@ -64,7 +118,9 @@ class MorseConverter:
             words = []
             current_word = []
             
-            for i, char in enumerate(text):
+            # Los tokens de varios caracteres (p. ej. prosignos) usan el tokenizador
+            tokens = self.table.tokenize(text) if self.table.token_starts else text
+            for char in tokens:
                 logger.debug(f"Processing character: {char}")
                 if char == ' ':
                     if current_word:
@@ -94,12 +150,15 @@ class MorseConverter:
             
             result = '  '.join(words)
             logger.info(f"Conversion completed successfully: {result}")
+            metrics.increment("chars_encoded_total", len(text))
             return result
 
         except Exception as e:
             logger.error(f"Text to Morse conversion failed: {str(e)}")
+            metrics.increment("errors_total", component="converter", type=type(e).__name__)
             raise
 
+    @metrics.timed("converter.morse_to_text")
     def morse_to_text(self, morse: str) -> str:
         """
         Converts Morse code to plain text.
@@ -159,8 +218,175 @@ class MorseConverter:
             
             final_result = ' '.join(result)
             logger.info(f"Conversion completed successfully: {final_result}")
+            metrics.increment("chars_decoded_total", len(final_result))
             return final_result
 
         except Exception as e:
             logger.error(f"Morse to text conversion failed: {str(e)}")
+            metrics.increment("errors_total", component="converter", type=type(e).__name__)
+            raise
+
+    def encode_bytes(self, data: BytesLike) -> bytes:
+        """
+        Converts UTF-8 encoded text to ASCII encoded Morse code.
+
+        Parameters:
+            data (bytes | bytearray | memoryview): UTF-8 encoded text.
+
+        Returns:
+            bytes: The Morse code as ASCII bytes.
+
+        Raises:
+            ValueError: If the data is not valid UTF-8 or contains unsupported characters.
+        """
+        try:
+            text = bytes(data).decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Input is not valid UTF-8: {str(e)}") from e
+        return self.text_to_morse(text).encode('ascii')
+
+    def decode_bytes(self, data: BytesLike) -> bytes:
+        """
+        Converts ASCII encoded Morse code to UTF-8 encoded text.
+
+        Parameters:
+            data (bytes | bytearray | memoryview): Morse code as ASCII bytes.
+
+        Returns:
+            bytes: The decoded text as UTF-8 bytes.
+
+        Raises:
+            ValueError: If the data is not ASCII or contains invalid Morse code.
+        """
+        try:
+            morse = bytes(data).decode('ascii')
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Invalid Morse code characters: {str(e)}") from e
+        return self.morse_to_text(morse).encode('utf-8')
+
+    def text_to_packed(self, text: str) -> bytes:
+        """
+        Converts plain text to binary-packed Morse code (2 bits per element).
+
+        Parameters:
+            text (str): The text to be converted.
+
+        Returns:
+            bytes: Packed Morse code, see ``morse_converter.core.packing``.
+
+        Raises:
+            TypeError: If input is not a string
+            ValueError: If the input text contains unsupported characters.
+        """
+        return pack_morse(self.text_to_morse(text))
+
+    @metrics.timed("converter.packed_to_text")
+    def packed_to_text(self, data: BytesLike) -> str:
+        """
+        Converts binary-packed Morse code to plain text.
+
+        Letters are looked up by their integer key straight from the packed
+        elements, without building an intermediate Morse string.
+
+        Parameters:
+            data (bytes | bytearray | memoryview): Packed Morse code.
+
+        Returns:
+            str: The decoded text.
+
+        Raises:
+            ValueError: If the data is truncated or contains unknown letters.
+        """
+        logger.info(f"Decoding {len(data)} bytes of packed Morse code")
+        try:
+            if self._key_table is None:
+                self._key_table = build_key_table(self.MORSE_TO_TEXT)
+            result = decode_elements(unpack_elements(data), self._key_table)
+            logger.info(f"Decoded {len(result)} characters from packed Morse code")
+            metrics.increment("chars_decoded_total", len(result))
+            return result
+
+        except Exception as e:
+            logger.error(f"Packed Morse decoding failed: {str(e)}")
+            metrics.increment("errors_total", component="converter", type=type(e).__name__)
+            raise
+
+    @metrics.timed("converter.encode_many")
+    def encode_many(self, texts: Iterable[str]) -> List[str]:
+        """
+        Converts a batch of texts to Morse code in one call.
+
+        ASCII batches are encoded with NumPy lookup tables over one
+        concatenated buffer; other batches fall back to ``text_to_morse``
+        per record. Results are identical to calling ``text_to_morse`` on
+        each record.
+
+        Parameters:
+            texts (Iterable[str]): The texts to convert.
+
+        Returns:
+            List[str]: Morse code per input text, in the original order.
+
+        Raises:
+            TypeError: If a record is not a string
+            ValueError: If a record contains unsupported characters.
+
+        Example:
+            >>> MorseConverter().encode_many(["SOS", "EA1ABC"])
+            ['... --- ...', '. .- .---- .- -... -.-.']
+        """
+        records = texts if isinstance(texts, list) else list(texts)
+        logger.info(f"Converting batch of {len(records)} texts to Morse")
+        try:
+            if 'encode' not in self._bulk_tables:
+                self._bulk_tables['encode'] = build_encode_table(self.table)
+            table = self._bulk_tables['encode']
+            result = encode_batch(records, table) if table is not None else None
+            if result is None:
+                logger.debug("Batch needs per-record encoding")
+                result = [self.text_to_morse(text) for text in records]
+            else:
+                metrics.increment("chars_encoded_total", sum(map(len, records)))
+            logger.info(f"Batch conversion completed: {len(result)} records")
+            return result
+
+        except Exception as e:
+            logger.error(f"Batch text to Morse conversion failed: {str(e)}")
+            metrics.increment("errors_total", component="converter", type=type(e).__name__)
+            raise
+
+    @metrics.timed("converter.decode_many")
+    def decode_many(self, morse_codes: Iterable[str]) -> List[str]:
+        """
+        Converts a batch of Morse code strings to text in one call.
+
+        Results are identical to calling ``morse_to_text`` on each record.
+
+        Parameters:
+            morse_codes (Iterable[str]): The Morse code strings to convert.
+
+        Returns:
+            List[str]: Text per input string, in the original order.
+
+        Raises:
+            TypeError: If a record is not a string
+            ValueError: If a record contains invalid Morse code.
+        """
+        records = morse_codes if isinstance(morse_codes, list) else list(morse_codes)
+        logger.info(f"Converting batch of {len(records)} Morse strings to text")
+        try:
+            if 'decode' not in self._bulk_tables:
+                self._bulk_tables['decode'] = build_decode_table(self.table)
+            result = decode_batch(records, self._bulk_tables['decode'])
+            if result is None:
+                logger.debug("Batch needs per-record decoding")
+                result = [self.morse_to_text(morse) for morse in records]
+            else:
+                metrics.increment("chars_decoded_total", sum(map(len, result)))
+            logger.info(f"Batch conversion completed: {len(result)} records")
+            return result
+
+        except Exception as e:
+            logger.error(f"Batch Morse to text conversion failed: {str(e)}")
+            metrics.increment("errors_total", component="converter", type=type(e).__name__)
             raise
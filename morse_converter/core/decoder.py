@@ -0,0 +1,477 @@
+import numpy as np
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+from morse_converter.core.audio import AudioError, read_wav
+from morse_converter.core.converter import MorseConverter
+from morse_converter.utils import setup_logger
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+@lru_cache(maxsize=32)
+def _reference_tones(frequencies: Tuple[float, ...], sample_rate: int, block_size: int) -> np.ndarray:
+    """Builds the windowed, amplitude-normalised DFT reference matrix."""
+    window = np.hanning(block_size)
+    n = np.arange(block_size)
+    freqs = np.asarray(frequencies)
+    reference = window[:, None] * np.exp(
+        -2j * np.pi * n[:, None] * freqs[None, :] / sample_rate
+    )
+    reference *= 2.0 / window.sum()
+    reference.flags.writeable = False
+    return reference
+
+def block_magnitudes(
+    samples: np.ndarray,
+    frequencies: Union[float, np.ndarray],
+    sample_rate: int,
+    block_size: int
+) -> np.ndarray:
+    """
+    Measures tone energy per block with a windowed single-bin DFT (Goertzel).
+
+    The samples are cut into non-overlapping blocks and all blocks are
+    correlated against the reference tones in a single matrix product.
+    Trailing samples that do not fill a block are ignored.
+
+    Parameters:
+        samples (np.ndarray): Mono audio samples.
+        frequencies (float | np.ndarray): One frequency or an array of frequencies in Hz.
+        sample_rate (int): Sample rate in Hz.
+        block_size (int): Number of samples per block.
+
+    Returns:
+        np.ndarray: Tone amplitude per block, shape ``(blocks,)`` for a single
+        frequency or ``(blocks, len(frequencies))`` for an array. A full-scale
+        sine at the analysed frequency measures about 1.0.
+    """
+    num_blocks = len(samples) // block_size
+    blocks = np.asarray(samples[:num_blocks * block_size], dtype=np.float64)
+    blocks = blocks.reshape(num_blocks, block_size)
+
+    freqs = tuple(np.atleast_1d(np.asarray(frequencies, dtype=np.float64)).tolist())
+    magnitudes = np.abs(blocks @ _reference_tones(freqs, sample_rate, block_size))
+
+    if np.ndim(frequencies) == 0:
+        return magnitudes[:, 0]
+    return magnitudes
+
+def threshold_keying(levels: np.ndarray, threshold: float = 0.5) -> np.ndarray:
+    """
+    Thresholds a tone envelope into a boolean on/off sequence.
+
+    The threshold sits at ``threshold`` of the way from the noise floor
+    (10th percentile) to the signal peak (99th percentile).
+
+    Parameters:
+        levels (np.ndarray): Tone amplitude per block.
+        threshold (float): Relative threshold position, 0.0-1.0 (default: 0.5).
+
+    Returns:
+        np.ndarray: Keying state per block; all False when no tone is present.
+    """
+    if levels.size == 0:
+        return np.zeros(0, dtype=bool)
+    floor, peak = np.percentile(levels, [10, 99])
+    if peak - floor < 1e-3:
+        logger.debug("No tone detected in input")
+        return np.zeros(levels.size, dtype=bool)
+    return levels > floor + threshold * (peak - floor)
+
+def run_lengths(states: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run-length encodes a boolean on/off sequence.
+
+    Parameters:
+        states (np.ndarray): Boolean keying state per block.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The state of each run and its length.
+    """
+    states = np.asarray(states, dtype=bool)
+    if states.size == 0:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=np.int64)
+    boundaries = np.flatnonzero(states[1:] != states[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    lengths = np.diff(np.concatenate((starts, [states.size])))
+    return states[starts], lengths
+
+def _two_means(values: np.ndarray, iterations: int = 10) -> Tuple[float, float]:
+    """Splits 1-D durations into a short and a long cluster (1-D k-means)."""
+    low, high = float(values.min()), float(values.max())
+    for _ in range(iterations):
+        split = (low + high) / 2
+        short, long_ = values[values <= split], values[values > split]
+        if short.size == 0 or long_.size == 0:
+            break
+        low, high = float(short.mean()), float(long_.mean())
+    return low, high
+
+def estimate_unit(on_lengths: np.ndarray, off_lengths: np.ndarray) -> float:
+    """
+    Estimates the dit length from mark and space durations.
+
+    Marks are clustered into dits and dahs; when only one mark length is
+    present the shortest space (the intra-character gap) disambiguates it.
+
+    Parameters:
+        on_lengths (np.ndarray): Durations of the marks.
+        off_lengths (np.ndarray): Durations of the spaces between marks.
+
+    Returns:
+        float: Estimated dit length, in the same units as the inputs.
+    """
+    low, high = _two_means(np.asarray(on_lengths, dtype=np.float64))
+    if high >= 2 * low:
+        # Dos grupos: promediar el punto y un tercio de la raya
+        return (low + high / 3) / 2
+    if len(off_lengths):
+        gap, _ = _two_means(np.asarray(off_lengths, dtype=np.float64))
+        return min(low, gap)
+    return low
+
+def keying_to_morse(states: np.ndarray, unit: Optional[float] = None) -> str:
+    """
+    Converts a boolean keying sequence into a Morse code string.
+
+    Marks shorter than two units are dots, longer ones dashes. Spaces shorter
+    than two units separate elements, shorter than five separate letters
+    (one space) and anything longer separates words (two spaces).
+
+    Parameters:
+        states (np.ndarray): Boolean keying state per block.
+        unit (float, optional): Dit length in blocks. Estimated when omitted.
+
+    Returns:
+        str: Morse code using the converter's spacing conventions.
+    """
+    values, lengths = run_lengths(states)
+    # Descartar silencios al inicio y al final
+    marks = np.flatnonzero(values)
+    if marks.size == 0:
+        return ""
+    values = values[marks[0]:marks[-1] + 1]
+    lengths = lengths[marks[0]:marks[-1] + 1]
+
+    on_lengths = lengths[values]
+    off_lengths = lengths[~values]
+    if unit is None:
+        unit = estimate_unit(on_lengths, off_lengths)
+    logger.debug(f"Estimated dit length: {unit:.2f} blocks")
+
+    symbols = np.empty(len(values), dtype=object)
+    symbols[values] = np.where(on_lengths >= 2 * unit, '-', '.')
+    symbols[~values] = np.select(
+        [off_lengths < 2 * unit, off_lengths < 5 * unit],
+        ['', ' '],
+        '  '
+    )
+    return ''.join(symbols)
+
+class AudioDecoder:
+    """
+    Decodes Morse code audio (CW) back into text.
+
+    The signal is measured per block at the configured tone frequency,
+    thresholded into on/off keying, run-length encoded and classified with an
+    adaptive dit-length estimate before being handed to ``MorseConverter``.
+
+    Methods:
+        decode(samples: np.ndarray) -> str
+            Decodes audio samples into text.
+        decode_file(file_path: str) -> str
+            Decodes a WAV file into text.
+        decode_morse(samples: np.ndarray) -> str
+            Decodes audio samples into a Morse code string.
+    """
+
+    def __init__(
+        self,
+        frequency: float = 800,
+        sample_rate: int = 44100,
+        block_duration: float = 0.005,
+        threshold: float = 0.5,
+        converter: Optional[MorseConverter] = None
+    ):
+        """
+        Initialize the AudioDecoder.
+
+        Parameters:
+            frequency (float): The tone frequency in Hz to listen on (default: 800)
+            sample_rate (int): The sample rate of the input in Hz (default: 44100)
+            block_duration (float): Analysis block length in seconds (default: 0.005)
+            threshold (float): Keying threshold between noise floor and peak, 0.0-1.0 (default: 0.5)
+            converter (MorseConverter, optional): Converter used for the final Morse-to-text step
+        """
+        logger.debug(f"Initializing AudioDecoder with frequency={frequency}Hz, sample_rate={sample_rate}Hz")
+        self.frequency = frequency
+        self.sample_rate = sample_rate
+        self.block_duration = block_duration
+        self.threshold = threshold
+        self.converter = converter or MorseConverter()
+
+    @property
+    def block_size(self) -> int:
+        """Number of samples per analysis block."""
+        return max(int(self.sample_rate * self.block_duration), 1)
+
+    def envelope(self, samples: np.ndarray, sample_rate: Optional[int] = None) -> np.ndarray:
+        """Returns the tone amplitude per analysis block, at ``sample_rate`` if given."""
+        rate = self.sample_rate if sample_rate is None else sample_rate
+        return block_magnitudes(samples, self.frequency, rate, max(int(rate * self.block_duration), 1))
+
+    def keying(self, samples: np.ndarray, sample_rate: Optional[int] = None) -> np.ndarray:
+        """
+        Thresholds the envelope into a boolean on/off sequence.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples.
+            sample_rate (int, optional): Sample rate of ``samples``; defaults to ``self.sample_rate``.
+
+        Returns:
+            np.ndarray: Keying state per block.
+        """
+        return threshold_keying(self.envelope(samples, sample_rate), self.threshold)
+
+    def decode_morse(self, samples: np.ndarray, sample_rate: Optional[int] = None) -> str:
+        """
+        Decodes audio samples into a Morse code string.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples at ``sample_rate``.
+            sample_rate (int, optional): Sample rate of ``samples``; defaults to ``self.sample_rate``.
+
+        Returns:
+            str: The decoded Morse code.
+
+        Raises:
+            AudioError: If decoding fails.
+        """
+        logger.info(f"Decoding {len(samples)} samples of Morse audio")
+        try:
+            morse = keying_to_morse(self.keying(np.asarray(samples), sample_rate))
+            logger.info(f"Audio decoding completed successfully: {morse}")
+            return morse
+        except Exception as e:
+            logger.error(f"Failed to decode audio: {str(e)}")
+            raise AudioError(f"Failed to decode audio: {str(e)}")
+
+    def decode(self, samples: np.ndarray, sample_rate: Optional[int] = None) -> str:
+        """
+        Decodes audio samples into text.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples at ``sample_rate``.
+            sample_rate (int, optional): Sample rate of ``samples``; defaults to ``self.sample_rate``.
+
+        Returns:
+            str: The decoded text.
+
+        Raises:
+            AudioError: If decoding fails.
+            ValueError: If the decoded Morse code contains unknown sequences.
+        """
+        return self.converter.morse_to_text(self.decode_morse(samples, sample_rate))
+
+    def decode_file(self, file_path: Union[str, Path]) -> str:
+        """
+        Decodes a 16-bit PCM WAV file into text.
+
+        The sample rate is taken from the file; ``self.sample_rate`` is
+        left unchanged.
+
+        Parameters:
+            file_path (str | Path): The WAV file to decode.
+
+        Returns:
+            str: The decoded text.
+
+        Raises:
+            AudioError: If the file cannot be read or decoded.
+        """
+        samples, sample_rate = read_wav(file_path)
+        return self.decode(samples, sample_rate)
+
+class StreamingDecoder:
+    """
+    Block-fed, real-time Morse audio decoder with bounded latency.
+
+    Audio is pushed in arbitrary chunks with ``feed``; characters are returned
+    as soon as the gap after a letter is long enough to be a letter gap. Only
+    a partial analysis block, the current run and the current letter are kept
+    between calls. The keying threshold follows the signal peak and noise
+    floor, and the dit length is re-estimated from every mark and
+    intra-character gap so the decoder tracks a sender whose speed drifts.
+    The first ``WARMUP_BLOCKS`` blocks only calibrate the noise floor, so a
+    mark already in progress when the stream starts may be missed.
+
+    Methods:
+        feed(samples: np.ndarray) -> str
+            Processes a chunk of samples and returns newly decoded characters.
+        flush() -> str
+            Ends the current letter and returns any pending character.
+        reset() -> None
+            Clears all decoding state.
+    """
+
+    # Constante de suavizado para la estimación del punto
+    SPEED_ADAPTATION: float = 0.3
+    # Decaimiento por bloque del pico y suavizado del piso de ruido
+    PEAK_DECAY: float = 0.999
+    FLOOR_SMOOTHING: float = 0.05
+    # Relación mínima pico/ruido para considerar que hay señal
+    MIN_SNR: float = 4.0
+    # Bloques iniciales usados sólo para medir el ruido
+    WARMUP_BLOCKS: int = 16
+
+    def __init__(
+        self,
+        frequency: float = 800,
+        sample_rate: int = 44100,
+        wpm: float = 15,
+        block_duration: float = 0.005,
+        threshold: float = 0.5,
+        converter: Optional[MorseConverter] = None,
+        unknown_char: str = '*'
+    ):
+        """
+        Initialize the StreamingDecoder.
+
+        Parameters:
+            frequency (float): The tone frequency in Hz to listen on (default: 800)
+            sample_rate (int): The sample rate of the input in Hz (default: 44100)
+            wpm (float): Initial speed estimate in words per minute (default: 15)
+            block_duration (float): Analysis block length in seconds (default: 0.005)
+            threshold (float): Keying threshold between noise floor and peak, 0.0-1.0 (default: 0.5)
+            converter (MorseConverter, optional): Converter providing the decoding table
+            unknown_char (str): Character emitted for unknown sequences (default: '*')
+        """
+        logger.debug(f"Initializing StreamingDecoder with frequency={frequency}Hz, sample_rate={sample_rate}Hz")
+        self.frequency = frequency
+        self.sample_rate = sample_rate
+        self.block_duration = block_duration
+        self.threshold = threshold
+        self.unknown_char = unknown_char
+        self.initial_wpm = wpm
+        self._decode_table = (converter or MorseConverter()).MORSE_TO_TEXT
+        self.block_size = max(int(sample_rate * block_duration), 1)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all decoding state."""
+        self._pending = np.zeros(0)
+        self._peak = 0.0
+        self._floor = 0.0
+        self._warmup = 0
+        self._state = False
+        self._run = 0
+        self._unit = 1.2 / self.initial_wpm / self.block_duration
+        self._letter: List[str] = []
+        self._word_open = False
+
+    @property
+    def wpm(self) -> float:
+        """Current speed estimate in words per minute."""
+        return 1.2 / (self._unit * self.block_duration)
+
+    def feed(self, samples: np.ndarray) -> str:
+        """
+        Processes a chunk of samples.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples at ``sample_rate``.
+
+        Returns:
+            str: Characters completed by this chunk (possibly empty). A space
+            is returned once a word gap has been observed.
+        """
+        data = np.concatenate((self._pending, np.asarray(samples, dtype=np.float64)))
+        usable = len(data) - len(data) % self.block_size
+        self._pending = data[usable:]
+        if not usable:
+            return ""
+
+        levels = block_magnitudes(data[:usable], self.frequency, self.sample_rate, self.block_size)
+        output: List[str] = []
+        for level in levels.tolist():
+            key = self._key(level)
+            if key != self._state:
+                if self._state:
+                    self._end_mark(self._run)
+                else:
+                    self._end_gap(self._run)
+                self._state = key
+                self._run = 0
+            self._run += 1
+            if not key:
+                self._check_gap(output)
+        return ''.join(output)
+
+    def flush(self) -> str:
+        """
+        Ends the current letter, e.g. at the end of a transmission.
+
+        Returns:
+            str: The pending character, if any.
+        """
+        if self._state:
+            self._end_mark(self._run)
+            self._state = False
+            self._run = 0
+        output: List[str] = []
+        self._emit_letter(output)
+        return ''.join(output)
+
+    def _key(self, level: float) -> bool:
+        """Updates the level trackers and returns the keying state."""
+        if self._warmup < self.WARMUP_BLOCKS:
+            self._warmup += 1
+            self._floor += (level - self._floor) / self._warmup
+            return False
+        self._peak = max(level, self._peak * self.PEAK_DECAY)
+        key = (
+            self._peak - self._floor >= 1e-3
+            and self._peak >= self.MIN_SNR * self._floor
+            and level > self._floor + self.threshold * (self._peak - self._floor)
+        )
+        if not key:
+            # El piso de ruido sólo se mide con la portadora apagada
+            self._floor += (level - self._floor) * self.FLOOR_SMOOTHING
+        return key
+
+    def _end_mark(self, length: int) -> None:
+        """Classifies a completed mark and adapts the dit estimate."""
+        if length >= 2 * self._unit:
+            self._letter.append('-')
+            sample = length / 3
+        else:
+            self._letter.append('.')
+            sample = length
+        self._unit += self.SPEED_ADAPTATION * (sample - self._unit)
+
+    def _end_gap(self, length: int) -> None:
+        """Adapts the dit estimate from intra-character gaps (one unit long)."""
+        if length < 2 * self._unit:
+            self._unit += self.SPEED_ADAPTATION * (length - self._unit)
+
+    def _check_gap(self, output: List[str]) -> None:
+        """Emits a letter or word separator once the running gap is long enough."""
+        if self._letter and self._run >= 2 * self._unit:
+            self._emit_letter(output)
+        elif self._word_open and self._run >= 5 * self._unit:
+            output.append(' ')
+            self._word_open = False
+
+    def _emit_letter(self, output: List[str]) -> None:
+        """Decodes the current letter into ``output``."""
+        if not self._letter:
+            return
+        code = ''.join(self._letter)
+        self._letter = []
+        char = self._decode_table.get(code)
+        if char is None:
+            logger.warning(f"Unknown Morse sequence in stream: '{code}'")
+            char = self.unknown_char
+        output.append(char)
+        self._word_open = True
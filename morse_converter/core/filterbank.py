@@ -0,0 +1,194 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.decoder import block_magnitudes, keying_to_morse, threshold_keying
+from morse_converter.utils import setup_logger
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+# Nivel por debajo del cual la entrada se considera silencio (-120 dBFS)
+_SILENCE = 1e-6
+
+class FilterBank:
+    """
+    Goertzel filter bank for decoding many Morse channels at once.
+
+    Every candidate tone frequency is evaluated over the same blocks in one
+    matrix product, active carriers are picked from the per-frequency levels,
+    and each carrier's on/off stream is decoded independently with the same
+    pipeline as ``AudioDecoder``. Carriers are picked over blocks long enough
+    to resolve neighbouring candidates, while keying uses the short blocks.
+
+    Methods:
+        magnitudes(samples: np.ndarray) -> np.ndarray
+            Returns the tone level per block and candidate frequency.
+        detect_carriers(samples: np.ndarray) -> List[float]
+            Returns the frequencies carrying a signal.
+        keying(samples: np.ndarray) -> Dict[float, np.ndarray]
+            Returns the on/off stream of every active carrier.
+        decode_channels(samples: np.ndarray) -> Dict[float, str]
+            Decodes every active carrier into text.
+    """
+
+    def __init__(
+        self,
+        frequencies: Optional[Sequence[float]] = None,
+        sample_rate: int = 44100,
+        block_duration: float = 0.01,
+        min_frequency: float = 300,
+        max_frequency: float = 1500,
+        spacing: float = 50,
+        min_snr: float = 6.0,
+        threshold: float = 0.5,
+        floor: float = 0.01,
+        converter: Optional[MorseConverter] = None
+    ):
+        """
+        Initialize the FilterBank.
+
+        Parameters:
+            frequencies (Sequence[float], optional): Candidate tone frequencies in Hz.
+                Defaults to a grid from ``min_frequency`` to ``max_frequency``.
+            sample_rate (int): The sample rate of the input in Hz (default: 44100)
+            block_duration (float): Analysis block length in seconds (default: 0.01)
+            min_frequency (float): Lowest grid frequency in Hz (default: 300)
+            max_frequency (float): Highest grid frequency in Hz (default: 1500)
+            spacing (float): Grid spacing in Hz (default: 50)
+            min_snr (float): Minimum carrier level over the band noise floor (default: 6.0)
+            threshold (float): Keying threshold between noise floor and peak, 0.0-1.0 (default: 0.5)
+            floor (float): Lowest noise floor relative to the strongest carrier, to ignore
+                its side lobes (default: 0.01, i.e. -40 dB)
+            converter (MorseConverter, optional): Converter used for the final Morse-to-text step
+        """
+        if frequencies is None:
+            frequencies = np.arange(min_frequency, max_frequency + spacing / 2, spacing)
+        self.frequencies = np.asarray(frequencies, dtype=np.float64)
+        if self.frequencies.ndim != 1 or self.frequencies.size == 0:
+            raise ValueError("At least one candidate frequency is required")
+        logger.debug(f"Initializing FilterBank with {self.frequencies.size} frequencies, sample_rate={sample_rate}Hz")
+        self.sample_rate = sample_rate
+        self.block_duration = block_duration
+        self.min_snr = min_snr
+        self.threshold = threshold
+        self.floor = floor
+        self.converter = converter or MorseConverter()
+
+    @property
+    def block_size(self) -> int:
+        """Number of samples per analysis block."""
+        return max(int(self.sample_rate * self.block_duration), 1)
+
+    @property
+    def detection_block_size(self) -> int:
+        """
+        Number of samples per block when picking the active carriers.
+
+        The main lobe of the Hann window spans ``2 * sample_rate / size`` Hz
+        on each side of a tone, so the block is at least long enough to keep
+        the nearest candidate frequency outside it.
+        """
+        frequencies = np.unique(self.frequencies)
+        if frequencies.size < 2:
+            return self.block_size
+        spacing = float(np.diff(frequencies).min())
+        return max(self.block_size, int(np.ceil(2 * self.sample_rate / spacing)))
+
+    def magnitudes(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Evaluates every candidate frequency over the sample stream.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples.
+
+        Returns:
+            np.ndarray: Tone amplitude with shape ``(blocks, frequencies)``.
+        """
+        return block_magnitudes(samples, self.frequencies, self.sample_rate, self.block_size)
+
+    def _active_columns(self, samples: np.ndarray) -> np.ndarray:
+        """Returns the indices of candidate frequencies carrying a signal."""
+        levels = block_magnitudes(samples, self.frequencies, self.sample_rate, self.detection_block_size)
+        if levels.shape[0] == 0:
+            return np.zeros(0, dtype=np.intp)
+        peaks = np.percentile(levels, 99, axis=0)
+        strongest = float(peaks.max())
+        if strongest <= _SILENCE:
+            return np.zeros(0, dtype=np.intp)
+        # Ruido de banda: nivel típico de las frecuencias más tranquilas,
+        # nunca por debajo de floor (relativo a la portadora más fuerte)
+        # para ignorar sus lóbulos laterales
+        noise = max(float(np.percentile(np.median(levels, axis=0), 25)), self.floor * strongest)
+
+        # Máximos locales: descartar la fuga espectral en frecuencias vecinas
+        padded = np.concatenate(([-np.inf], peaks, [-np.inf]))
+        local_max = (peaks > padded[:-2]) & (peaks >= padded[2:])
+        return np.flatnonzero(local_max & (peaks >= self.min_snr * noise))
+
+    def detect_carriers(self, samples: np.ndarray) -> List[float]:
+        """
+        Detects which candidate frequencies carry a signal.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples.
+
+        Returns:
+            List[float]: Active carrier frequencies in Hz, ascending.
+        """
+        columns = self._active_columns(samples)
+        carriers = self.frequencies[columns].tolist()
+        logger.info(f"Detected {len(carriers)} active carriers: {carriers}")
+        return carriers
+
+    def keying(self, samples: np.ndarray) -> Dict[float, np.ndarray]:
+        """
+        Returns the on/off keying of every active carrier.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples.
+
+        Returns:
+            Dict[float, np.ndarray]: Keying state per block for each carrier frequency.
+        """
+        levels = self.magnitudes(samples)
+        return {
+            float(self.frequencies[column]): threshold_keying(levels[:, column], self.threshold)
+            for column in self._active_columns(samples)
+        }
+
+    def decode_channels_morse(self, samples: np.ndarray) -> Dict[float, str]:
+        """
+        Decodes every active carrier into a Morse code string.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples.
+
+        Returns:
+            Dict[float, str]: Morse code per carrier frequency.
+        """
+        return {
+            frequency: keying_to_morse(states)
+            for frequency, states in self.keying(samples).items()
+        }
+
+    def decode_channels(self, samples: np.ndarray) -> Dict[float, str]:
+        """
+        Decodes every active carrier into text.
+
+        Channels whose Morse code contains unknown sequences are logged and
+        left out of the result.
+
+        Parameters:
+            samples (np.ndarray): Mono audio samples.
+
+        Returns:
+            Dict[float, str]: Decoded text per carrier frequency.
+        """
+        logger.info(f"Decoding {len(samples)} samples across {self.frequencies.size} frequencies")
+        decoded: Dict[float, str] = {}
+        for frequency, morse in self.decode_channels_morse(samples).items():
+            try:
+                decoded[frequency] = self.converter.morse_to_text(morse)
+            except ValueError as e:
+                logger.warning(f"Could not decode channel at {frequency}Hz: {str(e)}")
+        return decoded
@@ -0,0 +1,247 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, NamedTuple, Optional, Tuple
+from morse_converter.core.converter import MorseConverter
+from morse_converter.utils import setup_logger
+from morse_converter.utils.metrics import metrics
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+DEFAULT_BLOCK_SIZE = 2048  # caracteres de texto por bloque
+
+# Separador de palabras en la salida Morse
+_WORD_GAP = '  '
+
+class MorsePatch(NamedTuple):
+    """
+    A change to the Morse output.
+
+    Applying it as ``old[:start] + replacement + old[end:]`` gives the new output.
+
+    Attributes:
+        start (int): First changed offset in the previous output.
+        end (int): End of the replaced span in the previous output.
+        replacement (str): The new Morse code for the span.
+    """
+    start: int
+    end: int
+    replacement: str
+
+    def apply(self, morse: str) -> str:
+        """Applies the patch to the previous output."""
+        return morse[:self.start] + self.replacement + morse[self.end:]
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Returns the length of the common prefix, comparing slices by bisection."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+class IncrementalConverter:
+    """
+    Keeps the Morse conversion of a document up to date as it is edited.
+
+    The document is stored as blocks of whole words together with the Morse
+    code of every block, so an edit only re-encodes the blocks it touches and
+    the cost follows the size of the edit, not of the document. The output is
+    always identical to ``MorseConverter.text_to_morse`` on the full text.
+
+    Methods:
+        load(text: str) -> str
+            Converts a new document from scratch.
+        apply_edit(start: int, end: int, replacement: str) -> MorsePatch
+            Replaces a span of the text and re-encodes the affected words.
+        update(text: str) -> MorsePatch
+            Applies the difference between the current and a new version.
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        converter: Optional[MorseConverter] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE
+    ):
+        """
+        Initialize the IncrementalConverter.
+
+        Parameters:
+            text (str): Initial document (default: empty)
+            converter (MorseConverter, optional): Converter used to encode words
+            block_size (int): Target block size in characters (default: 2048)
+        """
+        if block_size <= 0:
+            raise ValueError("Block size must be positive")
+        self.converter = converter or MorseConverter()
+        self.block_size = block_size
+        # Cada bloque termina en espacio (o al final del documento); la salida
+        # de cada palabra termina con el separador de palabras
+        self._texts: List[str] = []
+        self._morses: List[str] = []
+        self._text_ends: Optional[List[int]] = None
+        self.load(text)
+
+    @property
+    def text(self) -> str:
+        """The current document."""
+        return ''.join(self._texts)
+
+    @property
+    def morse(self) -> str:
+        """The Morse code of the current document."""
+        return ''.join(self._morses)[:-len(_WORD_GAP)]
+
+    def __len__(self) -> int:
+        """Length of the current document in characters."""
+        ends = self._ends()
+        return ends[-1] if ends else 0
+
+    def _ends(self) -> List[int]:
+        """Returns the text offset where every block ends."""
+        if self._text_ends is None:
+            self._text_ends = list(accumulate(map(len, self._texts)))
+        return self._text_ends
+
+    def _encode_blocks(self, text: str) -> Tuple[List[str], List[str]]:
+        """
+        Splits text into blocks ending at a space and encodes them.
+
+        Raises:
+            ValueError: If the text contains unsupported characters.
+        """
+        texts: List[str] = []
+        start = 0
+        while start < len(text):
+            end = start + self.block_size
+            if end < len(text):
+                space = text.find(' ', end - 1)
+                end = len(text) if space < 0 else space + 1
+            texts.append(text[start:end])
+            start = end
+
+        words = [block.split(' ') for block in texts]
+        encoded = iter(self.converter.encode_many([w for block in words for w in block if w]))
+        morses = [''.join(next(encoded) + _WORD_GAP for w in block if w) for block in words]
+        return texts, morses
+
+    @metrics.timed("incremental.load")
+    def load(self, text: str) -> str:
+        """
+        Converts a new document from scratch.
+
+        Parameters:
+            text (str): The document.
+
+        Returns:
+            str: The Morse code of the document.
+
+        Raises:
+            TypeError: If text is not a string
+            ValueError: If the text contains unsupported characters.
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input must be a string")
+        logger.info(f"Loading document of {len(text)} characters")
+        self._texts, self._morses = self._encode_blocks(text)
+        self._text_ends = None
+        return self.morse
+
+    @metrics.timed("incremental.apply_edit")
+    def apply_edit(self, start: int, end: int, replacement: str) -> MorsePatch:
+        """
+        Replaces ``text[start:end]`` with ``replacement``.
+
+        Only the blocks containing the edit (and a neighbour when the edit
+        touches a block boundary) are re-encoded.
+
+        Parameters:
+            start (int): Start of the replaced span.
+            end (int): End of the replaced span.
+            replacement (str): The new text for the span.
+
+        Returns:
+            MorsePatch: The change to apply to the previous Morse output.
+
+        Raises:
+            TypeError: If replacement is not a string
+            ValueError: If the span is out of range or the new text contains
+                unsupported characters. The document is left unchanged.
+
+        Example:
+            >>> doc = IncrementalConverter("HELLO WORLD")
+            >>> doc_morse = doc.morse
+            >>> doc.apply_edit(6, 11, "THERE").apply(doc_morse) == doc.morse
+            True
+        """
+        if not isinstance(replacement, str):
+            raise TypeError("Replacement must be a string")
+        length = len(self)
+        if not 0 <= start <= end <= length:
+            raise ValueError(f"Invalid edit span {start}:{end} for document of length {length}")
+        logger.debug(f"Applying edit {start}:{end} with {len(replacement)} characters")
+
+        ends = self._ends()
+        count = len(self._texts)
+        # Bloques afectados: el que contiene el inicio hasta el que contiene el final
+        first = min(bisect_right(ends, start), count - 1) if count else 0
+        last = min(bisect_right(ends, max(end - 1, start)), count - 1) if count else -1
+        # Si se borra el espacio final de un bloque, la palabra se une a la siguiente
+        if last >= 0 and end == ends[last] and last + 1 < count:
+            last += 1
+        offset = ends[first - 1] if first > 0 else 0
+        segment = ''.join(self._texts[first:last + 1])
+        segment = segment[:start - offset] + replacement + segment[end - offset:]
+
+        texts, morses = self._encode_blocks(segment)
+        patch = self._patch(first, last, morses)
+        self._texts[first:last + 1] = texts
+        self._morses[first:last + 1] = morses
+        self._text_ends = None
+        metrics.increment("incremental_blocks_reencoded_total", len(texts))
+        return patch
+
+    def _patch(self, first: int, last: int, new_morses: List[str]) -> MorsePatch:
+        """Computes the output patch for replacing blocks ``first..last``."""
+        start = sum(map(len, self._morses[:first]))
+        old = ''.join(self._morses[first:last + 1])
+        new = ''.join(new_morses)
+        gap = len(_WORD_GAP)
+        if not any(self._morses[last + 1:]):
+            # La región llega al final: la salida no termina en separador
+            if not (old and new) and start:
+                # Se añade o se quita el separador anterior, que siempre es _WORD_GAP
+                start -= gap
+                old, new = _WORD_GAP + old, _WORD_GAP + new
+            old, new = old[:-gap], new[:-gap]
+
+        # Reducir el parche a la parte que cambia realmente
+        common = _common_prefix_length(old, new)
+        limit = min(len(old), len(new)) - common
+        tail = _common_prefix_length(old[::-1][:limit], new[::-1][:limit])
+        return MorsePatch(start + common, start + len(old) - tail, new[common:len(new) - tail])
+
+    def update(self, text: str) -> MorsePatch:
+        """
+        Applies a new version of the whole document.
+
+        The changed span is found from the common prefix and suffix, and only
+        that span is re-encoded.
+
+        Parameters:
+            text (str): The new version of the document.
+
+        Returns:
+            MorsePatch: The change to apply to the previous Morse output.
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input must be a string")
+        current = self.text
+        prefix = _common_prefix_length(current, text)
+        limit = min(len(current), len(text)) - prefix
+        suffix = _common_prefix_length(current[::-1][:limit], text[::-1][:limit])
+        return self.apply_edit(prefix, len(current) - suffix, text[prefix:len(text) - suffix])
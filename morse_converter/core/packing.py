@@ -0,0 +1,231 @@
+import struct
+import numpy as np
+from typing import Dict, List, Tuple, Union
+from morse_converter.utils import setup_logger
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+# Códigos de elemento de 2 bits
+ELEMENT_DOT = 0
+ELEMENT_DASH = 1
+ELEMENT_LETTER_GAP = 2
+ELEMENT_WORD_GAP = 3
+
+# Cabecera: número de elementos como entero de 64 bits little-endian
+_HEADER = struct.Struct('<Q')
+
+_DOT, _DASH, _SPACE = ord('.'), ord('-'), ord(' ')
+
+# Tabla de elementos a bytes ASCII; el hueco de palabra ocupa dos espacios
+_ELEMENT_CHARS = np.array([_DOT, _DASH, _SPACE, _SPACE], dtype=np.uint8)
+_ELEMENT_WIDTHS = np.array([1, 1, 1, 2], dtype=np.intp)
+
+MorseInput = Union[str, bytes, bytearray, memoryview]
+
+def to_elements(morse: MorseInput) -> np.ndarray:
+    """
+    Converts a Morse string into element codes.
+
+    A single space is a letter gap and a run of two or more spaces is a word
+    gap. Leading and trailing spaces are ignored.
+
+    Parameters:
+        morse (str | bytes): Morse code using '.', '-' and spaces.
+
+    Returns:
+        np.ndarray: Element codes (``uint8``), one per dot, dash or gap.
+
+    Raises:
+        ValueError: If the input contains characters other than '.', '-' and ' '.
+    """
+    if isinstance(morse, str):
+        try:
+            morse = morse.encode('ascii')
+        except UnicodeEncodeError:
+            raise ValueError("Invalid Morse code characters: non-ASCII input") from None
+    data = np.frombuffer(bytes(morse).strip(b' '), dtype=np.uint8)
+
+    is_dash = data == _DASH
+    is_space = data == _SPACE
+    invalid = ~(is_dash | is_space | (data == _DOT))
+    if invalid.any():
+        bad = {chr(c) for c in np.unique(data[invalid])}
+        raise ValueError(f"Invalid Morse code characters: {bad}")
+
+    # Conservar sólo el primer espacio de cada racha
+    previous_space = np.concatenate(([False], is_space[:-1]))
+    next_space = np.concatenate((is_space[1:], [False]))
+    keep = ~(is_space & previous_space)
+
+    elements = is_dash.astype(np.uint8)
+    elements[is_space] = ELEMENT_LETTER_GAP
+    elements[is_space & next_space] = ELEMENT_WORD_GAP
+    return elements[keep]
+
+def from_elements(elements: np.ndarray) -> str:
+    """
+    Converts element codes back into a Morse string.
+
+    Parameters:
+        elements (np.ndarray): Element codes as returned by ``to_elements``.
+
+    Returns:
+        str: Morse code with one space between letters and two between words.
+    """
+    elements = np.asarray(elements, dtype=np.intp)
+    return np.repeat(_ELEMENT_CHARS[elements], _ELEMENT_WIDTHS[elements]).tobytes().decode('ascii')
+
+def pack_elements(elements: np.ndarray) -> bytes:
+    """
+    Packs element codes four to a byte behind a length header.
+
+    Parameters:
+        elements (np.ndarray): Element codes in the range 0-3.
+
+    Returns:
+        bytes: An 8-byte element count followed by the packed elements,
+        first element in the two most significant bits.
+    """
+    elements = np.asarray(elements, dtype=np.uint8)
+    count = elements.size
+    padded = np.zeros((count + 3) // 4 * 4, dtype=np.uint8)
+    padded[:count] = elements
+    quads = padded.reshape(-1, 4)
+    packed = (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+    return _HEADER.pack(count) + packed.astype(np.uint8).tobytes()
+
+def unpack_elements(data: MorseInput) -> np.ndarray:
+    """
+    Unpacks data produced by ``pack_elements``.
+
+    Parameters:
+        data (bytes): Packed Morse data.
+
+    Returns:
+        np.ndarray: Element codes (``uint8``).
+
+    Raises:
+        ValueError: If the data is truncated.
+    """
+    data = memoryview(data).cast('B')
+    if len(data) < _HEADER.size:
+        raise ValueError("Packed Morse data is too short for its header")
+    (count,) = _HEADER.unpack_from(data)
+    payload = np.frombuffer(data, dtype=np.uint8, offset=_HEADER.size)
+    if payload.size * 4 < count:
+        raise ValueError(f"Packed Morse data is truncated: expected {count} elements")
+    shifts = np.array([6, 4, 2, 0], dtype=np.uint8)
+    return ((payload[:, None] >> shifts) & 0b11).ravel()[:count]
+
+def pack_morse(morse: MorseInput) -> bytes:
+    """
+    Packs a Morse string into the compact binary representation.
+
+    Example:
+        >>> unpack_morse(pack_morse("... ---  ..."))
+        '... ---  ...'
+    """
+    return pack_elements(to_elements(morse))
+
+def unpack_morse(data: MorseInput) -> str:
+    """Unpacks binary Morse data into a Morse string."""
+    return from_elements(unpack_elements(data))
+
+def code_key(code: str) -> int:
+    """
+    Returns the integer key of a Morse code.
+
+    The key is the code read as binary (dot 0, dash 1) behind a leading 1,
+    so codes of different lengths never collide.
+    """
+    key = 1
+    for symbol in code:
+        key = key * 2 + (symbol == '-')
+    return key
+
+def build_key_table(decode: Dict[str, str]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Builds a lookup from integer letter keys to decoded tokens.
+
+    Parameters:
+        decode (Dict[str, str]): Morse code to text token.
+
+    Returns:
+        Tuple[np.ndarray, List[str]]: Token index per key (-1 when unknown)
+        and the list of tokens.
+    """
+    codes = [code for code in decode if code.strip()]
+    max_length = max((len(code) for code in codes), default=0)
+    lookup = np.full(1 << (max_length + 1), -1, dtype=np.intp)
+    tokens: List[str] = []
+    for code in codes:
+        lookup[code_key(code)] = len(tokens)
+        tokens.append(decode[code])
+    return lookup, tokens
+
+def decode_elements(elements: np.ndarray, key_table: Tuple[np.ndarray, List[str]]) -> str:
+    """
+    Decodes element codes into text without building a Morse string.
+
+    Parameters:
+        elements (np.ndarray): Element codes.
+        key_table (Tuple[np.ndarray, List[str]]): Lookup from ``build_key_table``.
+
+    Returns:
+        str: Decoded text, words separated by single spaces.
+
+    Raises:
+        ValueError: If a letter is not in the table.
+    """
+    lookup, tokens = key_table
+    elements = np.asarray(elements, dtype=np.uint8)
+    if elements.size == 0:
+        return ""
+
+    is_gap = elements >= ELEMENT_LETTER_GAP
+    # Identificador de letra para cada elemento y posición dentro de la letra
+    letter_ids = np.cumsum(is_gap)
+    marks = ~is_gap
+    mark_letters = letter_ids[marks]
+    letter_count = int(letter_ids[-1]) + 1
+    lengths = np.bincount(mark_letters, minlength=letter_count)
+    starts = np.cumsum(lengths) - lengths
+    positions = np.arange(mark_letters.size) - starts[mark_letters]
+
+    # Una letra más larga que cualquier código no puede estar en la tabla, y
+    # su clave desbordaría los enteros de 64 bits
+    max_length = lookup.size.bit_length() - 2
+    too_long = lengths > max_length
+    if too_long.any():
+        letter = int(np.flatnonzero(too_long)[0])
+        marks_of_letter = elements[marks][starts[letter]:starts[letter] + lengths[letter]]
+        code = ''.join('-' if element else '.' for element in marks_of_letter.tolist())
+        raise ValueError(f"Invalid Morse code sequence: '{code}'")
+
+    # Clave entera por letra: bits de los elementos tras un 1 inicial
+    exponents = (lengths[mark_letters] - 1 - positions).astype(np.int64)
+    bits = elements[marks].astype(np.int64) << exponents
+    keys = np.zeros(letter_count, dtype=np.int64)
+    np.add.at(keys, mark_letters, bits)
+    keys += np.int64(1) << lengths.astype(np.int64)
+
+    present = lengths > 0
+    index = np.full(letter_count, -1, dtype=np.intp)
+    valid_keys = present & (keys < lookup.size)
+    index[valid_keys] = lookup[keys[valid_keys]]
+    unknown = present & (index < 0)
+    if unknown.any():
+        letter = int(np.flatnonzero(unknown)[0])
+        code = np.binary_repr(int(keys[letter]))[1:].replace('0', '.').replace('1', '-')
+        raise ValueError(f"Invalid Morse code sequence: '{code}'")
+
+    # Cada letra termina en el hueco que la sigue (o al final del flujo)
+    gaps = elements[is_gap]
+    separators = np.append(np.where(gaps == ELEMENT_WORD_GAP, ' ', ''), '')
+    parts: List[str] = []
+    for letter in range(letter_count):
+        if present[letter]:
+            parts.append(tokens[index[letter]])
+        parts.append(separators[letter])
+    return ''.join(parts).strip(' ')
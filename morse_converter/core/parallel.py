@@ -0,0 +1,359 @@
+import mmap
+import os
+import re
+import secrets
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from morse_converter.core.code_tables import DEFAULT_TABLE
+from morse_converter.core.converter import MorseConverter
+from morse_converter.utils import setup_logger
+from morse_converter.utils.file_handler import FileHandler, compression_for, detect_compression
+from morse_converter.utils.metrics import metrics
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+TEXT_TO_MORSE = "text-to-morse"
+MORSE_TO_TEXT = "morse-to-text"
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024  # bytes
+
+# Los saltos de línea y tabuladores separan palabras en ambos sentidos
+_TEXT_WHITESPACE = str.maketrans({'\t': ' ', '\r': ' ', '\n': ' '})
+_MORSE_WHITESPACE = str.maketrans({'\t': ' ', '\r': ' ', '\n': '  '})
+_WHITESPACE_RUN = re.compile(rb'[ \t\r\n]+')
+
+class Chunk(NamedTuple):
+    """
+    A span of the input converted independently.
+
+    Attributes:
+        start (int): Byte offset of the first byte.
+        end (int): Byte offset one past the last byte.
+        gap (int): Whitespace width (in spaces) that followed the chunk in the input.
+    """
+    start: int
+    end: int
+    gap: int
+
+# Estado de cada proceso trabajador
+_worker: Dict[str, object] = {}
+
+def _init_worker(input_path: str, direction: str, table: Union[str, Sequence[str]], parts_dir: str) -> None:
+    """Maps the input file once per worker process."""
+    handle = open(input_path, 'rb')
+    _worker['file'] = handle
+    _worker['map'] = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    _worker['direction'] = direction
+    _worker['converter'] = MorseConverter(table)
+    _worker['parts_dir'] = parts_dir
+
+def convert_span(converter: MorseConverter, data: str, direction: str, start: int = 0) -> str:
+    """
+    Converts one chunk of input, reading line breaks and tabs as word separators.
+
+    Parameters:
+        converter (MorseConverter): The converter to use.
+        data (str): The chunk, cut at a word boundary.
+        direction (str): ``TEXT_TO_MORSE`` or ``MORSE_TO_TEXT``.
+        start (int): Byte offset of the chunk, used in error messages.
+
+    Returns:
+        str: The converted chunk.
+
+    Raises:
+        ValueError: If the chunk cannot be converted.
+    """
+    try:
+        if direction == TEXT_TO_MORSE:
+            return converter.encode_many([data.translate(_TEXT_WHITESPACE)])[0]
+        return converter.decode_many([data.translate(_MORSE_WHITESPACE)])[0]
+    except ValueError as e:
+        raise ValueError(f"Chunk at byte {start}: {str(e)}") from None
+
+def _convert_chunk(index: int, start: int, end: int) -> Tuple[int, str, bool]:
+    """
+    Converts one chunk of the mapped input and writes it to a part file.
+
+    Returns:
+        Tuple[int, str, bool]: Chunk index, part file path and whether the
+        converted chunk is empty.
+    """
+    data = _worker['map'][start:end].decode('utf-8')
+    result = convert_span(_worker['converter'], data, _worker['direction'], start)
+
+    part_path = os.path.join(_worker['parts_dir'], f"part-{index:06d}")
+    with open(part_path, 'wb') as part:
+        part.write(result.encode('utf-8'))
+    return index, part_path, not result
+
+def _gap_width(run: bytes, direction: str) -> int:
+    """Returns the whitespace width of ``run`` after normalisation."""
+    if direction == TEXT_TO_MORSE:
+        return len(run)
+    return len(run) + run.count(b'\n')
+
+def last_boundary(data: bytes, direction: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Finds the last word boundary of a buffer that is followed by more input.
+
+    A boundary is any whitespace run for text and a run of two or more
+    spaces for Morse code, as in ``ParallelConverter.split``. A run at the
+    very end is ignored because it may continue in the next read.
+
+    Returns:
+        Tuple[int, int, int] | None: Start and end of the run and its
+        whitespace width, or None if there is no boundary.
+    """
+    found = None
+    for match in _WHITESPACE_RUN.finditer(data):
+        if match.end() == len(data):
+            break
+        gap = _gap_width(match.group(), direction)
+        if direction == TEXT_TO_MORSE or gap >= 2:
+            found = (match.start(), match.end(), gap)
+    return found
+
+class ParallelConverter:
+    """
+    Converts a single large file across a pool of processes.
+
+    The input is split at word boundaries (any whitespace for text, word gaps
+    for Morse code). Each worker maps the file with ``mmap``, converts its
+    byte span with the vectorized batch converter and writes the result to a
+    part file, so no input or output data is pickled between processes. The
+    parts are then stitched in order with the separator that the split
+    removed.
+
+    Line breaks and tabs in the input are treated as word separators.
+    Compressed input or output (gzip, bz2, xz) cannot be mapped, so such
+    files are converted in a single streaming pass with bounded memory.
+
+    Methods:
+        split(input_path: str, direction: str) -> List[Chunk]
+            Computes the chunk boundaries of a file.
+        convert_file(input_path: str, output_path: str, direction: str) -> int
+            Converts a file and returns the number of bytes written.
+        convert_stream(input_path: str, output_path: str, direction: str) -> int
+            Converts a file sequentially in one streaming pass.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        table: Union[str, Sequence[str]] = DEFAULT_TABLE
+    ):
+        """
+        Initialize the ParallelConverter.
+
+        Parameters:
+            workers (int, optional): Number of worker processes (default: CPU count)
+            chunk_size (int): Target chunk size in bytes (default: 4 MiB)
+            table (str | Sequence[str]): Code table(s) to use (default: "standard")
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.table = table
+        logger.debug(f"Initializing ParallelConverter with {self.workers} workers, chunk_size={chunk_size}")
+
+    def split(self, input_path: str, direction: str) -> List[Chunk]:
+        """
+        Computes the chunk boundaries of a file.
+
+        Parameters:
+            input_path (str): The file to split.
+            direction (str): ``TEXT_TO_MORSE`` or ``MORSE_TO_TEXT``.
+
+        Returns:
+            List[Chunk]: Chunks covering the file in order.
+        """
+        self._check_direction(direction)
+        size = os.path.getsize(input_path)
+        if size == 0:
+            return []
+        chunks: List[Chunk] = []
+        with open(input_path, 'rb') as handle, \
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < size:
+                cut = self._find_cut(data, start, start + self.chunk_size, size, direction)
+                if cut is None:
+                    chunks.append(Chunk(start, size, 0))
+                    break
+                run_start, run_end = cut
+                chunks.append(Chunk(start, run_start, _gap_width(data[run_start:run_end], direction)))
+                start = run_end
+        logger.debug(f"Split {input_path} into {len(chunks)} chunks")
+        return chunks
+
+    def _find_cut(self, data: mmap.mmap, start: int, position: int, size: int,
+                  direction: str) -> Optional[Tuple[int, int]]:
+        """Finds the first whitespace run at or after ``position`` that separates words."""
+        if position >= size:
+            return None
+        # Retroceder al inicio de la racha si la posición cae dentro de una
+        while position > start and data[position - 1:position] in (b' ', b'\t', b'\r', b'\n'):
+            position -= 1
+        for match in _WHITESPACE_RUN.finditer(data, position):
+            if match.end() == size:
+                return None
+            if direction == TEXT_TO_MORSE or _gap_width(match.group(), direction) >= 2:
+                return match.start(), match.end()
+        return None
+
+    @staticmethod
+    def _check_direction(direction: str) -> None:
+        """Raises ValueError for an unknown conversion direction."""
+        if direction not in (TEXT_TO_MORSE, MORSE_TO_TEXT):
+            raise ValueError(f"Unknown direction '{direction}'. Use '{TEXT_TO_MORSE}' or '{MORSE_TO_TEXT}'")
+
+    @metrics.timed("parallel.convert_file")
+    def convert_file(self, input_path: str, output_path: str, direction: str) -> int:
+        """
+        Converts a file in parallel and writes the result.
+
+        The output is the same as converting the whole file in one call,
+        with line breaks and tabs read as word separators.
+
+        Parameters:
+            input_path (str): The file to convert.
+            output_path (str): Where to write the result.
+            direction (str): ``TEXT_TO_MORSE`` or ``MORSE_TO_TEXT``.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            ValueError: If the direction is unknown or the input cannot be converted.
+        """
+        self._check_direction(direction)
+        if detect_compression(input_path) or compression_for(output_path):
+            return self.convert_stream(input_path, output_path, direction)
+
+        logger.info(f"Converting {input_path} to {output_path} ({direction}) with {self.workers} workers")
+        chunks = self.split(input_path, direction)
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        with tempfile.TemporaryDirectory(prefix=".morse-parts-", dir=output_dir) as parts_dir:
+            args = (input_path, direction, self.table, parts_dir)
+            if not chunks:
+                results = []
+            elif len(chunks) == 1 or self.workers == 1:
+                _init_worker(*args)
+                try:
+                    results = [_convert_chunk(i, chunk.start, chunk.end) for i, chunk in enumerate(chunks)]
+                finally:
+                    _worker['map'].close()
+                    _worker['file'].close()
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                         initargs=args) as pool:
+                    futures = [pool.submit(_convert_chunk, i, chunk.start, chunk.end)
+                               for i, chunk in enumerate(chunks)]
+                    results = [future.result() for future in futures]
+            written = self._stitch(results, chunks, output_path, direction)
+
+        logger.info(f"Wrote {written} bytes to {output_path} from {len(chunks)} chunks")
+        metrics.increment("parallel_chunks_total", len(chunks))
+        return written
+
+    def convert_stream(self, input_path: str, output_path: str, direction: str) -> int:
+        """
+        Converts a (possibly compressed) file sequentially, chunk by chunk.
+
+        Each chunk is cut at its last word boundary and the rest is carried
+        into the next one, giving the same output as ``convert_file``. The
+        output is written atomically.
+
+        Returns:
+            int: Number of uncompressed bytes written.
+        """
+        logger.info(f"Streaming {input_path} to {output_path} ({direction})")
+        converter = MorseConverter(self.table)
+        to_morse = direction == TEXT_TO_MORSE
+        whitespace = _TEXT_WHITESPACE if to_morse else _MORSE_WHITESPACE
+        # El texto se corta en cualquier espacio; el Morse sólo en huecos de palabra
+        boundary = ' ' if to_morse else '  '
+        handler = FileHandler(atomic=True)
+        written = 0
+        chunks = 0
+        carry = ''
+
+        def emit(data: str, writer) -> None:
+            nonlocal written, chunks
+            try:
+                if to_morse:
+                    result = converter.encode_many([data])[0]
+                    # Las palabras se separan con dos espacios, sin huecos vacíos
+                    if result and written:
+                        result = '  ' + result
+                else:
+                    result = converter.decode_many([data])[0]
+            except ValueError as e:
+                raise ValueError(f"Chunk at character {consumed}: {str(e)}") from None
+            writer.write(result)
+            written += len(result.encode('utf-8'))
+            chunks += 1
+
+        consumed = 0
+        with handler.open_writer(output_path) as writer:
+            for chunk in handler.iter_chunks(input_path, self.chunk_size):
+                data = carry + chunk.translate(whitespace)
+                # Cortar al inicio de la última racha de espacios; el resto se
+                # conserva entero para no partir palabras ni huecos
+                cut = data.rfind(boundary)
+                while cut > 0 and data[cut - 1] == ' ':
+                    cut -= 1
+                if cut <= 0:
+                    carry = data
+                    continue
+                emit(data[:cut], writer)
+                consumed += cut
+                carry = data[cut:]
+            if carry:
+                emit(carry, writer)
+
+        logger.info(f"Wrote {written} bytes to {output_path} from {chunks} chunks")
+        metrics.increment("parallel_chunks_total", chunks)
+        return written
+
+    @staticmethod
+    def _stitch(results: List[Tuple[int, str, bool]], chunks: List[Chunk], output_path: str, direction: str) -> int:
+        """
+        Concatenates the part files in order with the separators removed by the split.
+
+        The result goes to a temporary file next to the output that replaces
+        it only when complete, so a crash never leaves a truncated output.
+        """
+        written = 0
+        pending = b''
+        target = Path(output_path)
+        # Mismo esquema que FileWriter: temporal en el mismo directorio y os.replace
+        temp_path = target.with_name(f".{target.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            with temp_path.open('xb') as output:
+                for (index, part_path, empty), chunk in zip(sorted(results), chunks):
+                    if direction == TEXT_TO_MORSE:
+                        # Las palabras se separan con dos espacios, sin huecos vacíos
+                        if empty:
+                            continue
+                        if written:
+                            output.write(b'  ')
+                            written += 2
+                    else:
+                        output.write(pending)
+                        written += len(pending)
+                        pending = b' ' * (chunk.gap // 2)
+                    with open(part_path, 'rb') as part:
+                        shutil.copyfileobj(part, output)
+                    written += Path(part_path).stat().st_size
+            os.replace(temp_path, target)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return written
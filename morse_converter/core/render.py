@@ -0,0 +1,305 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+import numpy as np
+from morse_converter.core.audio import AudioGenerator, MorseTimings, ToneOscillator, _wav_header
+from morse_converter.core.code_tables import DEFAULT_TABLE
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.timeline import MorseTimeline
+from morse_converter.utils import setup_logger
+from morse_converter.utils.metrics import metrics
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+DEFAULT_PREFIX = "clip"
+# Mensajes enviados a cada proceso por tarea
+DEFAULT_CLIPS_PER_TASK = 16
+
+class RenderResult(NamedTuple):
+    """
+    The outcome of one clip of a render batch.
+
+    Attributes:
+        index (int): Position of the message in the batch (starting at 1).
+        output_path (Path): The WAV file.
+        samples (int): Samples written (0 if the clip failed).
+        duration (float): Length of the audio in seconds.
+        elapsed (float): Time spent rendering and writing the clip, in seconds.
+        error (str, optional): The error message of a failed clip.
+    """
+    index: int
+    output_path: Path
+    samples: int
+    duration: float
+    elapsed: float
+    error: Optional[str] = None
+
+def carrier_cycle(frequency: int, sample_rate: int) -> int:
+    """
+    Number of samples after which a carrier of ``frequency`` repeats exactly.
+
+    Raises:
+        ValueError: If the frequency is not a positive whole number of Hz.
+    """
+    if frequency <= 0 or frequency != int(frequency):
+        raise ValueError("Batch rendering needs a positive whole-number frequency")
+    return sample_rate // math.gcd(int(frequency), sample_rate)
+
+def build_carrier(frequency: int, sample_rate: int, longest_tone: int) -> np.ndarray:
+    """
+    Precomputes the carrier template shared by the render workers.
+
+    The template holds one exact carrier cycle plus the longest tone, so
+    the tone starting at any sample ``p`` of a clip is the slice that
+    starts at ``p % cycle``, with the same phase as ``AudioGenerator``.
+    """
+    length = carrier_cycle(frequency, sample_rate) + longest_tone
+    return ToneOscillator(frequency, sample_rate).render(length)
+
+def render_pcm(timeline: MorseTimeline, generator: AudioGenerator, carrier: np.ndarray, cycle: int) -> np.ndarray:
+    """
+    Renders a timeline into 16-bit samples by slicing the carrier template.
+
+    Parameters:
+        timeline (MorseTimeline): The events to render.
+        generator (AudioGenerator): Supplies the sample rate, volume and envelopes.
+        carrier (np.ndarray): Template from ``build_carrier``.
+        cycle (int): Carrier cycle length in samples.
+
+    Returns:
+        np.ndarray: Little-endian int16 samples, as ``render_to_file`` writes them.
+    """
+    if len(timeline) == 0:
+        raise ValueError("No Morse symbols to render")
+    counts = timeline.sample_counts(generator.sample_rate)
+    pcm = np.zeros(int(counts.sum()), dtype='<i2')
+    oscillator = generator._oscillator
+    position = 0
+    for state, num_samples in zip(timeline.states.tolist(), counts.tolist()):
+        if state:
+            start = position % cycle
+            if start + num_samples <= len(carrier):
+                tone = carrier[start:start + num_samples] * oscillator.envelope(num_samples)
+            else:
+                # Tonos más largos que la plantilla: repetir el ciclo
+                tone = np.take(carrier[:cycle], np.arange(start, start + num_samples), mode='wrap')
+                tone *= oscillator.envelope(num_samples)
+            tone *= generator.volume
+            np.clip(tone, -1.0, 1.0, out=tone)
+            tone *= 32767
+            pcm[position:position + num_samples] = tone
+        position += num_samples
+    return pcm
+
+def read_messages(input_path: Union[str, Path]) -> List[str]:
+    """
+    Reads one message per line, skipping empty lines.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(input_path, 'r', encoding='utf-8') as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+# Estado de cada proceso trabajador
+_worker: Dict[str, Any] = {}
+
+def _init_worker(settings: Dict[str, Any], carrier: np.ndarray) -> None:
+    """Stores the carrier template and builds the per-process generator."""
+    generator = AudioGenerator(frequency=settings['frequency'], volume=settings['volume'],
+                               ramp_duration=settings['ramp_duration'])
+    generator.sample_rate = settings['sample_rate']
+    generator.timings = settings['timings']
+    _worker['generator'] = generator
+    _worker['carrier'] = carrier
+    _worker['settings'] = settings
+    _worker['converter'] = None if settings['morse'] else MorseConverter(settings['table'])
+
+def _render_clip(index: int, message: str) -> RenderResult:
+    """Renders one message and writes its WAV file."""
+    started = time.perf_counter()
+    settings = _worker['settings']
+    generator: AudioGenerator = _worker['generator']
+    path = Path(settings['output_dir']) / f"{settings['prefix']}-{index:05d}.wav"
+    try:
+        morse = message if _worker['converter'] is None else _worker['converter'].text_to_morse(message)
+        pcm = render_pcm(generator.timeline(morse), generator, _worker['carrier'], settings['cycle'])
+        with open(path, 'wb') as output:
+            output.write(_wav_header(len(pcm), generator.sample_rate))
+            output.write(pcm.tobytes())
+    except (OSError, ValueError) as e:
+        return RenderResult(index, path, 0, 0.0, time.perf_counter() - started, str(e))
+    return RenderResult(index, path, len(pcm), len(pcm) / generator.sample_rate,
+                        time.perf_counter() - started)
+
+class BatchRenderer:
+    """
+    Renders many short messages to WAV files on a pool of processes.
+
+    The carrier is phase-continuous and, for a whole-number frequency,
+    repeats exactly every ``sample_rate / gcd(frequency, sample_rate)``
+    samples. The parent process renders that cycle plus the longest tone
+    once and sends the template to every worker when it starts, so a tone
+    is a slice of the template times its cached envelope and no audio data
+    is pickled per clip. Workers are started once per batch and
+    receive messages in groups, which is far cheaper than one process per
+    clip.
+
+    Methods:
+        render(messages: Iterable[str]) -> List[RenderResult]
+            Renders one WAV file per message.
+        render_file(input_path: str) -> List[RenderResult]
+            Renders one WAV file per non-empty line of a file.
+        summary(results: Sequence[RenderResult]) -> Dict[str, Any]
+            Aggregated timing statistics of a batch.
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        workers: Optional[int] = None,
+        frequency: int = 800,
+        volume: float = 0.5,
+        wpm: Optional[float] = None,
+        timings: Optional[MorseTimings] = None,
+        morse: bool = False,
+        table: Union[str, Sequence[str]] = DEFAULT_TABLE,
+        prefix: str = DEFAULT_PREFIX,
+        clips_per_task: int = DEFAULT_CLIPS_PER_TASK,
+        on_result: Optional[Callable[[RenderResult], None]] = None
+    ):
+        """
+        Initialize the BatchRenderer.
+
+        Parameters:
+            output_dir (str | Path): Directory where the WAV files are written.
+            workers (int, optional): Number of worker processes (default: CPU count)
+            frequency (int): Tone frequency in whole Hz (default: 800)
+            volume (float): Volume from 0.0 to 1.0 (default: 0.5)
+            wpm (float, optional): Speed in words per minute (PARIS timing)
+            timings (MorseTimings, optional): Element durations; ignored if ``wpm`` is given
+            morse (bool): The messages are already Morse code (default: False)
+            table (str | Sequence[str]): Code table(s) used to encode text (default: "standard")
+            prefix (str): File name prefix; clips are named ``<prefix>-00001.wav`` (default: "clip")
+            clips_per_task (int): Messages sent to a worker at a time (default: 16)
+            on_result (callable, optional): Called with every ``RenderResult`` in order.
+
+        Raises:
+            ValueError: If the frequency, speed or pool settings are invalid.
+        """
+        if clips_per_task <= 0:
+            raise ValueError("Clips per task must be positive")
+        self.generator = AudioGenerator(frequency=frequency, volume=volume)
+        if timings is not None:
+            self.generator.timings = timings
+        if wpm is not None:
+            self.generator.set_wpm(wpm)
+        self.cycle = carrier_cycle(frequency, self.generator.sample_rate)
+        self.output_dir = Path(output_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.morse = morse
+        self.table = table
+        self.prefix = prefix
+        self.clips_per_task = clips_per_task
+        self.on_result = on_result
+        logger.debug(f"Initializing BatchRenderer with {self.workers} workers, carrier cycle={self.cycle}")
+
+    def _settings(self) -> Dict[str, Any]:
+        """Returns the picklable settings sent to every worker."""
+        generator = self.generator
+        return {
+            'frequency': generator.frequency,
+            'volume': generator.volume,
+            'ramp_duration': generator._oscillator.ramp_duration,
+            'sample_rate': generator.sample_rate,
+            'timings': generator.timings,
+            'cycle': self.cycle,
+            'morse': self.morse,
+            'table': self.table,
+            'output_dir': str(self.output_dir),
+            'prefix': self.prefix,
+        }
+
+    @metrics.timed("render.batch")
+    def render(self, messages: Iterable[str]) -> List[RenderResult]:
+        """
+        Renders one WAV file per message.
+
+        A message that cannot be rendered is reported as a failed result and
+        the batch continues.
+
+        Parameters:
+            messages (Iterable[str]): Text (or Morse code) of every clip.
+
+        Returns:
+            List[RenderResult]: One result per message, in order.
+        """
+        messages = list(messages)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timings = self.generator.timings
+        longest = int(math.ceil(self.generator.sample_rate * max(timings.DOT_DURATION, timings.DASH_DURATION))) + 1
+        carrier = build_carrier(self.generator.frequency, self.generator.sample_rate, longest)
+        settings = self._settings()
+        indices = range(1, len(messages) + 1)
+        logger.info(f"Rendering {len(messages)} clips to {self.output_dir} with {self.workers} workers")
+
+        results: List[RenderResult] = []
+        if len(messages) <= 1 or self.workers == 1:
+            _init_worker(settings, carrier)
+            for result in map(_render_clip, indices, messages):
+                self._record(result, results)
+        else:
+            # La plantilla ocupa unos pocos periodos: se copia una vez por proceso
+            workers = min(self.workers, len(messages))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(settings, carrier)) as pool:
+                for result in pool.map(_render_clip, indices, messages, chunksize=self.clips_per_task):
+                    self._record(result, results)
+
+        failed = sum(1 for result in results if result.error)
+        logger.info(f"Rendered {len(results) - failed} clips, {failed} failed")
+        return results
+
+    def render_file(self, input_path: Union[str, Path]) -> List[RenderResult]:
+        """
+        Renders one WAV file per non-empty line of a text file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        return self.render(read_messages(input_path))
+
+    def _record(self, result: RenderResult, results: List[RenderResult]) -> None:
+        """Stores a result, updates the metrics and calls the callback."""
+        results.append(result)
+        if result.error:
+            logger.error(f"Failed to render clip {result.index}: {result.error}")
+            metrics.increment("errors_total", component="render", type="RenderError")
+        else:
+            metrics.increment("render_clips_total")
+            metrics.increment("samples_rendered_total", result.samples)
+        if self.on_result:
+            self.on_result(result)
+
+    @staticmethod
+    def summary(results: Sequence[RenderResult]) -> Dict[str, Any]:
+        """
+        Aggregated statistics of a batch.
+
+        Returns:
+            Dict[str, Any]: Clip counts, seconds of audio and the mean, p95 and
+            maximum per-clip render time in milliseconds.
+        """
+        elapsed = np.array([result.elapsed for result in results if not result.error]) * 1000
+        return {
+            "clips": len(results),
+            "failed": sum(1 for result in results if result.error),
+            "audio_seconds": round(sum(result.duration for result in results), 3),
+            "mean_ms": round(float(elapsed.mean()), 3) if len(elapsed) else 0.0,
+            "p95_ms": round(float(np.percentile(elapsed, 95)), 3) if len(elapsed) else 0.0,
+            "max_ms": round(float(elapsed.max()), 3) if len(elapsed) else 0.0,
+        }
@@ -0,0 +1,198 @@
+import io
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+import numpy as np
+from morse_converter.utils import setup_logger
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+_DOT, _DASH, _SPACE = ord('.'), ord('-'), ord(' ')
+
+class MorseTimeline:
+    """
+    Run-length encoded keying events derived from Morse code.
+
+    The timeline is the intermediate representation shared by audio
+    rendering, decoding and visual or keying outputs: two parallel arrays
+    with the key state of every event (1 = key down, 0 = key up) and its
+    duration in seconds. Adjacent events with the same state are merged, so
+    states always alternate and every duration is positive.
+
+    The timings follow the rules of ``AudioGenerator``: every dot or dash is
+    followed by a symbol space, one space completes a letter space and a
+    second space completes a word space.
+
+    Methods:
+        from_morse(morse: str, timings: MorseTimings = None) -> MorseTimeline
+            Builds the timeline of a Morse string.
+        sample_counts(sample_rate: int) -> np.ndarray
+            Durations in samples, rounded without cumulative drift.
+        milliseconds() -> np.ndarray
+            Durations in whole milliseconds.
+        intervals() -> Tuple[np.ndarray, np.ndarray]
+            Start and end time of every key-down event.
+        to_dict() / from_dict(data: dict)
+            JSON-friendly serialization.
+        save(path) / load(path)
+            Binary serialization as a NumPy ``.npz`` file.
+    """
+
+    def __init__(self, states: Any, durations: Any):
+        """
+        Initialize the MorseTimeline.
+
+        Parameters:
+            states (array-like): Key state of every event (non-zero = key down)
+            durations (array-like): Duration of every event in seconds
+
+        Raises:
+            ValueError: If the arrays differ in length or a duration is negative.
+        """
+        states = np.asarray(states, dtype=np.uint8).ravel()
+        durations = np.asarray(durations, dtype=np.float64).ravel()
+        if states.shape != durations.shape:
+            raise ValueError("States and durations must have the same length")
+        if np.any(durations < 0):
+            raise ValueError("Durations cannot be negative")
+        self.states, self.durations = self._merge(np.minimum(states, 1), durations)
+
+    @staticmethod
+    def _merge(states: np.ndarray, durations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Drops empty events and joins adjacent events with the same state."""
+        keep = durations > 0
+        states, durations = states[keep], durations[keep]
+        if len(states) == 0:
+            return states, durations
+        starts = np.flatnonzero(np.r_[True, states[1:] != states[:-1]])
+        return states[starts], np.add.reduceat(durations, starts)
+
+    @classmethod
+    def from_morse(cls, morse: str, timings: Optional[Any] = None) -> "MorseTimeline":
+        """
+        Builds the timeline of a Morse string.
+
+        Characters other than dots, dashes and spaces are ignored with a warning.
+
+        Parameters:
+            morse (str): Morse code with one space between letters and two between words.
+            timings (MorseTimings, optional): Element durations (default: MorseTimings())
+
+        Returns:
+            MorseTimeline: The keying events.
+
+        Example:
+            >>> MorseTimeline.from_morse(". .").states
+            array([1, 0, 1, 0], dtype=uint8)
+        """
+        if timings is None:
+            from morse_converter.core.audio import MorseTimings
+            timings = MorseTimings()
+        symbols = np.frombuffer(morse.encode('utf-8'), dtype=np.uint8)
+        valid = (symbols == _DOT) | (symbols == _DASH) | (symbols == _SPACE)
+        if not valid.all():
+            logger.warning(f"Ignoring {int((~valid).sum())} invalid Morse symbols")
+            symbols = symbols[valid]
+
+        # Cada símbolo produce dos eventos: la marca y el silencio que la sigue.
+        # Un espacio sólo añade silencio: completa el espacio de letra y, si
+        # sigue a otro espacio, el de palabra
+        is_space = symbols == _SPACE
+        after_space = np.r_[False, is_space[:-1]]
+        letter_gap = max(timings.LETTER_SPACE - timings.SYMBOL_SPACE, 0.0)
+        word_gap = max(timings.WORD_SPACE - timings.LETTER_SPACE, 0.0)
+
+        states = np.zeros((len(symbols), 2), dtype=np.uint8)
+        durations = np.zeros((len(symbols), 2), dtype=np.float64)
+        states[:, 0] = ~is_space
+        durations[:, 0] = np.where(
+            symbols == _DOT, timings.DOT_DURATION,
+            np.where(symbols == _DASH, timings.DASH_DURATION,
+                     np.where(after_space, word_gap, letter_gap))
+        )
+        durations[:, 1] = np.where(is_space, 0.0, timings.SYMBOL_SPACE)
+        return cls(states, durations)
+
+    def __len__(self) -> int:
+        """Number of events."""
+        return len(self.states)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MorseTimeline):
+            return NotImplemented
+        return np.array_equal(self.states, other.states) and np.allclose(self.durations, other.durations)
+
+    def __repr__(self) -> str:
+        return f"MorseTimeline(events={len(self)}, duration={self.duration:.3f}s)"
+
+    @property
+    def duration(self) -> float:
+        """Total duration in seconds."""
+        return float(self.durations.sum())
+
+    @property
+    def key_down_time(self) -> float:
+        """Total time the key is down, in seconds."""
+        return float(self.durations[self.states == 1].sum())
+
+    def boundaries(self) -> np.ndarray:
+        """Start time of every event followed by the end time of the last one."""
+        return np.r_[0.0, np.cumsum(self.durations)]
+
+    def sample_counts(self, sample_rate: int) -> np.ndarray:
+        """
+        Durations in samples.
+
+        Event boundaries are rounded to the nearest sample, so the rounding
+        error never accumulates over long messages.
+
+        Parameters:
+            sample_rate (int): Samples per second.
+
+        Returns:
+            np.ndarray: Number of samples of every event (int64).
+        """
+        edges = np.rint(self.boundaries() * sample_rate).astype(np.int64)
+        return np.diff(edges)
+
+    def milliseconds(self) -> np.ndarray:
+        """Durations in whole milliseconds, rounded without cumulative drift."""
+        return self.sample_counts(1000)
+
+    def intervals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Start and end times (in seconds) of the key-down events.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Start times and end times.
+        """
+        edges = self.boundaries()
+        on = np.flatnonzero(self.states == 1)
+        return edges[on], edges[on + 1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a JSON-serializable dict with durations in seconds."""
+        return {"states": self.states.tolist(), "durations": self.durations.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MorseTimeline":
+        """Rebuilds a timeline from ``to_dict`` output."""
+        return cls(data["states"], data["durations"])
+
+    def save(self, file_path: Union[str, Path, io.IOBase]) -> None:
+        """Writes the timeline as a compressed ``.npz`` file."""
+        np.savez_compressed(file_path, states=self.states, durations=self.durations)
+
+    @classmethod
+    def load(cls, file_path: Union[str, Path, io.IOBase]) -> "MorseTimeline":
+        """
+        Reads a timeline written by ``save``.
+
+        Raises:
+            ValueError: If the file is not a timeline.
+        """
+        try:
+            with np.load(file_path) as data:
+                return cls(data["states"], data["durations"])
+        except (OSError, KeyError) as e:
+            raise ValueError(f"Invalid timeline file: {e}")
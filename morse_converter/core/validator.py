@@ -1,6 +1,8 @@
 import re
-from typing import Pattern
+from typing import Pattern, Sequence, Union
+from morse_converter.core.code_tables import DEFAULT_TABLE, compile_table
 from morse_converter.utils import setup_logger
+from morse_converter.utils.metrics import metrics
 
 # Configurar logger para este módulo
 logger = setup_logger(__name__)
@@ -19,16 +21,49 @@ class InputValidator:
         
         validate_morse_input(morse: str) -> bool
             Validates the Morse code input for conversion.
+
+        set_table(table: str | Sequence[str]) -> None
+            Derives the accepted characters from a code table.
     """
 
     # Patrones de validación
-    VALID_TEXT_PATTERN: Pattern = re.compile(r'^[A-Za-z0-9\s.,?!@]+$')
+    VALID_TEXT_PATTERN: Pattern = compile_table(DEFAULT_TABLE).text_pattern
     VALID_MORSE_PATTERN: Pattern = re.compile(r'^[.\- \s]+$')
     
     # Constantes de configuración
     MAX_INPUT_LENGTH: int = 1000
     MAX_CONSECUTIVE_SPACES: int = 1
+    MAX_SYMBOL_LENGTH: int = 7
+
+    def __init__(self, table: Union[str, Sequence[str]] = DEFAULT_TABLE):
+        """
+        Initialize the InputValidator.
 
+        Parameters:
+            table (str | Sequence[str]): Code table(s) whose characters are accepted
+                (default: "standard")
+        """
+        self.set_table(table)
+
+    def set_table(self, table: Union[str, Sequence[str]]) -> None:
+        """
+        Derives the accepted text characters and Morse symbol length from a code table.
+
+        Parameters:
+            table (str | Sequence[str]): Code table(s) to accept.
+
+        Raises:
+            ValueError: If a table name is unknown.
+        """
+        compiled = compile_table(table)
+        self._table = compiled
+        # Caracteres que sólo aparecen dentro de tokens de varios caracteres
+        self._token_chars = frozenset(char for char in compiled.charset if char.upper() not in compiled.encode)
+        self.VALID_TEXT_PATTERN = compiled.text_pattern
+        self.MAX_SYMBOL_LENGTH = max(InputValidator.MAX_SYMBOL_LENGTH, compiled.max_code_length)
+        logger.debug(f"Validating against code tables: {'+'.join(compiled.names)}")
+
+    @metrics.timed("validator.validate_text_input")
     def validate_text_input(self, text: str) -> bool:
         """
         Validates the text input for conversion.
@@ -65,16 +100,26 @@ class InputValidator:
                 logger.error("Multiple consecutive spaces detected")
                 raise ValidationError("Multiple consecutive spaces are not allowed")
 
+            # Los caracteres de un prosigno ('<', '>') sólo son válidos dentro de uno completo
+            if not self._token_chars.isdisjoint(text):
+                for token in self._table.tokenize(text.upper()):
+                    if not token.isspace() and token not in self._table.encode:
+                        logger.error(f"Incomplete prosign: {token!r}")
+                        raise ValidationError(f"Unbalanced prosign brackets or unknown prosign near '{token}'")
+
             logger.debug("Text input validation successful")
             return True
 
         except (TypeError, ValidationError) as e:
             logger.error(f"Validation failed: {str(e)}")
+            metrics.increment("errors_total", component="validator", type=type(e).__name__)
             raise
         except Exception as e:
             logger.error(f"Unexpected error during text validation: {str(e)}")
+            metrics.increment("errors_total", component="validator", type=type(e).__name__)
             raise ValidationError(f"Validation failed: {str(e)}")
 
+    @metrics.timed("validator.validate_morse_input")
     def validate_morse_input(self, morse: str) -> bool:
         """
         Validates the Morse code input for conversion.
@@ -115,7 +160,7 @@ class InputValidator:
                 if not symbol:
                     logger.error("Multiple consecutive spaces detected")
                     raise ValidationError("Invalid Morse code format: multiple consecutive spaces")
-                if len(symbol) > 7:
+                if len(symbol) > self.MAX_SYMBOL_LENGTH:
                     logger.error(f"Invalid symbol length: {symbol}")
                     raise ValidationError(f"Invalid Morse code symbol length: {symbol}")
 
@@ -124,7 +169,9 @@ class InputValidator:
 
         except (TypeError, ValidationError) as e:
             logger.error(f"Validation failed: {str(e)}")
+            metrics.increment("errors_total", component="validator", type=type(e).__name__)
             raise
         except Exception as e:
             logger.error(f"Unexpected error during Morse validation: {str(e)}")
+            metrics.increment("errors_total", component="validator", type=type(e).__name__)
             raise ValidationError(f"Validation failed: {str(e)}")
@@ -0,0 +1,353 @@
+import fnmatch
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from morse_converter.core.code_tables import DEFAULT_TABLE
+from morse_converter.core.parallel import MORSE_TO_TEXT, TEXT_TO_MORSE, ParallelConverter
+from morse_converter.utils import setup_logger
+from morse_converter.utils.metrics import metrics
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+DEFAULT_POLL_INTERVAL = 1.0  # segundos
+DEFAULT_STATE_NAME = ".morse-watch.sqlite3"
+
+# Estados registrados para cada archivo
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    output TEXT,
+    processed REAL NOT NULL
+);
+"""
+
+# Firma de un archivo: tamaño y fecha de modificación en nanosegundos
+Signature = Tuple[int, int]
+
+class WatchResult(NamedTuple):
+    """
+    The outcome of converting one file.
+
+    Attributes:
+        input_path (Path): The converted file.
+        output_path (Path): Where the result was written.
+        status (str): ``"done"`` or ``"failed"``.
+        size (int): Size of the input in bytes.
+        written (int): Bytes written (0 on failure).
+        elapsed (float): Conversion time in seconds.
+        error (str, optional): The error message of a failed conversion.
+    """
+    input_path: Path
+    output_path: Path
+    status: str
+    size: int
+    written: int
+    elapsed: float
+    error: Optional[str] = None
+
+class ProcessedStore:
+    """
+    Small SQLite record of the files already converted.
+
+    A file counts as processed while its size and modification time match
+    the recorded ones, so a restarted watcher skips it but converts it again
+    once it changes.
+
+    Methods:
+        is_processed(path: Path, signature: Signature) -> bool
+            Checks whether this version of a file has been handled.
+        mark(path: Path, signature: Signature, status: str, output: Path) -> None
+            Records the outcome for a file.
+        count(status: str = None) -> int
+            Number of recorded files.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) the store.
+
+        Parameters:
+            path (str | Path): The SQLite database file.
+        """
+        self.path = Path(path)
+        # El watcher puede ejecutarse en otro hilo distinto del que lo creó
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ProcessedStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
+
+    def is_processed(self, path: Path, signature: Signature) -> bool:
+        """Returns True if this version of the file has been converted (or has failed)."""
+        with self._lock:
+            row = self._db.execute("SELECT size, mtime_ns FROM files WHERE path = ?", (str(path),)).fetchone()
+        return row is not None and tuple(row) == tuple(signature)
+
+    def mark(self, path: Path, signature: Signature, status: str, output: Optional[Path] = None) -> None:
+        """Records the outcome of a conversion."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, status, output, processed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (str(path), signature[0], signature[1], status, str(output) if output else None, time.time())
+            )
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Returns the number of recorded files, optionally only those with ``status``."""
+        with self._lock:
+            if status is None:
+                return self._db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            return self._db.execute("SELECT COUNT(*) FROM files WHERE status = ?", (status,)).fetchone()[0]
+
+class DirectoryWatcher:
+    """
+    Converts the files dropped into a spool directory as they arrive.
+
+    The directory is polled with ``os.scandir`` (the standard library has no
+    inotify binding, and polling also works on network file systems). A new
+    or changed file is queued once its size and modification time are the
+    same in two consecutive scans, so files still being copied are left
+    alone. Conversions run on a bounded thread pool, each one streaming the
+    file and replacing the output atomically, and finished files are
+    recorded in a ProcessedStore so a restart does not convert them again.
+    Hidden files (starting with '.') are ignored.
+
+    Methods:
+        scan(require_stable: bool = True) -> List[Tuple[Path, Signature]]
+            Lists the files that need converting.
+        poll() -> List[WatchResult]
+            Collects finished conversions and queues new files.
+        run_once() -> List[WatchResult]
+            Converts every pending file and waits for the results.
+        run(stop: threading.Event) -> None
+            Polls until ``stop`` is set, then drains the pool.
+    """
+
+    def __init__(
+        self,
+        input_dir: Union[str, Path],
+        output_dir: Union[str, Path],
+        direction: str = TEXT_TO_MORSE,
+        workers: int = 2,
+        pattern: str = "*",
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        state_path: Optional[Union[str, Path]] = None,
+        max_pending: Optional[int] = None,
+        table: Union[str, Sequence[str]] = DEFAULT_TABLE,
+        on_result: Optional[Callable[[WatchResult], None]] = None
+    ):
+        """
+        Initialize the DirectoryWatcher.
+
+        Parameters:
+            input_dir (str | Path): The spool directory to watch.
+            output_dir (str | Path): Where converted files are written (created if missing).
+            direction (str): ``TEXT_TO_MORSE`` or ``MORSE_TO_TEXT`` (default: text to Morse)
+            workers (int): Number of conversion threads (default: 2)
+            pattern (str): Glob pattern for the file names to convert (default: "*")
+            poll_interval (float): Seconds between scans (default: 1.0)
+            state_path (str | Path, optional): The state store (default: ``.morse-watch.sqlite3`` in output_dir)
+            max_pending (int, optional): Maximum files queued on the pool (default: 4 per worker)
+            table (str | Sequence[str]): Code table(s) to use (default: "standard")
+            on_result (Callable, optional): Called with every WatchResult
+
+        Raises:
+            ValueError: If the directories or the direction are invalid.
+        """
+        if direction not in (TEXT_TO_MORSE, MORSE_TO_TEXT):
+            raise ValueError(f"Unknown direction '{direction}'. Use '{TEXT_TO_MORSE}' or '{MORSE_TO_TEXT}'")
+        if workers <= 0:
+            raise ValueError("Number of workers must be positive")
+        self.input_dir = Path(input_dir)
+        self.output_dir = Path(output_dir)
+        if not self.input_dir.is_dir():
+            raise ValueError(f"Input directory not found: {self.input_dir}")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.input_dir.resolve() == self.output_dir.resolve():
+            raise ValueError("Output directory must differ from the input directory")
+
+        self.direction = direction
+        self.workers = workers
+        self.pattern = pattern
+        self.poll_interval = poll_interval
+        self.max_pending = max_pending or 4 * workers
+        self.on_result = on_result
+        self._converter = ParallelConverter(workers=1, table=table)
+        self._store = ProcessedStore(state_path or self.output_dir / DEFAULT_STATE_NAME)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="morse-watch")
+        self._pending: Dict[Future, Tuple[Path, Signature]] = {}
+        self._previous: Dict[Path, Signature] = {}
+        self._backlog = 0
+        logger.info(f"Watching {self.input_dir} -> {self.output_dir} ({direction}) with {workers} workers")
+
+    @property
+    def store(self) -> ProcessedStore:
+        """The record of processed files."""
+        return self._store
+
+    def __enter__(self) -> "DirectoryWatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Waits for running conversions, records them and closes the store."""
+        self._collect(block=True)
+        self._pool.shutdown(wait=True)
+        self._store.close()
+        logger.info("Directory watcher stopped")
+
+    def scan(self, require_stable: bool = True) -> List[Tuple[Path, Signature]]:
+        """
+        Lists the files that need converting, oldest first.
+
+        Parameters:
+            require_stable (bool): Only return files unchanged since the previous scan (default: True)
+
+        Returns:
+            List[Tuple[Path, Signature]]: The files and their signatures.
+        """
+        current: Dict[Path, Signature] = {}
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not fnmatch.fnmatch(entry.name, self.pattern):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    # El archivo desapareció durante el recorrido
+                    continue
+                current[Path(entry.path)] = (stat.st_size, stat.st_mtime_ns)
+
+        in_flight = {path for path, _ in self._pending.values()}
+        ready = [
+            (path, signature) for path, signature in current.items()
+            if path not in in_flight
+            and (not require_stable or self._previous.get(path) == signature)
+            and not self._store.is_processed(path, signature)
+        ]
+        self._previous = current
+        return sorted(ready, key=lambda item: item[1][1])
+
+    def _output_path(self, path: Path) -> Path:
+        return self.output_dir / path.name
+
+    def _convert(self, path: Path, signature: Signature) -> WatchResult:
+        """Converts one file on a worker thread."""
+        output = self._output_path(path)
+        start = time.perf_counter()
+        try:
+            with metrics.timer("watch.convert_file"):
+                written = self._converter.convert_stream(str(path), str(output), self.direction)
+        except Exception as e:
+            return WatchResult(path, output, STATUS_FAILED, signature[0], 0, time.perf_counter() - start, str(e))
+        return WatchResult(path, output, STATUS_DONE, signature[0], written, time.perf_counter() - start)
+
+    def _record(self, result: WatchResult, signature: Signature) -> None:
+        """Stores and reports a finished conversion."""
+        self._store.mark(result.input_path, signature, result.status, result.output_path)
+        metrics.increment("watch_files_total", status=result.status)
+        if result.status == STATUS_DONE:
+            metrics.increment("watch_bytes_total", result.size)
+            rate = result.size / result.elapsed / 1e6 if result.elapsed > 0 else 0.0
+            logger.info(f"Converted {result.input_path.name}: {result.size} bytes in "
+                        f"{result.elapsed:.3f}s ({rate:.1f} MB/s)")
+        else:
+            metrics.increment("errors_total", component="watcher", type="ConversionError")
+            logger.error(f"Failed to convert {result.input_path}: {result.error}")
+        if self.on_result is not None:
+            self.on_result(result)
+
+    def _collect(self, block: bool = False) -> List[WatchResult]:
+        """Records the conversions that have finished (all of them if ``block``)."""
+        if not self._pending:
+            return []
+        done, _ = wait(list(self._pending), timeout=None if block else 0,
+                       return_when=ALL_COMPLETED if block else FIRST_COMPLETED)
+        results = []
+        for future in done:
+            _, signature = self._pending.pop(future)
+            result = future.result()
+            self._record(result, signature)
+            results.append(result)
+        self._update_gauges()
+        return results
+
+    def _update_gauges(self) -> None:
+        metrics.set_gauge("watch_queue_depth", self._backlog + len(self._pending))
+        metrics.set_gauge("watch_in_flight", len(self._pending))
+
+    def _submit(self, ready: List[Tuple[Path, Signature]]) -> None:
+        """Queues files on the pool up to ``max_pending``; the rest wait for the next poll."""
+        capacity = max(self.max_pending - len(self._pending), 0)
+        for path, signature in ready[:capacity]:
+            logger.debug(f"Queueing {path}")
+            self._pending[self._pool.submit(self._convert, path, signature)] = (path, signature)
+        self._backlog = max(len(ready) - capacity, 0)
+        self._update_gauges()
+
+    def poll(self) -> List[WatchResult]:
+        """
+        Collects finished conversions, then scans and queues new files.
+
+        Returns:
+            List[WatchResult]: The conversions that finished since the last poll.
+        """
+        results = self._collect()
+        self._submit(self.scan())
+        return results
+
+    def run_once(self) -> List[WatchResult]:
+        """
+        Converts every file not yet processed and waits for all of them.
+
+        Unlike ``poll`` this does not wait for files to be stable, which
+        suits a cron job that runs after the files have been written.
+
+        Returns:
+            List[WatchResult]: The results of this run.
+        """
+        results: List[WatchResult] = []
+        ready = self.scan(require_stable=False)
+        while ready:
+            self._submit(ready)
+            results.extend(self._collect(block=True))
+            ready = self.scan(require_stable=False)
+        return results
+
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        """
+        Polls the directory until ``stop`` is set, then waits for running conversions.
+
+        Parameters:
+            stop (threading.Event, optional): Ends the loop when set (default: run forever)
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.poll()
+            stop.wait(self.poll_interval)
+        self._collect(block=True)
@@ -1,13 +1,13 @@
 import typer
 import signal
 import sys
-import json
 import logging
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
 from morse_converter.cli.interface import app
 from morse_converter.utils import setup_logger, get_logger
+from morse_converter.config import get_config
 from morse_converter.core import create_converter, create_audio_system
 
 # Configurar console para output formateado
@@ -58,7 +58,7 @@ def initialize_components() -> None:
     4. Configura el sistema de audio
     
     Raises:
-        FileNotFoundError: Si no se encuentra el archivo de configuración
+        ValueError: Si la configuración no es válida
         Exception: Para otros errores de inicialización
     """
     global logger, config, converter, audio_generator, audio_player
@@ -72,13 +72,8 @@ def initialize_components() -> None:
         )
         logger.info("Starting Morse Code Converter application")
         
-        # Cargar configuración
-        config_path = Path(__file__).parent / "config" / "config.json"
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found at {config_path}")
-            
-        with open(config_path) as f:
-            config = json.load(f)
+        # Cargar configuración (validada y compartida con el resto de módulos)
+        config = get_config()
         logger.debug("Configuration loaded successfully")
         
         # Crear instancia del converter
@@ -97,7 +92,7 @@ def initialize_components() -> None:
         
         console.print("[green]All components initialized successfully[/green]")
         
-    except FileNotFoundError as e:
+    except ValueError as e:
         logger.error(f"Configuration error: {e}")
         console.print(f"[red]Configuration error: {e}[/red]")
         raise
@@ -189,7 +184,7 @@ def main():
         console.print("\n[yellow]Application terminated by user[/yellow]")
         exit_code = 0
         
-    except FileNotFoundError as e:
+    except ValueError as e:
         logger.error(f"Configuration error: {e}")
         console.print(f"\n[red]Configuration error: {e}[/red]")
         exit_code = 1
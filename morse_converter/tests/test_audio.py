@@ -1,8 +1,15 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
 import pytest
 import numpy as np
 import sounddevice as sd
 from unittest.mock import Mock, patch
-from morse_converter.core.audio import AudioGenerator, AudioPlayer, AudioError, MorseTimings
+from morse_converter.core.timeline import MorseTimeline
+from morse_converter.core.audio import (
+    AudioGenerator, AudioPlayer, AudioError, MorseTimings, ToneOscillator, read_wav
+)
 
 class TestAudioGenerator:
     """Test suite for AudioGenerator class."""
@@ -20,28 +27,6 @@ class TestAudioGenerator:
         assert isinstance(gen.timings, MorseTimings)
         assert gen._audio_buffer is None
 
-    def test_generate_tone(self, generator):
-        """Test tone generation."""
-        duration = 0.1
-        tone = generator._generate_tone(duration)
-        
-        # Verificar la forma y características del tono
-        expected_samples = int(generator.sample_rate * duration)
-        assert len(tone) == expected_samples
-        assert isinstance(tone, np.ndarray)
-        assert np.max(np.abs(tone)) <= 1.0  # Verificar amplitud normalizada
-
-    def test_generate_silence(self, generator):
-        """Test silence generation."""
-        duration = 0.1
-        silence = generator._generate_silence(duration)
-        
-        # Verificar el silencio
-        expected_samples = int(generator.sample_rate * duration)
-        assert len(silence) == expected_samples
-        assert isinstance(silence, np.ndarray)
-        assert np.all(silence == 0)  # Todos los valores deben ser 0
-
     def test_generate_audio_basic(self, generator):
         """Test basic Morse code audio generation."""
         morse = ".-"  # Letra 'A'
@@ -59,6 +44,91 @@ class TestAudioGenerator:
         
         assert len(generator._audio_buffer) == expected_samples
 
+    def test_generate_audio_letter_and_word_spaces(self, generator):
+        """Test that single and double spaces render letter and word gaps."""
+        timings = generator.timings
+        generator.generate_audio(".")
+        dot_samples = len(generator._audio_buffer)
+
+        generator.generate_audio(". .")
+        letter_gap = len(generator._audio_buffer) - 2 * dot_samples
+        assert letter_gap == int(generator.sample_rate * (timings.LETTER_SPACE - timings.SYMBOL_SPACE))
+
+        generator.generate_audio(".  .")
+        word_gap = len(generator._audio_buffer) - 2 * dot_samples
+        expected = (int(generator.sample_rate * (timings.LETTER_SPACE - timings.SYMBOL_SPACE))
+                    + int(generator.sample_rate * (timings.WORD_SPACE - timings.LETTER_SPACE)))
+        assert word_gap == expected
+
+    def test_save_wav(self, generator, tmp_path):
+        """Test writing generated audio to a WAV file and reading it back."""
+        generator.generate_audio(".-")
+        wav_path = tmp_path / "a.wav"
+        generator.save_wav(wav_path)
+
+        samples, sample_rate = read_wav(wav_path)
+        assert sample_rate == generator.sample_rate
+        assert len(samples) == len(generator._audio_buffer)
+        np.testing.assert_allclose(samples, generator._audio_buffer * generator.volume, atol=1e-4)
+
+    def test_save_wav_without_audio(self, generator, tmp_path):
+        """Test that saving before generating raises AudioError."""
+        with pytest.raises(AudioError, match="No audio has been generated yet"):
+            generator.save_wav(tmp_path / "empty.wav")
+
+    def test_render_to_file_matches_save_wav(self, generator, tmp_path):
+        """Test that the memory-mapped render writes the same file as save_wav."""
+        morse = "-.-. --.-  -.. -..-"
+        generator.generate_audio(morse)
+        generator.save_wav(tmp_path / "buffered.wav")
+
+        samples = generator.render_to_file(morse, tmp_path / "mapped.wav")
+        assert samples == len(generator._audio_buffer)
+        assert (tmp_path / "mapped.wav").read_bytes() == (tmp_path / "buffered.wav").read_bytes()
+
+        generator.render_to_file(generator.timeline(morse), tmp_path / "mapped.pcm", raw=True)
+        assert (tmp_path / "mapped.pcm").read_bytes() == (tmp_path / "buffered.wav").read_bytes()[44:]
+
+    @pytest.mark.skipif(not Path("/proc/self/status").exists(), reason="needs /proc/self/status")
+    def test_render_to_file_memory(self, tmp_path):
+        """Test that resident memory stays bounded while rendering a long file."""
+        # Proceso aparte: el pico de memoria residente (VmHWM) es de todo el proceso
+        script = textwrap.dedent("""
+            import sys
+            from morse_converter.core.audio import AudioGenerator
+
+            def peak_kib():
+                with open("/proc/self/status") as status:
+                    return next(int(line.split()[1]) for line in status if line.startswith("VmHWM"))
+
+            generator = AudioGenerator()
+            generator.set_wpm(5)
+            timeline = generator.timeline("-" * 700)
+            generator.render_to_file(".", sys.argv[1])
+            before = peak_kib()
+            samples = generator.render_to_file(timeline, sys.argv[1])
+            print(samples, peak_kib() - before)
+        """)
+        wav = tmp_path / "long.wav"
+        result = subprocess.run([sys.executable, "-c", script, str(wav)], capture_output=True, text=True,
+                                check=True, cwd=Path(__file__).resolve().parents[2])
+        samples, growth_kib = map(int, result.stdout.split())
+        # Unos 59 MB de PCM; sólo se mapean ventanas de 8 MiB
+        assert samples * 2 > 50 * 1024 * 1024
+        assert growth_kib < 32 * 1024
+        assert len(read_wav(wav)[0]) == samples
+
+    def test_render_to_file_errors(self, generator, tmp_path):
+        """Test that empty input and unwritable paths raise AudioError."""
+        with pytest.raises(AudioError):
+            generator.render_to_file("", tmp_path / "empty.wav")
+        with pytest.raises(AudioError):
+            generator.render_to_file("...", tmp_path / "missing" / "out.wav")
+        # Más de 4 GiB de muestras no caben en un WAV
+        with pytest.raises(AudioError, match="raw PCM"):
+            generator.render_to_file(MorseTimeline([1, 0], [0.1, 50000.0]), tmp_path / "huge.wav")
+        assert not (tmp_path / "huge.wav").exists()
+
     def test_set_frequency(self, generator):
         """Test frequency setting."""
         new_freq = 1000
@@ -81,11 +151,78 @@ class TestAudioGenerator:
         assert generator.timings.DOT_DURATION == new_dot_duration
         assert generator.timings.DASH_DURATION == new_dash_duration
 
+    def test_set_wpm(self, generator):
+        """Test speed setting with PARIS timing."""
+        generator.set_wpm(12)
+        assert generator.timings.DOT_DURATION == pytest.approx(0.1)
+        assert generator.timings.DASH_DURATION == pytest.approx(0.3)
+        assert generator.timings.WORD_SPACE == pytest.approx(0.7)
+
+        with pytest.raises(ValueError):
+            generator.set_wpm(0)
+
     def test_generate_audio_error(self, generator):
         """Test error handling in audio generation."""
         with pytest.raises(AudioError):
             generator.generate_audio("invalid#morse")
 
+class TestToneOscillator:
+    """Test suite for ToneOscillator class."""
+
+    @pytest.fixture
+    def oscillator(self):
+        """Fixture that provides a ToneOscillator at 800 Hz."""
+        return ToneOscillator(frequency=800, sample_rate=44100)
+
+    def test_render_matches_sine(self, oscillator):
+        """Test that the wavetable output matches np.sin closely."""
+        samples = oscillator.render(1000)
+        t = np.arange(1000) / 44100
+        np.testing.assert_allclose(samples, np.sin(2 * np.pi * 800 * t), atol=1e-5)
+
+    def test_phase_continuity(self, oscillator):
+        """Test that consecutive blocks form one continuous carrier."""
+        first = oscillator.render(333)
+        oscillator.advance(500)
+        second = oscillator.render(333)
+
+        reference = ToneOscillator(frequency=800, sample_rate=44100).render(1166)
+        np.testing.assert_allclose(first, reference[:333], atol=1e-5)
+        np.testing.assert_allclose(second, reference[833:], atol=1e-5)
+
+    def test_envelope_ramps_and_cache(self, oscillator):
+        """Test raised-cosine ramps start and end at zero and are cached."""
+        envelope = oscillator.envelope(4410)
+        assert envelope[0] == 0.0
+        assert envelope[-1] < 0.01
+        assert np.all(envelope[300:4000] == 1.0)
+        assert oscillator.envelope(4410) is envelope
+
+    def test_envelope_short_element(self, oscillator):
+        """Test that ramps are shortened for elements shorter than two ramps."""
+        envelope = oscillator.envelope(100)
+        assert len(envelope) == 100
+        assert np.max(envelope) <= 1.0
+
+    def test_tone(self, oscillator):
+        """Test a tone rendered with its envelope."""
+        tone = oscillator.render(4410) * oscillator.envelope(4410)
+        assert len(tone) == 4410
+        assert np.max(np.abs(tone)) <= 1.0
+
+    def test_advance_matches_render(self, oscillator):
+        """Test that silence advances the phase like a rendered block."""
+        reference = ToneOscillator(frequency=800, sample_rate=44100)
+        oscillator.advance(4410)
+        reference.render(4410)
+        assert oscillator.phase == pytest.approx(reference.phase)
+
+    def test_tone_has_no_clicks(self, oscillator):
+        """Test that tones fade in and out."""
+        tone = oscillator.render(4410) * oscillator.envelope(4410)
+        assert abs(tone[0]) < 1e-9
+        assert abs(tone[-1]) < 0.01
+
 class TestAudioPlayer:
     """Test suite for AudioPlayer class."""
 
@@ -0,0 +1,126 @@
+import gzip
+import json
+import pytest
+from morse_converter.core.batch import BatchJob, JobManifest, STATUS_DONE, STATUS_FAILED, STATUS_INTERRUPTED, STATUS_SKIPPED
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.parallel import MORSE_TO_TEXT, TEXT_TO_MORSE
+
+class TestBatchJob:
+    """Test suite for resumable batch jobs."""
+
+    @pytest.fixture
+    def text(self):
+        return " ".join(["HELLO", "WORLD", "SOS", "MORSE"] * 50)
+
+    @pytest.fixture
+    def inputs(self, tmp_path, text):
+        source = tmp_path / "in"
+        source.mkdir()
+        paths = [source / "a.txt", source / "b.txt"]
+        paths[0].write_text(text)
+        paths[1].write_text("SOS")
+        return paths
+
+    def stop_after(self, job, flushes):
+        """Pide parar el trabajo tras un número de escrituras del manifiesto."""
+        original = job.manifest.flush
+        count = [0]
+
+        def flush():
+            original()
+            count[0] += 1
+            if count[0] == flushes:
+                job.request_stop(15)
+        job.manifest.flush = flush
+
+    def test_convert_files(self, tmp_path, inputs, text):
+        """Cada archivo se convierte igual que en una sola llamada."""
+        out = tmp_path / "out"
+        results = BatchJob(inputs, out, chunk_size=64).run()
+        assert [r.status for r in results] == [STATUS_DONE, STATUS_DONE]
+        assert (out / "a.txt").read_text() == MorseConverter().text_to_morse(text)
+        assert (out / "b.txt").read_text() == "... --- ..."
+
+        manifest = json.loads((out / ".morse-batch.json").read_text())
+        entry = manifest["files"][str(inputs[0].resolve())]
+        assert entry["status"] == STATUS_DONE
+        assert entry["input_offset"] == len(text)
+        assert entry["chunks_done"] == entry["chunks_total"] > 1
+
+    def test_resume_after_stop(self, tmp_path, inputs, text):
+        """Un trabajo detenido continúa desde el último fragmento registrado."""
+        out = tmp_path / "out"
+        job = BatchJob(inputs, out, chunk_size=64)
+        self.stop_after(job, 3)
+        results = job.run()
+        assert job.stopped and job.signal == 15
+        assert [r.status for r in results] == [STATUS_INTERRUPTED]
+        assert not (out / "a.txt").exists()
+        entry = JobManifest.load(out / ".morse-batch.json", TEXT_TO_MORSE, 64).entry(inputs[0])
+        assert entry["chunks_done"] == 3
+        assert 0 < entry["input_offset"] < len(text)
+
+        # Basura escrita después del último punto registrado se descarta
+        with open(out / ".a.txt.part", "ab") as part:
+            part.write(b"garbage")
+        resumed = BatchJob(inputs, out, chunk_size=64, resume=True)
+        converted = []
+        resumed._converter.encode_many = lambda records, f=resumed._converter.encode_many: converted.extend(records) or f(records)
+        results = resumed.run()
+        assert [r.status for r in results] == [STATUS_DONE, STATUS_DONE]
+        assert (out / "a.txt").read_text() == MorseConverter().text_to_morse(text)
+        assert sum(map(len, converted)) < len(text)
+
+        # Con todo terminado, --resume no vuelve a convertir nada
+        results = BatchJob(inputs, out, chunk_size=64, resume=True).run()
+        assert [r.status for r in results] == [STATUS_SKIPPED, STATUS_SKIPPED]
+
+    def test_changed_file_is_converted_again(self, tmp_path, inputs):
+        """Un archivo modificado desde la última ejecución se vuelve a convertir."""
+        out = tmp_path / "out"
+        BatchJob(inputs, out).run()
+        inputs[1].write_text("SOS SOS")
+        results = BatchJob(inputs, out, resume=True).run()
+        assert [r.status for r in results] == [STATUS_SKIPPED, STATUS_DONE]
+        assert (out / "b.txt").read_text() == "... --- ...  ... --- ..."
+
+    def test_morse_to_text_and_failures(self, tmp_path):
+        """Los errores se registran y el trabajo sigue con el siguiente archivo."""
+        source = tmp_path / "in"
+        source.mkdir()
+        (source / "bad.morse").write_text("...---...---")
+        (source / "good.morse").write_text("... --- ...\n.... ..")
+        out = tmp_path / "out"
+        results = BatchJob([source / "bad.morse", source / "good.morse"], out, MORSE_TO_TEXT, chunk_size=8).run()
+        assert [r.status for r in results] == [STATUS_FAILED, STATUS_DONE]
+        assert (out / "good.morse").read_text() == "SOS HI"
+
+    def test_compressed_files(self, tmp_path):
+        """Los archivos comprimidos se convierten en una sola pasada."""
+        path = tmp_path / "msg.txt.gz"
+        with gzip.open(path, "wt") as handle:
+            handle.write("SOS")
+        results = BatchJob([path], tmp_path / "out").run()
+        assert results[0].status == STATUS_DONE
+        with gzip.open(tmp_path / "out" / "msg.txt.gz", "rt") as handle:
+            assert handle.read() == "... --- ..."
+
+    def test_manifest_mismatch(self, tmp_path, inputs):
+        """No se reanuda un manifiesto de otro tipo de trabajo."""
+        out = tmp_path / "out"
+        BatchJob(inputs, out).run()
+        with pytest.raises(ValueError):
+            BatchJob(inputs, out, MORSE_TO_TEXT, resume=True)
+        (out / ".morse-batch.json").write_text("{")
+        with pytest.raises(ValueError):
+            BatchJob(inputs, out, resume=True)
+
+    def test_duplicate_names_are_rejected(self, tmp_path, inputs):
+        """Dos entradas con el mismo nombre no pueden escribir la misma salida."""
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "a.txt").write_text("SOS")
+        with pytest.raises(ValueError, match="a.txt"):
+            BatchJob([inputs[0], other / "a.txt"], tmp_path / "out")
+        # El mismo archivo repetido no es un conflicto
+        assert len(BatchJob([inputs[0], inputs[0]], tmp_path / "out").inputs) == 2
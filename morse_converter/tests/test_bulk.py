@@ -0,0 +1,97 @@
+import random
+import pytest
+from morse_converter.core.converter import MorseConverter
+
+def _scalar(func, records):
+    """Resultado registro a registro, None si la conversión falla."""
+    results = []
+    for record in records:
+        try:
+            results.append(func(record))
+        except ValueError:
+            results.append(None)
+    return results
+
+class TestBulkConversion:
+    """Test suite for MorseConverter.encode_many and decode_many."""
+
+    @pytest.fixture
+    def converter(self):
+        return MorseConverter()
+
+    def test_encode_many_basic(self, converter):
+        """Batch encoding keeps the original order."""
+        assert converter.encode_many(["SOS", "EA1ABC", "hi!"]) == [
+            "... --- ...", ". .- .---- .- -... -.-.", ".... ..  -.-.--"
+        ]
+
+    def test_encode_many_matches_scalar(self, converter):
+        """La salida coincide con text_to_morse para entradas aleatorias."""
+        random.seed(7)
+        alphabet = "ABCXYZ0189 .,?!@abc"
+        records = ["".join(random.choice(alphabet) for _ in range(random.randint(0, 10)))
+                   for _ in range(2000)]
+        assert converter.encode_many(records) == _scalar(converter.text_to_morse, records)
+
+    def test_decode_many_matches_scalar(self, converter):
+        """La salida coincide con morse_to_text, incluidos los espacios extra."""
+        random.seed(11)
+        records = ["".join(random.choice(".-   ") for _ in range(random.randint(0, 12)))
+                   for _ in range(2000)]
+        expected = _scalar(converter.morse_to_text, records)
+        valid = [record for record, result in zip(records, expected) if result is not None]
+        assert converter.decode_many(valid) == [r for r in expected if r is not None]
+
+    def test_empty_batches(self, converter):
+        """Lotes vacíos y registros vacíos."""
+        assert converter.encode_many([]) == []
+        assert converter.decode_many([]) == []
+        assert converter.encode_many(["", "  ", "A"]) == ["", "", ".-"]
+        assert converter.decode_many(["", ".-"]) == ["", "A"]
+        assert converter.encode_many(["   "]) == [""]
+        assert converter.decode_many(["   "]) == [" "]
+
+    def test_accepts_iterables(self, converter):
+        """Cualquier iterable sirve como lote."""
+        assert converter.encode_many(text for text in ["E", "T"]) == [".", "-"]
+        assert converter.decode_many(iter([".", "-"])) == ["E", "T"]
+
+    def test_encode_many_errors(self, converter):
+        """Los errores indican el registro que falla."""
+        with pytest.raises(ValueError, match="Record 1: Character '\\$'"):
+            converter.encode_many(["OK", "BAD$"])
+        with pytest.raises(TypeError):
+            converter.encode_many(["OK", 42])
+        with pytest.raises(ValueError):
+            converter.encode_many(["A\nB"])
+
+    def test_decode_many_errors(self, converter):
+        """Los errores de decodificación indican el registro."""
+        with pytest.raises(ValueError, match="Record 1: Invalid Morse code characters"):
+            converter.decode_many([".-", ".x"])
+        with pytest.raises(ValueError, match="Record 2: Invalid Morse code sequence: '........'"):
+            converter.decode_many([".-", "-", "........"])
+        with pytest.raises(ValueError, match="Invalid Morse code sequence"):
+            converter.decode_many(["." * 30])
+
+    def test_non_ascii_falls_back(self):
+        """El texto no ASCII se convierte registro a registro."""
+        converter = MorseConverter("cyrillic+itu")
+        records = ["ПРИВЕТ МИР", "ДА 12"]
+        morse = converter.encode_many(records)
+        assert morse == [converter.text_to_morse(r) for r in records]
+        assert converter.decode_many(morse) == records
+
+    def test_prosign_table(self):
+        """Tablas con tokens largos y códigos de más de 8 elementos."""
+        converter = MorseConverter("standard+prosigns")
+        records = ["CQ DE K <SK>", "<SOS>", "<HH> E"]
+        morse = converter.encode_many(records)
+        assert morse == [converter.text_to_morse(r) for r in records]
+        assert converter.decode_many(morse) == records
+
+    def test_tables_rebuilt_after_set_table(self, converter):
+        """Cambiar de tabla invalida las tablas de búsqueda."""
+        assert converter.decode_many([".-"]) == ["A"]
+        converter.set_table("cyrillic")
+        assert converter.decode_many([".-"]) == ["А"]
@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import patch
+from morse_converter.core.converter import MorseConverter
+from morse_converter.utils.cache import (
+    CacheError, ConversionCache, make_key, parse_size, table_fingerprint
+)
+
+class TestConversionCache:
+    """Test suite for ConversionCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        with ConversionCache(tmp_path / "cache", max_size="1MB") as cache:
+            yield cache
+
+    @pytest.fixture
+    def converter(self):
+        return MorseConverter()
+
+    def test_parse_size(self):
+        """Tamaños con y sin sufijo."""
+        assert parse_size("256MB") == 256 * 1024 * 1024
+        assert parse_size("1.5k") == 1536
+        assert parse_size("100") == 100
+        assert parse_size(42) == 42
+        with pytest.raises(ValueError):
+            parse_size("lots")
+
+    def test_keys_depend_on_every_input(self, converter):
+        """La clave cambia con el contenido, el tipo y los parámetros."""
+        key = make_key("text-to-morse", "SOS", table="a")
+        assert key == make_key("text-to-morse", b"SOS", table="a")
+        assert key != make_key("text-to-morse", "SOS", table="b")
+        assert key != make_key("morse-to-text", "SOS", table="a")
+        assert table_fingerprint(converter.table) != table_fingerprint(MorseConverter("cyrillic").table)
+
+    def test_get_put(self, cache):
+        """Valores guardados y persistentes entre instancias."""
+        assert cache.get("missing") is None
+        cache.put("key", b"value", "test")
+        assert cache.get("key") == b"value"
+        assert "key" in cache
+        assert cache.size == 5
+        cache.put("key", b"other", "test")
+        assert cache.size == 5 and len(cache) == 1
+
+        with ConversionCache(cache.directory) as reopened:
+            assert reopened.get("key") == b"other"
+
+    def test_lru_eviction(self, tmp_path):
+        """Se expulsan las entradas usadas hace más tiempo."""
+        with ConversionCache(tmp_path, max_size=30) as cache:
+            cache.put("a", b"x" * 10, "test")
+            cache.put("b", b"x" * 10, "test")
+            cache.put("c", b"x" * 10, "test")
+            cache.get("a")
+            cache.put("d", b"x" * 10, "test")
+            assert "b" not in cache
+            assert all(key in cache for key in "acd")
+            assert cache.size <= 30
+            # Valores mayores que el límite no se guardan
+            cache.put("huge", b"x" * 31, "test")
+            assert "huge" not in cache
+
+    def test_encode_many_converts_only_misses(self, cache, converter):
+        """Una segunda ejecución sobre datos casi iguales apenas convierte nada."""
+        records = [f"WORD {i}" for i in range(100)]
+        assert cache.encode_many(converter, records) == converter.encode_many(records)
+        records[5] = "CHANGED"
+        with patch.object(converter, 'encode_many', wraps=converter.encode_many) as encode:
+            result = cache.encode_many(converter, records)
+        encode.assert_called_once_with(["CHANGED"])
+        assert result == [converter.text_to_morse(r) for r in records]
+        assert cache.stats()["hits"] == 99
+
+    def test_table_is_part_of_key(self, cache):
+        """Distintas tablas no comparten resultados."""
+        assert cache.decode_many(MorseConverter(), [".-"]) == ["A"]
+        assert cache.decode_many(MorseConverter("cyrillic"), [".-"]) == ["А"]
+        assert cache.text_to_morse(MorseConverter(), "SOS") == "... --- ..."
+
+    def test_open_error(self, tmp_path):
+        """Un directorio inválido produce CacheError."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        with pytest.raises(CacheError):
+            ConversionCache(blocker / "cache")
@@ -0,0 +1,157 @@
+import pytest
+from morse_converter.core.code_tables import (
+    CodeTable, available_tables, compile_table, get_table, register_table
+)
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.validator import InputValidator, ValidationError
+
+class TestCodeTables:
+    """Test suite for the code table registry."""
+
+    def test_builtin_tables_registered(self):
+        """Las tablas incluidas están disponibles por nombre."""
+        for name in ("standard", "itu", "latin", "cyrillic", "greek", "wabun", "prosigns"):
+            assert name in available_tables()
+
+    def test_standard_matches_legacy_alphabet(self):
+        """La tabla estándar conserva las 42 entradas originales."""
+        compiled = compile_table("standard")
+        assert len(compiled.encode) == 42
+        assert compiled.encode['@'] == '.--.-.'
+        assert '$' not in compiled.encode
+        assert compiled.punctuation == frozenset('.!?@,')
+
+    def test_compilation_is_cached(self):
+        """Compilar la misma selección devuelve el mismo objeto."""
+        assert compile_table("itu+prosigns") is compile_table(["itu", "prosigns"])
+
+    def test_first_table_wins_on_conflict(self):
+        """Con códigos repetidos, la primera tabla tiene prioridad."""
+        assert compile_table("itu+prosigns").decode['-...-'] == '='
+        assert compile_table("prosigns+itu").decode['-...-'] == '<BT>'
+        assert compile_table("cyrillic+standard").decode['.-'] == 'А'
+
+    def test_text_pattern_derived_from_table(self):
+        """El patrón de texto acepta ambas mayúsculas y minúsculas."""
+        pattern = compile_table("greek").text_pattern
+        assert pattern.match("Αλφα Ωμεγα")
+        assert not pattern.match("ABC")
+
+    def test_unknown_table(self):
+        """Una tabla desconocida produce ValueError."""
+        with pytest.raises(ValueError, match="Unknown code table"):
+            compile_table("klingon")
+        with pytest.raises(ValueError):
+            compile_table("")
+
+    def test_register_table(self):
+        """Registrar una tabla nueva la hace compilable."""
+        register_table(CodeTable(name="test-extra", mapping={'Ŧ': '-.-.-.-'}), replace=True)
+        assert get_table("test-extra").mapping['Ŧ'] == '-.-.-.-'
+        assert compile_table("standard+test-extra").encode['Ŧ'] == '-.-.-.-'
+        with pytest.raises(ValueError, match="already registered"):
+            register_table(CodeTable(name="test-extra", mapping={}))
+
+    def test_register_invalid_code(self):
+        """Los códigos con símbolos distintos de punto y raya se rechazan."""
+        with pytest.raises(ValueError, match="Invalid Morse code"):
+            register_table(CodeTable(name="test-invalid", mapping={'X': '._'}))
+
+class TestConverterTables:
+    """Conversion and validation with non-default code tables."""
+
+    @pytest.mark.parametrize("table,text", [
+        ("cyrillic", "ПРИВЕТ МИР"),
+        ("greek", "ΓΕΙΑ ΣΟΥ"),
+        ("wabun", "イロハ"),
+        ("standard+latin", "ÇA VA"),
+    ])
+    def test_round_trip(self, table, text):
+        """Round trip conversion with international alphabets."""
+        converter = MorseConverter(table=table)
+        assert converter.morse_to_text(converter.text_to_morse(text)) == text
+
+    def test_itu_punctuation(self):
+        """La tabla ITU admite la puntuación completa."""
+        converter = MorseConverter(table="itu")
+        assert converter.text_to_morse("$") == '...-..-'
+        assert converter.morse_to_text('-..-.') == '/'
+
+    def test_set_table(self):
+        """Cambiar de tabla en tiempo de ejecución."""
+        converter = MorseConverter()
+        with pytest.raises(ValueError):
+            converter.text_to_morse("Д")
+        converter.set_table("cyrillic")
+        assert converter.text_to_morse("Д") == '-..'
+        converter.set_table("standard")
+        assert converter.text_to_morse("D") == '-..'
+
+    def test_validator_follows_table(self):
+        """El validador deriva los caracteres aceptados de la tabla."""
+        validator = InputValidator()
+        with pytest.raises(ValidationError):
+            validator.validate_text_input("Привет")
+        validator.set_table("cyrillic")
+        assert validator.validate_text_input("Привет")
+        with pytest.raises(ValidationError):
+            validator.validate_text_input("Hello")
+
+    def test_validator_symbol_length_follows_table(self):
+        """Los prosignos largos amplían la longitud máxima de símbolo."""
+        validator = InputValidator("standard+prosigns")
+        assert validator.validate_morse_input("...---...")
+        with pytest.raises(ValidationError):
+            InputValidator().validate_morse_input("...---...")
+
+    @pytest.mark.parametrize("text", ["CQ <SK", "CQ SK>", "A < B", "<XX>"])
+    def test_validator_rejects_unbalanced_prosigns(self, text):
+        """Un '<' o '>' suelto o un prosigno desconocido no es válido."""
+        validator = InputValidator("standard+prosigns")
+        assert validator.validate_text_input("CQ <sk>")
+        with pytest.raises(ValidationError, match="prosign"):
+            validator.validate_text_input(text)
+
+class TestTokenizer:
+    """Longest-match tokenization of multi-character tokens."""
+
+    @pytest.fixture
+    def table(self):
+        return compile_table("standard+prosigns")
+
+    def test_plain_text_yields_characters(self, table):
+        """Sin tokens especiales se devuelven los caracteres tal cual."""
+        assert not table.has_tokens("HELLO WORLD")
+        assert list(table.tokenize("HI")) == ['H', 'I']
+
+    def test_prosigns_are_single_tokens(self, table):
+        """Los prosignos se emiten como un solo token."""
+        assert list(table.tokenize("K<SK>")) == ['K', '<SK>']
+        assert list(table.tokenize("<SOS> <AR>")) == ['<SOS>', ' ', '<AR>']
+
+    def test_longest_match(self):
+        """Se elige la coincidencia más larga disponible."""
+        register_table(CodeTable(name="test-abbrev", mapping={'CQ': '-.-.--.-', 'CQD': '-.-.--.--..'}),
+                       replace=True)
+        table = compile_table("test-abbrev+standard")
+        assert list(table.tokenize("CQDX")) == ['CQD', 'X']
+        assert list(table.tokenize("CQX")) == ['CQ', 'X']
+        assert list(table.tokenize("CX")) == ['C', 'X']
+
+    def test_unterminated_token(self, table):
+        """Un token incompleto se procesa carácter a carácter."""
+        assert list(table.tokenize("<S")) == ['<', 'S']
+
+    def test_converter_prosigns(self):
+        """Encode prosigns as run-together codes and decode them back."""
+        converter = MorseConverter(table="standard+prosigns")
+        morse = converter.text_to_morse("CQ DE K <SK>")
+        assert morse == "-.-. --.-  -.. .  -.-  ...-.-"
+        assert converter.morse_to_text(morse) == "CQ DE K <SK>"
+        assert converter.text_to_morse("<ar>") == ".-.-."
+
+    def test_converter_incomplete_prosign(self):
+        """Un prosigno desconocido produce ValueError."""
+        converter = MorseConverter(table="standard+prosigns")
+        with pytest.raises(ValueError):
+            converter.text_to_morse("<XX>")
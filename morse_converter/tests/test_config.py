@@ -0,0 +1,101 @@
+import json
+import os
+import pytest
+from morse_converter.config import DEFAULT_CONFIG, Config, ConfigService, env_overrides
+
+class TestConfigService:
+    """Test suite for ConfigService."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(DEFAULT_CONFIG))
+        return path
+
+    def write(self, path, frequency, mtime):
+        """Escribe una frecuencia nueva y fuerza otra fecha de modificación."""
+        data = json.loads(path.read_text())
+        data["audio"]["frequency"] = frequency
+        path.write_text(json.dumps(data))
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_parses_once(self, path):
+        """El archivo se lee una vez y el resultado queda en caché."""
+        service = ConfigService(path, environ={})
+        config = service.get()
+        assert isinstance(config, Config)
+        assert config.audio.frequency == 800
+        path.write_text("not json")
+        assert service.get() is config
+        assert service.as_dict()["audio"]["frequency"] == 800
+
+    def test_as_dict_is_a_copy(self, path):
+        """Modificar el diccionario devuelto no altera la configuración compartida."""
+        service = ConfigService(path, environ={})
+        data = service.as_dict()
+        data["audio"]["frequency"] = 1
+        assert service.as_dict()["audio"]["frequency"] == 800
+
+    def test_creates_missing_file(self, tmp_path):
+        """Sin archivo se crea uno con los valores por defecto."""
+        path = tmp_path / "config.json"
+        assert ConfigService(path, environ={}).as_dict()["cache"]["enabled"] is False
+        assert json.loads(path.read_text()) == DEFAULT_CONFIG
+
+    def test_invalid_initial_config(self, path):
+        """Una configuración inicial no válida lanza ValueError."""
+        path.write_text("{")
+        with pytest.raises(ValueError):
+            ConfigService(path, environ={}).get()
+
+    def test_env_overrides(self, path):
+        """MORSE_<SECCION>__<CAMPO> sobrescribe y se valida como el archivo."""
+        environ = {"MORSE_AUDIO__FREQUENCY": "700", "MORSE_CACHE__ENABLED": "true", "MORSE_NOPE__X": "1"}
+        assert env_overrides(environ) == {"audio": {"frequency": "700"}, "cache": {"enabled": "true"}}
+        config = ConfigService(path, environ=environ).get()
+        assert config.audio.frequency == 700
+        assert config.cache.enabled is True
+        with pytest.raises(ValueError):
+            ConfigService(path, environ={"MORSE_AUDIO__VOLUME": "3"}).get()
+
+    def test_watch_reloads_on_mtime_change(self, path):
+        """Con watch se recarga al cambiar el archivo y se avisa a los suscriptores."""
+        service = ConfigService(path, environ={}, watch=True, check_interval=0)
+        seen = []
+        service.subscribe(seen.append)
+        service.get()
+        self.write(path, 600, 10**18)
+        assert service.get().audio.frequency == 600
+        assert [c.audio.frequency for c in seen] == [600]
+        # Sin cambios no se vuelve a leer
+        service.get()
+        assert len(seen) == 1
+
+    def test_watch_keeps_previous_on_invalid(self, path):
+        """Un archivo no válido no sustituye la configuración actual."""
+        service = ConfigService(path, environ={}, watch=True, check_interval=0)
+        service.get()
+        self.write(path, 5, 10**18)
+        assert service.get().audio.frequency == 800
+        self.write(path, 900, 2 * 10**18)
+        assert service.get().audio.frequency == 900
+
+    def test_without_watch_needs_reload(self, path):
+        """Sin watch los cambios sólo se aplican con reload()."""
+        service = ConfigService(path, environ={})
+        service.get()
+        self.write(path, 600, 10**18)
+        assert service.get().audio.frequency == 800
+        assert service.reload() is True
+        assert service.get().audio.frequency == 600
+
+    def test_update(self, path):
+        """update valida, guarda y aplica la nueva configuración."""
+        service = ConfigService(path, environ={})
+        data = service.as_dict()
+        data["audio"]["wpm"] = 30
+        assert service.update(data).audio.wpm == 30
+        assert json.loads(path.read_text())["audio"]["wpm"] == 30
+        data["audio"]["wpm"] = 1000
+        with pytest.raises(ValueError):
+            service.update(data)
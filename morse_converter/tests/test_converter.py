@@ -100,3 +100,15 @@ class TestMorseConverter:
         morse = converter.text_to_morse(text)
         assert morse == expected
         assert converter.morse_to_text(morse) == text
+
+    def test_code_dicts_are_read_only(self, converter):
+        """Test that converters cannot alter the code table they share."""
+        with pytest.raises(TypeError):
+            converter.MORSE_CODE_DICT['A'] = '-'
+        with pytest.raises(TypeError):
+            converter.MORSE_TO_TEXT['.-'] = 'B'
+        with pytest.raises(TypeError):
+            MorseConverter.MORSE_CODE_DICT['A'] = '-'
+        with pytest.raises(TypeError):
+            MorseConverter.MORSE_TO_TEXT['.-'] = 'B'
+        assert MorseConverter().text_to_morse("A") == ".-"
@@ -0,0 +1,181 @@
+import time
+import pytest
+import numpy as np
+from morse_converter.core.audio import AudioGenerator, AudioError, write_wav
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.decoder import (
+    AudioDecoder,
+    StreamingDecoder,
+    block_magnitudes,
+    run_lengths,
+    keying_to_morse,
+)
+
+def render(morse: str, generator: AudioGenerator = None) -> np.ndarray:
+    """Renders Morse code with an AudioGenerator and returns the samples."""
+    generator = generator or AudioGenerator()
+    generator.generate_audio(morse)
+    return generator._audio_buffer
+
+class TestDecoderHelpers:
+    """Test suite for the decoder building blocks."""
+
+    def test_block_magnitudes_tone_and_silence(self):
+        """Test that a full-scale tone measures ~1.0 and silence ~0.0."""
+        t = np.arange(44100) / 44100
+        tone = np.sin(2 * np.pi * 800 * t)
+        levels = block_magnitudes(tone, 800, 44100, 220)
+        assert levels.shape == (44100 // 220,)
+        np.testing.assert_allclose(levels, 1.0, atol=0.05)
+        assert np.all(block_magnitudes(np.zeros(2200), 800, 44100, 220) == 0)
+
+    def test_block_magnitudes_multiple_frequencies(self):
+        """Test that an array of frequencies returns one column per frequency."""
+        t = np.arange(4410) / 44100
+        levels = block_magnitudes(np.sin(2 * np.pi * 600 * t), np.array([600, 1000]), 44100, 441)
+        assert levels.shape == (10, 2)
+        assert np.all(levels[:, 0] > 10 * levels[:, 1])
+
+    def test_run_lengths(self):
+        """Test run-length encoding of keying states."""
+        values, lengths = run_lengths(np.array([1, 1, 0, 0, 0, 1], dtype=bool))
+        assert values.tolist() == [True, False, True]
+        assert lengths.tolist() == [2, 3, 1]
+
+    def test_keying_to_morse_spacing(self):
+        """Test classification of marks and gaps in dit units."""
+        on, off = [True], [False]
+        states = np.array(on * 2 + off * 2 + on * 6 + off * 6 + on * 2 + off * 14 + on * 6)
+        assert keying_to_morse(states) == ".- .  -"
+
+    def test_keying_to_morse_empty(self):
+        """Test that silence decodes to an empty string."""
+        assert keying_to_morse(np.zeros(10, dtype=bool)) == ""
+
+class TestAudioDecoder:
+    """Test suite for AudioDecoder class."""
+
+    @pytest.fixture
+    def decoder(self):
+        """Fixture that provides an AudioDecoder with default settings."""
+        return AudioDecoder()
+
+    @pytest.mark.parametrize("text", ["SOS", "HELLO WORLD", "73", "E T"])
+    def test_roundtrip_generator_output(self, decoder, text):
+        """Test decoding audio rendered by AudioGenerator."""
+        morse = MorseConverter().text_to_morse(text)
+        assert decoder.decode_morse(render(morse)) == morse
+        assert decoder.decode(render(morse)) == text
+
+    def test_decode_adapts_to_speed(self):
+        """Test that a faster sender is decoded without configuration."""
+        generator = AudioGenerator()
+        generator.set_timing(dot_duration=0.04, dash_duration=0.12, symbol_space=0.04,
+                             letter_space=0.12, word_space=0.28)
+        assert AudioDecoder().decode(render("-.-. --.-  -.. .", generator)) == "CQ DE"
+
+    def test_decode_with_noise(self, decoder):
+        """Test decoding with additive white noise."""
+        samples = render(".... . .-.. .-.. ---")
+        noisy = samples + np.random.default_rng(0).normal(0, 0.3, len(samples))
+        assert decoder.decode(noisy) == "HELLO"
+
+    def test_decode_file(self, decoder, tmp_path):
+        """Test decoding a WAV file written by AudioGenerator."""
+        generator = AudioGenerator()
+        generator.generate_audio("... --- ...")
+        wav_path = tmp_path / "sos.wav"
+        generator.save_wav(wav_path)
+        assert decoder.decode_file(wav_path) == "SOS"
+
+    def test_decode_file_keeps_sample_rate(self, decoder, tmp_path):
+        """Test that the sample rate of a file does not change the decoder's."""
+        wav_path = tmp_path / "sos.wav"
+        write_wav(wav_path, render("... --- ...")[::2], 22050)
+        assert decoder.decode_file(wav_path) == "SOS"
+        assert decoder.sample_rate == 44100
+        assert decoder.decode(render("... --- ...")) == "SOS"
+
+    def test_decode_file_missing(self, decoder, tmp_path):
+        """Test that unreadable files raise AudioError."""
+        with pytest.raises(AudioError):
+            decoder.decode_file(tmp_path / "missing.wav")
+
+    def test_decode_silence(self, decoder):
+        """Test that silence decodes to an empty string."""
+        assert decoder.decode(np.zeros(44100)) == ""
+
+    def test_faster_than_real_time(self, decoder):
+        """Test that decoding is much faster than the audio duration."""
+        samples = render(MorseConverter().text_to_morse("THE QUICK BROWN FOX"))
+        start = time.perf_counter()
+        decoder.decode_morse(samples)
+        elapsed = time.perf_counter() - start
+        assert elapsed < (len(samples) / decoder.sample_rate) / 20
+
+# Silencio inicial: un receptor real empieza con la portadora apagada
+LEAD_IN = 4410
+
+class TestStreamingDecoder:
+    """Test suite for StreamingDecoder class."""
+
+    @pytest.fixture
+    def decoder(self):
+        """Fixture that provides a StreamingDecoder with default settings."""
+        return StreamingDecoder()
+
+    def stream(self, decoder, samples, block=1024, lead_in=LEAD_IN):
+        """Feeds samples in fixed-size chunks and returns everything emitted."""
+        samples = np.concatenate((np.zeros(lead_in), samples))
+        output = [decoder.feed(samples[i:i + block]) for i in range(0, len(samples), block)]
+        return ''.join(output) + decoder.flush()
+
+    def test_stream_decodes_generator_output(self, decoder):
+        """Test streaming decode of AudioGenerator output in small chunks."""
+        morse = MorseConverter().text_to_morse("CQ CQ DE EA4")
+        assert self.stream(decoder, render(morse)) == "CQ CQ DE EA4"
+
+    def test_emits_letters_before_end_of_input(self, decoder):
+        """Test that a letter is returned as soon as its letter gap is seen."""
+        samples = np.concatenate((np.zeros(LEAD_IN), render("... ---")))
+        letter_gap_end = LEAD_IN + int(44100 * (3 * 0.1 + 2 * 0.1 + 0.3))
+        emitted = decoder.feed(samples[:letter_gap_end])
+        assert emitted == "S"
+
+    def test_tracks_speed_drift(self, decoder):
+        """Test that the speed estimate follows a sender changing speed."""
+        fast = AudioGenerator()
+        fast.set_timing(dot_duration=0.07, dash_duration=0.21, symbol_space=0.07,
+                        letter_space=0.21, word_space=0.49)
+        slow = AudioGenerator()
+        samples = np.concatenate((render("-- --- .-. ...  ", slow), render(".--. .- .-. .. ...", fast)))
+        assert self.stream(decoder, samples) == "MORS PARIS"
+        assert 15 < decoder.wpm < 19
+
+    def test_stream_with_noise(self, decoder):
+        """Test streaming decode with additive white noise."""
+        samples = np.concatenate((np.zeros(LEAD_IN), render("... --- ...")))
+        noisy = samples + np.random.default_rng(1).normal(0, 0.2, len(samples))
+        assert self.stream(decoder, noisy, lead_in=0) == "SOS"
+
+    def test_noise_only_stays_silent(self, decoder):
+        """Test that noise without a carrier decodes to nothing."""
+        noise = np.random.default_rng(2).normal(0, 0.2, 44100 * 2)
+        assert self.stream(decoder, noise, lead_in=0) == ""
+
+    def test_unknown_sequence(self, decoder):
+        """Test that unknown sequences produce the placeholder character."""
+        assert self.stream(decoder, render("........")) == "*"
+
+    def test_state_is_bounded(self, decoder):
+        """Test that only a partial block is retained between calls."""
+        decoder.feed(render(".- .-"))
+        assert len(decoder._pending) < decoder.block_size
+
+    def test_faster_than_real_time(self, decoder):
+        """Test that streaming uses a small fraction of real time."""
+        samples = render(MorseConverter().text_to_morse("VVV DE TEST"))
+        start = time.perf_counter()
+        self.stream(decoder, samples, block=512)
+        elapsed = time.perf_counter() - start
+        assert elapsed < (len(samples) / decoder.sample_rate) / 20
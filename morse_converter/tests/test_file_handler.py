@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import Mock, patch
 from pathlib import Path
-from morse_converter.utils import FileHandler, FileOperationError
+from morse_converter.utils import FileHandler, FileOperationError, detect_compression
 
 class TestFileHandler:
     """Test suite for FileHandler class."""
@@ -147,3 +147,106 @@ class TestFileHandler:
         mock_logger.error.assert_called_with(
             f"Error writing to file {test_file}: I/O error"
         )
+
+    def test_atomic_write_replaces_target(self, tmp_path):
+        """La escritura atómica no deja archivos temporales."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("old")
+        test_file.chmod(0o640)
+
+        FileHandler(atomic=True, fsync="dir").write_file(str(test_file), "new content")
+
+        assert test_file.read_text() == "new content"
+        assert (test_file.stat().st_mode & 0o777) == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["test.txt"]
+
+    def test_atomic_writer_keeps_target_on_error(self, file_handler, tmp_path):
+        """Un error durante la escritura deja intacto el archivo original."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("complete")
+
+        with pytest.raises(RuntimeError):
+            with file_handler.open_writer(str(test_file), atomic=True) as writer:
+                writer.write("partial")
+                assert test_file.read_text() == "complete"
+                raise RuntimeError("crash")
+
+        assert test_file.read_text() == "complete"
+        assert [p.name for p in tmp_path.iterdir()] == ["test.txt"]
+
+    def test_streaming_append_writer(self, file_handler, tmp_path):
+        """El escritor en modo append añade contenido por partes."""
+        test_file = tmp_path / "log" / "out.txt"
+        with file_handler.open_writer(str(test_file), buffer_size=16, fsync="file") as writer:
+            writer.write("... ")
+            writer.write("---")
+        with file_handler.open_writer(str(test_file), append=True) as writer:
+            assert writer.write(" ...") == 4
+
+        assert test_file.read_text() == "... --- ..."
+        assert writer.closed
+
+    def test_invalid_writer_options(self, file_handler, tmp_path):
+        """Política de fsync desconocida o append atómico."""
+        with pytest.raises(ValueError, match="fsync"):
+            FileHandler(fsync="always")
+        with pytest.raises(ValueError, match="fsync"):
+            file_handler.write_file(str(tmp_path / "a.txt"), "x", fsync="sometimes")
+        assert FileHandler(atomic=True).open_writer(str(tmp_path / "b.txt"), append=True).atomic is False
+
+    def test_open_writer_error(self, file_handler, tmp_path, mock_logger):
+        """Los errores al abrir el escritor se notifican como FileOperationError."""
+        test_file = tmp_path / "test.txt"
+        with patch('pathlib.Path.open') as mock_open:
+            mock_open.side_effect = PermissionError("Permission denied")
+            with pytest.raises(FileOperationError, match="Permission denied"):
+                file_handler.open_writer(str(test_file))
+        mock_logger.error.assert_called_with(f"Error opening file {test_file}: Permission denied")
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_compressed_round_trip(self, file_handler, tmp_path, suffix):
+        """Escritura comprimida por extensión y lectura por firma."""
+        test_file = tmp_path / ("test.txt" + suffix)
+        content = "... --- ...  " * 100
+
+        FileHandler(atomic=True).write_file(str(test_file), content)
+        assert detect_compression(str(test_file)) is not None
+        assert len(test_file.read_bytes()) < len(content)
+        assert file_handler.read_file(str(test_file)) == content
+
+        # La firma manda aunque la extensión no coincida
+        renamed = test_file.rename(tmp_path / "renamed.txt")
+        assert "".join(file_handler.iter_chunks(str(renamed), chunk_size=7)) == content
+
+    def test_gzip_header_names_target(self, tmp_path):
+        """La escritura atómica guarda en la cabecera gzip el nombre final."""
+        test_file = tmp_path / "out.txt.gz"
+        FileHandler(atomic=True).write_file(str(test_file), "... --- ...")
+        header = test_file.read_bytes()
+        # FLG.FNAME y nombre terminado en cero tras los 10 bytes de cabecera
+        assert header[3] & 0x08
+        assert header[10:header.index(b'\0', 10)] == b"out.txt"
+
+    def test_compressed_append(self, file_handler, tmp_path):
+        """Añadir a un archivo gzip crea un flujo multimiembro legible."""
+        test_file = tmp_path / "log.txt.gz"
+        with file_handler.open_writer(str(test_file)) as writer:
+            writer.write("first ")
+        with file_handler.open_writer(str(test_file), append=True, fsync="file") as writer:
+            writer.write("second")
+        assert file_handler.read_file(str(test_file)) == "first second"
+
+    def test_iter_chunks_plain(self, file_handler, tmp_path):
+        """Lectura por bloques de un archivo sin comprimir."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("abcdefg")
+        assert list(file_handler.iter_chunks(str(test_file), chunk_size=3)) == ["abc", "def", "g"]
+        with pytest.raises(FileOperationError):
+            list(file_handler.iter_chunks(str(tmp_path / "missing.txt")))
+
+    def test_corrupt_compressed_file(self, file_handler, tmp_path):
+        """Un archivo comprimido corrupto produce FileOperationError."""
+        test_file = tmp_path / "bad.xz"
+        test_file.write_bytes(b"\xfd7zXZ\x00garbage")
+        with pytest.raises(FileOperationError):
+            file_handler.read_file(str(test_file))
@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+from morse_converter.core.audio import AudioGenerator
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.filterbank import FilterBank
+
+def render(text: str, frequency: float, dot: float = 0.1) -> np.ndarray:
+    """Renders text as Morse audio at the given frequency and speed."""
+    generator = AudioGenerator(frequency=frequency)
+    generator.set_timing(dot_duration=dot, dash_duration=3 * dot, symbol_space=dot,
+                         letter_space=3 * dot, word_space=7 * dot)
+    generator.generate_audio(MorseConverter().text_to_morse(text))
+    return generator._audio_buffer
+
+def mix(*signals: np.ndarray) -> np.ndarray:
+    """Sums signals of different lengths, padding with silence."""
+    length = max(len(s) for s in signals)
+    out = np.zeros(length)
+    for signal in signals:
+        out[:len(signal)] += signal
+    return out
+
+class TestFilterBank:
+    """Test suite for FilterBank class."""
+
+    @pytest.fixture
+    def bank(self):
+        """Fixture that provides a FilterBank over the default grid."""
+        return FilterBank()
+
+    def test_default_grid(self, bank):
+        """Test the default candidate frequency grid."""
+        assert bank.frequencies[0] == 300
+        assert bank.frequencies[-1] == 1500
+        assert np.all(np.diff(bank.frequencies) == 50)
+
+    def test_invalid_frequencies(self):
+        """Test that an empty frequency list is rejected."""
+        with pytest.raises(ValueError):
+            FilterBank(frequencies=[])
+
+    def test_magnitudes_shape(self, bank):
+        """Test that all frequencies are evaluated per block."""
+        levels = bank.magnitudes(np.zeros(44100))
+        assert levels.shape == (100, bank.frequencies.size)
+
+    def test_detect_carriers(self, bank):
+        """Test detection of several simultaneous carriers."""
+        samples = mix(render("SOS", 500), render("TEST", 800), render("CQ", 1200))
+        assert bank.detect_carriers(samples) == [500.0, 800.0, 1200.0]
+
+    @pytest.mark.parametrize("low", [500, 600, 1000])
+    def test_detect_close_carriers(self, bank, low):
+        """Test that carriers 200 Hz apart are reported at their exact frequencies."""
+        samples = mix(render("SOS", low), render("TEST", low + 200))
+        assert bank.detect_carriers(samples) == [float(low), float(low + 200)]
+        assert bank.decode_channels(samples) == {float(low): "SOS", float(low + 200): "TEST"}
+
+    def test_detect_no_carriers(self, bank):
+        """Test that noise alone yields no carriers."""
+        noise = np.random.default_rng(0).normal(0, 0.1, 44100)
+        assert bank.detect_carriers(noise) == []
+
+    def test_detect_weak_carriers(self, bank):
+        """Test that quiet recordings are detected like loud ones."""
+        samples = mix(render("SOS", 500), render("TEST", 800)) * 1e-3
+        assert bank.detect_carriers(samples) == [500.0, 800.0]
+        assert bank.decode_channels(samples) == {500.0: "SOS", 800.0: "TEST"}
+        assert bank.detect_carriers(np.zeros(44100)) == []
+
+    def test_decode_channels(self, bank):
+        """Test decoding independent messages on different frequencies."""
+        samples = mix(
+            render("CQ DE EA4", 600),
+            render("SOS", 1000, dot=0.06),
+        )
+        assert bank.decode_channels(samples) == {600.0: "CQ DE EA4", 1000.0: "SOS"}
+
+    def test_decode_channels_with_noise(self, bank):
+        """Test multi-channel decoding with additive noise."""
+        samples = mix(render("HELLO", 700), render("WORLD", 1100))
+        samples += np.random.default_rng(1).normal(0, 0.2, len(samples))
+        assert bank.decode_channels(samples) == {700.0: "HELLO", 1100.0: "WORLD"}
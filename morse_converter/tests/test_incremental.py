@@ -0,0 +1,87 @@
+import random
+import pytest
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.incremental import IncrementalConverter, MorsePatch
+
+class TestIncrementalConverter:
+    """Test suite for IncrementalConverter."""
+
+    @pytest.fixture
+    def converter(self):
+        return MorseConverter()
+
+    def test_load_matches_full_conversion(self, converter):
+        """La conversión inicial coincide con text_to_morse."""
+        text = "HELLO WORLD!  THIS is A TEST, 123"
+        doc = IncrementalConverter(text, converter, block_size=4)
+        assert doc.morse == converter.text_to_morse(text)
+        assert doc.text == text
+        assert len(doc) == len(text)
+
+    def test_apply_edit_returns_patch(self, converter):
+        """The patch turns the previous output into the new one."""
+        doc = IncrementalConverter("HELLO WORLD", converter)
+        before = doc.morse
+        patch = doc.apply_edit(6, 11, "THERE")
+        assert isinstance(patch, MorsePatch)
+        assert patch.apply(before) == doc.morse == converter.text_to_morse("HELLO THERE")
+        assert patch.start >= len(converter.text_to_morse("HELLO")) + 2
+        assert len(patch.replacement) <= len(converter.text_to_morse("THERE"))
+
+    @pytest.mark.parametrize("block_size", [1, 3, 16, 2048])
+    def test_random_edits(self, converter, block_size):
+        """Ediciones aleatorias mantienen la salida igual a una conversión completa."""
+        random.seed(block_size)
+        alphabet = "ABC12 .,!  "
+        text = "".join(random.choice(alphabet) for _ in range(200))
+        doc = IncrementalConverter(text, converter, block_size=block_size)
+        for _ in range(300):
+            start = random.randint(0, len(text))
+            end = random.randint(start, min(len(text), start + 6))
+            replacement = "".join(random.choice(alphabet) for _ in range(random.randint(0, 6)))
+            before = doc.morse
+            patch = doc.apply_edit(start, end, replacement)
+            text = text[:start] + replacement + text[end:]
+            assert doc.text == text
+            assert doc.morse == converter.text_to_morse(text)
+            assert patch.apply(before) == doc.morse
+
+    def test_update_with_new_version(self, converter):
+        """update() re-encodes only the changed span of a new version."""
+        words = [f"WORD{i}" for i in range(1000)]
+        doc = IncrementalConverter(" ".join(words), converter, block_size=64)
+        before = doc.morse
+        words[500] = "EDITED"
+        patch = doc.update(" ".join(words))
+        assert doc.morse == converter.text_to_morse(" ".join(words))
+        assert patch.apply(before) == doc.morse
+        assert len(patch.replacement) <= len(converter.text_to_morse("EDITED"))
+
+    def test_empty_document(self, converter):
+        """Documentos vacíos y borrado completo."""
+        doc = IncrementalConverter("", converter)
+        assert doc.morse == ""
+        patch = doc.apply_edit(0, 0, "SOS")
+        assert patch == MorsePatch(0, 0, "... --- ...")
+        patch = doc.apply_edit(0, 3, "")
+        assert patch == MorsePatch(0, 11, "")
+        assert doc.morse == ""
+
+    def test_invalid_edit_leaves_document_unchanged(self, converter):
+        """Un error no modifica el documento."""
+        doc = IncrementalConverter("HELLO WORLD", converter)
+        with pytest.raises(ValueError):
+            doc.apply_edit(0, 5, "BAD$")
+        with pytest.raises(ValueError, match="Invalid edit span"):
+            doc.apply_edit(5, 50, "")
+        with pytest.raises(TypeError):
+            doc.apply_edit(0, 0, 42)
+        assert doc.text == "HELLO WORLD"
+        assert doc.morse == converter.text_to_morse("HELLO WORLD")
+
+    def test_prosign_tokens(self):
+        """Los prosignos se recodifican como una sola palabra."""
+        converter = MorseConverter("standard+prosigns")
+        doc = IncrementalConverter("CQ <SK>", converter)
+        doc.apply_edit(4, 7, "AR>")
+        assert doc.morse == converter.text_to_morse("CQ <AR>")
@@ -1,8 +1,17 @@
+import copy
+import json
+from pathlib import Path
 import pytest
 from typer.testing import CliRunner
 from unittest.mock import Mock, patch
+import morse_converter.cli.interface as interface
 from morse_converter.cli.interface import app
 from morse_converter.cli.interface import ValidationError
+from morse_converter.config import DEFAULT_CONFIG, ConfigService, get_service
+from morse_converter.core.code_tables import compile_table
+from morse_converter.core.converter import MorseConverter
+from morse_converter.utils import FileHandler
+from morse_converter.utils.cache import ConversionCache
 
 # Configurar el runner de CLI para los tests
 runner = CliRunner()
@@ -231,3 +240,362 @@ def test_play_morse_validation_error(mock_dependencies):
         
         # Verificar que se registró el error
         mock_dependencies['validator'].return_value.validate_morse_input.assert_called_once()
+
+def test_profile_flag_prints_breakdown(mock_dependencies, tmp_path):
+    """Test que --profile muestra el desglose por etapa y vuelca cProfile."""
+    stats_file = tmp_path / "profile.pstats"
+
+    with patch('morse_converter.cli.interface.metrics') as mock_metrics:
+        mock_metrics.summary.return_value = [{
+            "name": "converter.text_to_morse", "labels": {}, "calls": 1,
+            "total": 0.002, "mean": 0.002, "max": 0.002, "share": 1.0,
+        }]
+        result = runner.invoke(
+            app, ["--profile", "--profile-output", str(stats_file), "text-to-morse", "SOS"]
+        )
+
+    assert result.exit_code == 0
+    assert "converter.text_to_morse" in result.stdout
+    assert stats_file.exists()
+    mock_metrics.enable.assert_called_once()
+    mock_metrics.disable.assert_called_once()
+
+def test_metrics_file_option(mock_dependencies, tmp_path):
+    """Test que --metrics-file escribe las métricas al terminar el comando."""
+    metrics_file = tmp_path / "morse.prom"
+
+    result = runner.invoke(app, ["--metrics-file", str(metrics_file), "text-to-morse", "SOS"])
+
+    assert result.exit_code == 0
+    assert metrics_file.exists()
+
+def test_convert_file_parallel(mock_dependencies, tmp_path):
+    """El comando convert-file usa ParallelConverter con la tabla activa."""
+    source = tmp_path / "input.txt"
+    source.write_text("SOS")
+    mock_dependencies['converter'].return_value.table.names = ("standard",)
+
+    with patch('morse_converter.cli.interface.ParallelConverter') as mock_parallel:
+        mock_parallel.return_value.convert_file.return_value = 11
+        result = runner.invoke(app, [
+            "convert-file", str(source), str(tmp_path / "out.txt"),
+            "--to-text", "--workers", "2", "--chunk-size", "8"
+        ])
+
+    assert result.exit_code == 0
+    mock_parallel.assert_called_once_with(workers=2, chunk_size=8 * 1024 * 1024, table="standard")
+    mock_parallel.return_value.convert_file.assert_called_once_with(
+        str(source), str(tmp_path / "out.txt"), "morse-to-text"
+    )
+    assert "11 bytes" in result.stdout
+
+def test_convert_file_cache(mock_dependencies, tmp_path):
+    """Con --cache la segunda conversión del mismo archivo no se repite."""
+    source, target = tmp_path / "input.txt", tmp_path / "out.txt"
+    source.write_text("SOS")
+    mock_dependencies['converter'].return_value.table = compile_table()
+    mock_dependencies['file_handler'].return_value = FileHandler()
+
+    def convert(input_path, output_path, direction):
+        target.write_text("... --- ...")
+        return 11
+
+    with patch('morse_converter.cli.interface.config', {'cache': {'directory': str(tmp_path / "cache")}}), \
+         patch('morse_converter.cli.interface.ParallelConverter') as mock_parallel:
+        mock_parallel.return_value.convert_file.side_effect = convert
+        for _ in range(2):
+            result = runner.invoke(app, ["convert-file", str(source), str(target), "--cache"])
+            assert result.exit_code == 0
+
+    assert mock_parallel.return_value.convert_file.call_count == 1
+    assert "cached" in result.stdout
+    assert target.read_text() == "... --- ..."
+
+def test_convert_file_cache_too_large(mock_dependencies, tmp_path):
+    """Una salida mayor que la caché no se lee ni se guarda."""
+    source, target = tmp_path / "input.txt", tmp_path / "out.txt"
+    source.write_text("SOS " * 100)
+    mock_dependencies['converter'].return_value.table = compile_table()
+    mock_dependencies['file_handler'].return_value = FileHandler()
+    config = {'cache': {'directory': str(tmp_path / "cache"), 'max_size': 64}}
+
+    with patch('morse_converter.cli.interface.config', config), \
+         patch.object(FileHandler, 'read_file', side_effect=AssertionError("output read")):
+        result = runner.invoke(app, ["convert-file", str(source), str(target), "--cache", "-w", "1"])
+
+    assert result.exit_code == 0
+    assert "cached" not in result.stdout
+
+def test_convert_file_cache_compression(mock_dependencies, tmp_path):
+    """La caché guarda el texto convertido y cada salida se comprime según su extensión."""
+    source = tmp_path / "input.txt"
+    source.write_text("SOS")
+    mock_dependencies['converter'].return_value.table = compile_table()
+    mock_dependencies['file_handler'].return_value = FileHandler()
+
+    with patch('morse_converter.cli.interface.config', {'cache': {'directory': str(tmp_path / "cache")}}):
+        for name in ("out.txt.gz", "out.txt", "again.txt.bz2"):
+            result = runner.invoke(app, ["convert-file", str(source), str(tmp_path / name), "--cache", "-w", "1"])
+            assert result.exit_code == 0
+            assert FileHandler().read_file(str(tmp_path / name)) == "... --- ..."
+
+    assert "cached" in result.stdout
+    assert (tmp_path / "out.txt").read_text() == "... --- ..."
+    assert not list(tmp_path.glob(".*.tmp"))
+
+def test_convert_file_cache_unavailable(mock_dependencies, tmp_path):
+    """Si la caché no se puede abrir el archivo se convierte sin ella."""
+    source, target = tmp_path / "input.txt", tmp_path / "out.txt"
+    source.write_text("SOS")
+    mock_dependencies['converter'].return_value.table = compile_table()
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    with patch('morse_converter.cli.interface.config', {'cache': {'directory': str(blocker / "cache")}}):
+        result = runner.invoke(app, ["convert-file", str(source), str(target), "--cache", "-w", "1"])
+
+    assert result.exit_code == 0
+    assert target.read_text() == "... --- ..."
+
+def test_convert_file_cache_closed_on_error(mock_dependencies, tmp_path):
+    """La caché se cierra aunque la conversión falle."""
+    source = tmp_path / "input.txt"
+    source.write_text("SOS")
+    mock_dependencies['converter'].return_value.table = compile_table()
+
+    with patch('morse_converter.cli.interface.config', {'cache': {'directory': str(tmp_path / "cache")}}), \
+         patch('morse_converter.cli.interface.ParallelConverter') as mock_parallel, \
+         patch.object(ConversionCache, 'close', autospec=True) as close:
+        mock_parallel.return_value.convert_file.side_effect = ValueError("boom")
+        result = runner.invoke(app, ["convert-file", str(source), str(tmp_path / "out.txt"), "--cache"])
+
+    assert result.exit_code == 1
+    close.assert_called_once()
+
+def test_text_to_morse_pipe(mock_dependencies):
+    """Sin argumento se convierte stdin a stdout línea a línea, sin Rich."""
+    real = MorseConverter()
+    mock_dependencies['converter'].return_value.encode_many.side_effect = real.encode_many
+
+    result = runner.invoke(app, ["text-to-morse"], input="SOS\r\nhi there\n\nE")
+    assert result.exit_code == 0
+    assert result.stdout == "... --- ...\n.... ..  - .... . .-. .\n\n.\n"
+
+    result = runner.invoke(app, ["text-to-morse", "-"], input="")
+    assert result.exit_code == 0
+    assert result.stdout == ""
+
+def test_morse_to_text_pipe(mock_dependencies, tmp_path):
+    """El modo tubería también puede escribir en un archivo."""
+    real = MorseConverter()
+    mock_dependencies['converter'].return_value.decode_many.side_effect = real.decode_many
+    mock_dependencies['file_handler'].return_value = FileHandler(atomic=True)
+
+    output = tmp_path / "out.txt"
+    result = runner.invoke(app, ["morse-to-text", "-", "-o", str(output)], input="... --- ...\n.-\n")
+    assert result.exit_code == 0
+    assert output.read_text() == "SOS\nA\n"
+
+def test_pipe_reports_line_number(mock_dependencies):
+    """Un error indica la línea y conserva la salida anterior."""
+    real = MorseConverter()
+    mock_dependencies['converter'].return_value.encode_many.side_effect = real.encode_many
+
+    result = runner.invoke(app, ["text-to-morse"], input="A\nB\nC$\nD\n")
+    assert result.exit_code == 1
+    assert result.stdout.startswith(".-\n-...\n")
+    assert "Line 3: Character '$' is not supported" in result.output
+
+def test_pipe_splits_long_line(mock_dependencies):
+    """Una línea más larga que el bloque se convierte por partes en límites de palabra."""
+    real = MorseConverter()
+    mock_dependencies['converter'].return_value.encode_many.side_effect = real.encode_many
+    mock_dependencies['converter'].return_value.decode_many.side_effect = real.decode_many
+    text = " ".join(["HELLO", "WORLD", "SOS"] * 20)
+    morse = real.text_to_morse(text)
+
+    with patch.object(interface, 'PIPE_CHUNK_SIZE', 16), \
+         patch.object(interface, 'last_boundary', wraps=interface.last_boundary) as boundary:
+        result = runner.invoke(app, ["text-to-morse"], input=text + "\nE\n")
+        assert result.exit_code == 0
+        assert result.stdout == morse + "\n.\n"
+        assert boundary.called
+
+        result = runner.invoke(app, ["morse-to-text"], input=morse + "\n.-")
+        assert result.exit_code == 0
+        assert result.stdout == text + "\nA\n"
+
+        result = runner.invoke(app, ["--format", "ndjson", "text-to-morse"], input=text + "\nE")
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert "".join(r["output"] for r in records if r["line"] == 1) == morse
+        assert [r["part"] for r in records if r["line"] == 1] == list(range(len(records) - 1))
+        assert records[-1] == {"line": 2, "input": "E", "output": "."}
+
+def test_pipe_rejects_play(mock_dependencies):
+    """La reproducción no está disponible leyendo stdin."""
+    result = runner.invoke(app, ["text-to-morse", "--play"], input="SOS\n")
+    assert result.exit_code != 0
+
+def test_plain_format(mock_dependencies):
+    """--format plain escribe sólo el resultado."""
+    result = runner.invoke(app, ["--format", "plain", "text-to-morse", "SOS"])
+    assert result.exit_code == 0
+    assert result.stdout == "... --- ...\n"
+
+def test_json_format_includes_metadata(mock_dependencies, tmp_path):
+    """--format json incluye tamaños, tiempos y el archivo de salida."""
+    output_file = tmp_path / "out.txt"
+    result = runner.invoke(app, ["--format", "json", "text-to-morse", "SOS", "-o", str(output_file)])
+    assert result.exit_code == 0
+    record = json.loads(result.stdout)
+    assert record["command"] == "text-to-morse"
+    assert record["output"] == "... --- ..."
+    assert record["input_size"] == 3 and record["output_size"] == 11
+    assert record["elapsed_ms"] >= 0
+    assert record["output_file"] == str(output_file)
+
+def test_ndjson_format_errors(mock_dependencies):
+    """Los errores en ndjson son objetos JSON en stderr."""
+    mock_dependencies['validator'].return_value.validate_morse_input.side_effect = \
+        ValidationError("Invalid Morse code characters")
+    result = runner.invoke(app, ["--format", "ndjson", "morse-to-text", ".x"])
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert json.loads(result.stderr) == {"error": "Validation Error", "message": "Invalid Morse code characters"}
+
+def test_ndjson_pipe(mock_dependencies):
+    """En modo tubería ndjson produce un objeto por línea."""
+    mock_dependencies['converter'].return_value.encode_many.side_effect = MorseConverter().encode_many
+    result = runner.invoke(app, ["--format", "ndjson", "text-to-morse"], input="E\nT\n")
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [
+        {"line": 1, "input": "E", "output": "."},
+        {"line": 2, "input": "T", "output": "-"},
+    ]
+    result = runner.invoke(app, ["--format", "json", "text-to-morse"], input="E\nT\n")
+    assert [r["output"] for r in json.loads(result.stdout)] == [".", "-"]
+
+def test_invalid_format(mock_dependencies):
+    """Un formato desconocido es un error de parámetro."""
+    result = runner.invoke(app, ["--format", "xml", "text-to-morse", "SOS"])
+    assert result.exit_code != 0
+
+def test_repl(mock_dependencies):
+    """Test del comando repl con varias órdenes en una sola sesión."""
+    result = runner.invoke(app, ["--format", "ndjson", "repl"], input="encode SOS\nhelp\nquit\n")
+
+    assert result.exit_code == 0
+    record = json.loads(result.stdout.splitlines()[0])
+    assert record["command"] == "encode"
+    assert record["output"] == "... --- ..."
+    assert "elapsed_ms" in record
+
+def test_config_follows_reload(mock_dependencies, tmp_path):
+    """La configuración del CLI se actualiza cuando el servicio recarga el archivo."""
+    path = tmp_path / "config.json"
+    data = copy.deepcopy(DEFAULT_CONFIG)
+    path.write_text(json.dumps(data))
+    service = ConfigService(path=path, environ={})
+    service.subscribe(interface.refresh_config)
+    service.get()
+
+    data['audio']['volume'] = 0.9
+    path.write_text(json.dumps(data))
+    assert service.reload()
+    assert interface.config['audio']['volume'] == 0.9
+    assert interface.refresh_config in get_service()._listeners
+
+def test_watch_once(mock_dependencies, tmp_path):
+    """Test del comando watch --once sobre un directorio de entrada."""
+    mock_dependencies['converter'].return_value = MorseConverter()
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    (spool / "msg.txt").write_text("SOS")
+
+    result = runner.invoke(app, ["--format", "ndjson", "watch", str(spool), str(tmp_path / "out"), "--once"])
+
+    assert result.exit_code == 0
+    record = json.loads(result.stdout.splitlines()[0])
+    assert record["command"] == "watch"
+    assert record["status"] == "done"
+    assert (tmp_path / "out" / "msg.txt").read_text() == "... --- ..."
+
+def test_watch_json_lines(mock_dependencies, tmp_path):
+    """En formato json watch escribe un registro compacto por línea."""
+    mock_dependencies['converter'].return_value = MorseConverter()
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    (spool / "a.txt").write_text("SOS")
+    (spool / "b.txt").write_text("E")
+
+    result = runner.invoke(app, ["--format", "json", "watch", str(spool), str(tmp_path / "out"), "--once"])
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert sorted(Path(record["input"]).name for record in records) == ["a.txt", "b.txt"]
+    assert interface.output.format == "json"
+
+def test_batch_resume(mock_dependencies, tmp_path):
+    """Test del comando batch con --resume sobre un trabajo terminado."""
+    mock_dependencies['converter'].return_value = MorseConverter()
+    source = tmp_path / "msg.txt"
+    source.write_text("SOS")
+    args = ["--format", "ndjson", "batch", str(source), "--output-dir", str(tmp_path / "out")]
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert json.loads(result.stdout.splitlines()[0])["status"] == "done"
+    assert (tmp_path / "out" / "msg.txt").read_text() == "... --- ..."
+
+    result = runner.invoke(app, args + ["--resume"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout.splitlines()[0])["status"] == "skipped"
+
+def test_batch_json_array(mock_dependencies, tmp_path):
+    """En formato json batch escribe un único array con un registro por archivo."""
+    mock_dependencies['converter'].return_value = MorseConverter()
+    sources = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    for source, text in zip(sources, ("SOS", "E")):
+        source.write_text(text)
+
+    result = runner.invoke(app, ["--format", "json", "batch", *map(str, sources), "--output-dir", str(tmp_path / "out")])
+    assert result.exit_code == 0
+    records = json.loads(result.stdout)
+    assert [record["input"] for record in records] == [str(source) for source in sources]
+    assert {record["status"] for record in records} == {"done"}
+
+def test_text_to_morse_wav(mock_dependencies, tmp_path):
+    """Test de la exportación de audio con --wav."""
+    wav = tmp_path / "sos.wav"
+    result = runner.invoke(app, ["text-to-morse", "SOS", "--wav", str(wav)])
+
+    assert result.exit_code == 0
+    assert "Audio saved to" in result.stdout
+    assert wav.read_bytes()[:4] == b"RIFF"
+
+def test_render_batch(mock_dependencies, tmp_path):
+    """Test del comando render-batch con mensajes y archivo de entrada."""
+    mock_dependencies['converter'].return_value = MorseConverter()
+    source = tmp_path / "messages.txt"
+    source.write_text("CQ\n\nDX\n")
+    out = tmp_path / "clips"
+    result = runner.invoke(app, ["--format", "ndjson", "render-batch", "SOS", "--input", str(source),
+                                 "-o", str(out), "--workers", "1"])
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["index"] for r in records[:-1]] == [1, 2, 3]
+    assert records[-1]["summary"]["clips"] == 3
+    assert sorted(p.name for p in out.iterdir()) == ["clip-00001.wav", "clip-00002.wav", "clip-00003.wav"]
+
+    result = runner.invoke(app, ["render-batch", "-o", str(out)])
+    assert result.exit_code != 0
+
+def test_render_batch_json(mock_dependencies, tmp_path):
+    """En formato json render-batch escribe un objeto con los clips y el resumen."""
+    mock_dependencies['converter'].return_value = MorseConverter()
+    result = runner.invoke(app, ["--format", "json", "render-batch", "SOS", "E", "-o", str(tmp_path), "--workers", "1"])
+
+    assert result.exit_code == 0
+    document = json.loads(result.stdout)
+    assert [clip["index"] for clip in document["clips"]] == [1, 2]
+    assert document["summary"]["clips"] == 2
@@ -0,0 +1,188 @@
+import pytest
+import urllib.error
+import urllib.request
+from morse_converter.utils.metrics import (
+    MetricsRegistry,
+    MetricsServer,
+    Histogram,
+    render_prometheus,
+    write_prometheus,
+)
+from morse_converter.core.converter import MorseConverter
+from morse_converter.utils import metrics
+
+class TestHistogram:
+    """Test suite for Histogram class."""
+
+    def test_observe(self):
+        """Test that observations update count, sum, extremes and buckets."""
+        histogram = Histogram(buckets=(1.0, 10.0))
+        for value in (0.5, 2.0, 20.0):
+            histogram.observe(value)
+
+        assert histogram.count == 3
+        assert histogram.sum == 22.5
+        assert histogram.min == 0.5
+        assert histogram.max == 20.0
+        assert histogram.bucket_counts == [1, 1, 1]
+        assert histogram.mean == 7.5
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry class."""
+
+    @pytest.fixture
+    def registry(self):
+        """Fixture that provides an enabled MetricsRegistry."""
+        registry = MetricsRegistry()
+        registry.enable()
+        return registry
+
+    def test_disabled_registry_records_nothing(self):
+        """Test that a disabled registry ignores every recording call."""
+        registry = MetricsRegistry()
+        registry.increment("calls")
+        registry.observe("latency", 1.0)
+        with registry.timer("block"):
+            pass
+        assert registry.counters == {}
+        assert registry.histograms == {}
+
+    def test_counters_with_labels(self, registry):
+        """Test that labels create separate counter series."""
+        registry.increment("errors", kind="ValueError")
+        registry.increment("errors", 2, kind="ValueError")
+        registry.increment("errors", kind="TypeError")
+
+        assert registry.counters[("errors", (("kind", "ValueError"),))] == 3
+        assert registry.counters[("errors", (("kind", "TypeError"),))] == 1
+
+    def test_gauges(self, registry):
+        """Test that gauges keep the last value set."""
+        registry.set_gauge("queue_depth", 4)
+        registry.set_gauge("queue_depth", 1)
+        assert registry.gauges[("queue_depth", ())] == 1
+        registry.reset()
+        assert registry.gauges == {}
+
+    def test_timer_and_timed(self, registry):
+        """Test the timer context manager and the timed decorator."""
+        @registry.timed("stage.work")
+        def work(value):
+            return value * 2
+
+        with registry.timer("stage.block"):
+            assert work(21) == 42
+
+        names = {row["name"]: row for row in registry.summary()}
+        assert names["stage.work"]["calls"] == 1
+        assert names["stage.block"]["calls"] == 1
+        assert names["stage.block"]["total"] >= names["stage.work"]["total"]
+
+    def test_timed_records_failures(self, registry):
+        """Test that calls raising exceptions are still timed."""
+        @registry.timed("stage.fail")
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fail()
+        assert registry.summary()[0]["calls"] == 1
+
+    def test_reset(self, registry):
+        """Test that reset discards recorded metrics."""
+        registry.increment("calls")
+        registry.reset()
+        assert registry.counters == {}
+
+    def test_instrumented_converter(self):
+        """Test that the converter reports its stages to the global registry."""
+        metrics.reset()
+        metrics.enable()
+        try:
+            MorseConverter().text_to_morse("SOS")
+        finally:
+            metrics.disable()
+        stages = {row["name"] for row in metrics.summary()}
+        assert "converter.text_to_morse" in stages
+        metrics.reset()
+
+class TestPrometheusExposition:
+    """Test suite for the Prometheus exporter."""
+
+    @pytest.fixture
+    def registry(self):
+        """Fixture that provides a registry with a counter and a timer."""
+        registry = MetricsRegistry()
+        registry.enable()
+        registry.increment("chars_encoded_total", 5)
+        registry.increment("errors_total", component="converter", type="ValueError")
+        registry.observe("converter.text_to_morse", 0.002)
+        return registry
+
+    def test_render_counters(self, registry):
+        """Test counter exposition with labels."""
+        text = render_prometheus(registry)
+        assert "# TYPE morse_converter_chars_encoded_total counter" in text
+        assert "morse_converter_chars_encoded_total 5" in text
+        assert 'morse_converter_errors_total{component="converter",type="ValueError"} 1' in text
+
+    def test_render_gauge(self, registry):
+        """Test gauge exposition."""
+        registry.set_gauge("watch_queue_depth", 3, directory="spool")
+        text = render_prometheus(registry)
+        assert "# TYPE morse_converter_watch_queue_depth gauge" in text
+        assert 'morse_converter_watch_queue_depth{directory="spool"} 3' in text
+
+    def test_render_histogram(self, registry):
+        """Test histogram exposition with cumulative buckets."""
+        text = render_prometheus(registry)
+        metric = "morse_converter_converter_text_to_morse_seconds"
+        assert f"# TYPE {metric} histogram" in text
+        assert f'{metric}_bucket{{le="0.001"}} 0' in text
+        assert f'{metric}_bucket{{le="0.005"}} 1' in text
+        assert f'{metric}_bucket{{le="+Inf"}} 1' in text
+        assert f"{metric}_count 1" in text
+
+    def test_render_escapes_labels(self):
+        """Test escaping of quotes in label values."""
+        registry = MetricsRegistry()
+        registry.enable()
+        registry.increment("errors_total", type='say "hi"')
+        assert 'type="say \\"hi\\""' in render_prometheus(registry)
+
+    def test_write_prometheus(self, registry, tmp_path):
+        """Test writing the exposition to a file."""
+        target = tmp_path / "metrics" / "morse.prom"
+        write_prometheus(target, registry)
+        assert target.read_text() == render_prometheus(registry)
+
+    def test_server_scrape(self, registry):
+        """Test scraping the local HTTP endpoint."""
+        with MetricsServer(port=0, registry=registry) as server:
+            with urllib.request.urlopen(server.url) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+        assert "morse_converter_chars_encoded_total 5" in body
+        assert content_type.startswith("text/plain")
+
+    def test_server_unknown_path(self, registry):
+        """Test that paths other than /metrics return 404."""
+        with MetricsServer(port=0, registry=registry) as server:
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"))
+
+    def test_converter_feeds_counters(self):
+        """Test that conversions and failures update the global counters."""
+        metrics.reset()
+        metrics.enable()
+        try:
+            converter = MorseConverter()
+            converter.text_to_morse("SOS")
+            with pytest.raises(ValueError):
+                converter.text_to_morse("S#S")
+        finally:
+            metrics.disable()
+        text = render_prometheus(metrics)
+        metrics.reset()
+        assert "morse_converter_chars_encoded_total 3" in text
+        assert 'morse_converter_errors_total{component="converter",type="ValueError"} 1' in text
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.packing import (
+    ELEMENT_DASH, ELEMENT_DOT, ELEMENT_LETTER_GAP, ELEMENT_WORD_GAP,
+    code_key, from_elements, pack_elements, pack_morse, to_elements,
+    unpack_elements, unpack_morse
+)
+
+class TestPacking:
+    """Test suite for the binary Morse representation."""
+
+    def test_to_elements(self):
+        """Cada símbolo y cada hueco se convierte en un elemento."""
+        elements = to_elements(".- -  .")
+        assert elements.tolist() == [
+            ELEMENT_DOT, ELEMENT_DASH, ELEMENT_LETTER_GAP, ELEMENT_DASH,
+            ELEMENT_WORD_GAP, ELEMENT_DOT
+        ]
+
+    def test_space_runs_collapse(self):
+        """Las rachas largas de espacios son un solo hueco de palabra."""
+        assert from_elements(to_elements("  .    -  ")) == ".  -"
+
+    def test_invalid_characters(self):
+        """Los caracteres que no son Morse producen ValueError."""
+        with pytest.raises(ValueError, match="Invalid Morse code characters"):
+            to_elements(".-x")
+        with pytest.raises(ValueError):
+            to_elements(".-ñ")
+
+    @pytest.mark.parametrize("morse", [
+        "", ".", "... --- ...", ".... . .-.. .-.. ---  .-- --- .-. .-.. -..",
+    ])
+    def test_round_trip(self, morse):
+        """Round trip pack and unpack preserves the Morse string."""
+        assert unpack_morse(pack_morse(morse)) == morse
+
+    def test_packed_size(self):
+        """Cuatro elementos por byte tras una cabecera de 8 bytes."""
+        elements = np.zeros(10, dtype=np.uint8)
+        assert len(pack_elements(elements)) == 8 + 3
+        assert unpack_elements(pack_elements(elements)).size == 10
+
+    def test_bytes_input(self):
+        """pack_morse admite bytes y bytearray."""
+        assert pack_morse(b"... ---") == pack_morse(bytearray(b"... ---")) == pack_morse("... ---")
+
+    def test_truncated_data(self):
+        """Los datos truncados producen ValueError."""
+        packed = pack_morse("... --- ...")
+        with pytest.raises(ValueError, match="truncated"):
+            unpack_elements(packed[:-1])
+        with pytest.raises(ValueError, match="header"):
+            unpack_elements(packed[:4])
+
+    def test_code_key_unique(self):
+        """Las claves distinguen códigos de distinta longitud."""
+        assert code_key(".") != code_key("..")
+        assert code_key("-") != code_key(".-")
+
+class TestConverterBinary:
+    """Bytes and packed APIs of MorseConverter."""
+
+    @pytest.fixture
+    def converter(self):
+        return MorseConverter()
+
+    def test_encode_decode_bytes(self, converter):
+        """Bytes-in/bytes-out conversion."""
+        assert converter.encode_bytes(b"SOS") == b"... --- ..."
+        assert converter.decode_bytes(b"... --- ...") == b"SOS"
+        assert converter.decode_bytes(memoryview(b".- -...")) == b"AB"
+
+    def test_invalid_bytes(self, converter):
+        """Los bytes no decodificables producen ValueError."""
+        with pytest.raises(ValueError):
+            converter.encode_bytes(b"\xff")
+        with pytest.raises(ValueError):
+            converter.decode_bytes("ñ".encode("utf-8"))
+
+    @pytest.mark.parametrize("text", ["SOS", "HELLO WORLD", "A B C 123", "HI!"])
+    def test_packed_matches_text_path(self, converter, text):
+        """Decoding packed data matches morse_to_text."""
+        morse = converter.text_to_morse(text)
+        packed = converter.text_to_packed(text)
+        assert converter.packed_to_text(packed) == converter.morse_to_text(morse)
+
+    def test_packed_is_compact(self, converter):
+        """El formato binario ocupa mucho menos que el texto Morse."""
+        text = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG " * 20
+        morse = converter.text_to_morse(text.strip())
+        assert len(converter.text_to_packed(text.strip())) < len(morse) / 3
+
+    def test_packed_other_table(self):
+        """El formato binario funciona con cualquier tabla."""
+        converter = MorseConverter("cyrillic")
+        assert converter.packed_to_text(converter.text_to_packed("ДА НЕТ")) == "ДА НЕТ"
+
+    def test_packed_unknown_letter(self, converter):
+        """Una letra desconocida produce ValueError."""
+        with pytest.raises(ValueError, match="Invalid Morse code sequence: '........'"):
+            converter.packed_to_text(pack_morse("... ........"))
+
+    @pytest.mark.parametrize("letter", ["." * 100 + "....-..-", "." * 100 + "......--", "-" * 64])
+    def test_packed_overlong_letter(self, converter, letter):
+        """Una letra más larga que cualquier código se rechaza sin desbordar."""
+        with pytest.raises(ValueError, match=f"Invalid Morse code sequence: '{letter}'"):
+            converter.packed_to_text(pack_morse(f"... {letter}"))
+
+    def test_packed_empty(self, converter):
+        """Datos vacíos producen texto vacío."""
+        assert converter.packed_to_text(pack_morse("")) == ""
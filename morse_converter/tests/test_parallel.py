@@ -0,0 +1,141 @@
+import gzip
+import random
+import pytest
+from morse_converter.core.converter import MorseConverter
+from morse_converter.utils.file_handler import COMPRESSORS, compression_for
+from morse_converter.core.parallel import (
+    MORSE_TO_TEXT, TEXT_TO_MORSE, Chunk, ParallelConverter
+)
+
+class TestParallelConverter:
+    """Test suite for ParallelConverter."""
+
+    @pytest.fixture
+    def converter(self):
+        return MorseConverter()
+
+    def test_split_text_at_spaces(self, tmp_path):
+        """El texto se corta en espacios y cubre todo el archivo."""
+        path = tmp_path / "input.txt"
+        path.write_text("AAAA BBBB  CCCC DDDD")
+        chunks = ParallelConverter(workers=1, chunk_size=3).split(str(path), TEXT_TO_MORSE)
+        assert chunks == [Chunk(0, 4, 1), Chunk(5, 9, 2), Chunk(11, 15, 1), Chunk(16, 20, 0)]
+
+    def test_split_morse_at_word_gaps(self, tmp_path):
+        """El Morse sólo se corta en huecos de palabra."""
+        path = tmp_path / "input.txt"
+        path.write_text(".- -...  -.-. -..\n.")
+        chunks = ParallelConverter(workers=1, chunk_size=2).split(str(path), MORSE_TO_TEXT)
+        assert chunks == [Chunk(0, 7, 2), Chunk(9, 17, 2), Chunk(18, 19, 0)]
+
+    def test_invalid_arguments(self, tmp_path):
+        """Dirección o tamaño de bloque inválidos."""
+        with pytest.raises(ValueError):
+            ParallelConverter(chunk_size=0)
+        path = tmp_path / "input.txt"
+        path.write_text("A")
+        with pytest.raises(ValueError, match="Unknown direction"):
+            ParallelConverter().split(str(path), "sideways")
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+    def test_text_matches_single_call(self, tmp_path, converter, chunk_size):
+        """Parallel text conversion matches a single text_to_morse call."""
+        random.seed(chunk_size)
+        text = "".join(random.choice("ABC12 .,  ") for _ in range(300)).strip()
+        source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+        source.write_text(text)
+        ParallelConverter(workers=1, chunk_size=chunk_size).convert_file(str(source), str(target), TEXT_TO_MORSE)
+        assert target.read_text() == converter.text_to_morse(text)
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+    def test_morse_matches_single_call(self, tmp_path, converter, chunk_size):
+        """Parallel Morse conversion matches a single morse_to_text call."""
+        morse = converter.text_to_morse("HELLO WORLD THIS IS A  LONGER TEST 123")
+        morse = morse.replace("  ", "   ", 2) + "    .-"
+        source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+        source.write_text(morse)
+        ParallelConverter(workers=1, chunk_size=chunk_size).convert_file(str(source), str(target), MORSE_TO_TEXT)
+        assert target.read_text() == converter.morse_to_text(morse)
+
+    def test_line_breaks_are_word_separators(self, tmp_path):
+        """Los saltos de línea separan palabras."""
+        source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+        source.write_text("SOS\nHELP\n")
+        ParallelConverter(workers=1, chunk_size=2).convert_file(str(source), str(target), TEXT_TO_MORSE)
+        assert target.read_text() == "... --- ...  .... . .-.. .--."
+
+        target.replace(source)
+        ParallelConverter(workers=1, chunk_size=2).convert_file(str(source), str(target), MORSE_TO_TEXT)
+        assert target.read_text() == "SOS HELP"
+
+    def test_process_pool(self, tmp_path, converter):
+        """Los bloques se convierten en varios procesos y se unen en orden."""
+        text = " ".join(f"WORD{i}" for i in range(500))
+        source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+        source.write_text(text)
+        written = ParallelConverter(workers=2, chunk_size=256).convert_file(
+            str(source), str(target), TEXT_TO_MORSE
+        )
+        expected = converter.text_to_morse(text)
+        assert target.read_text() == expected
+        assert written == len(expected)
+        assert not [p for p in tmp_path.iterdir() if p.name.startswith(".morse-parts-")]
+
+    def test_empty_file(self, tmp_path):
+        """Un archivo vacío produce una salida vacía."""
+        source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+        source.write_text("")
+        assert ParallelConverter(workers=1).convert_file(str(source), str(target), TEXT_TO_MORSE) == 0
+        assert target.read_text() == ""
+
+    def test_error_reports_chunk(self, tmp_path):
+        """Los errores indican el byte de inicio del bloque."""
+        source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+        source.write_text("GOOD BAD$")
+        with pytest.raises(ValueError, match="Chunk at byte 5"):
+            ParallelConverter(workers=1, chunk_size=2).convert_file(str(source), str(target), TEXT_TO_MORSE)
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_compressed_input_and_output(self, tmp_path, converter, suffix):
+        """Los archivos comprimidos se convierten en una sola pasada."""
+        module = COMPRESSORS[compression_for("x" + suffix)]
+        random.seed(3)
+        text = " ".join("".join(random.choice("ABC12.,") for _ in range(random.randint(1, 8)))
+                        for _ in range(400))
+        source, target = tmp_path / ("in.txt" + suffix), tmp_path / ("out.txt" + suffix)
+        source.write_bytes(module.compress(text.replace("  ", "\n").encode()))
+
+        ParallelConverter(chunk_size=7).convert_file(str(source), str(target), TEXT_TO_MORSE)
+        morse = module.decompress(target.read_bytes()).decode()
+        assert morse == converter.text_to_morse(text.replace("  ", " "))
+
+        back = tmp_path / "back.txt"
+        ParallelConverter(chunk_size=5).convert_file(str(target), str(back), MORSE_TO_TEXT)
+        assert back.read_text() == converter.morse_to_text(morse)
+
+    def test_streaming_matches_mapped(self, tmp_path, converter):
+        """La conversión en streaming coincide con la conversión por bloques."""
+        morse = converter.text_to_morse("HELLO WORLD THIS IS A  LONGER TEST 123")
+        morse = morse.replace("  ", "   ", 2) + "    .-"
+        source, plain, packed = tmp_path / "in.txt", tmp_path / "out.txt", tmp_path / "out.txt.gz"
+        source.write_text(morse)
+        for chunk_size in (1, 4, 9):
+            parallel = ParallelConverter(workers=1, chunk_size=chunk_size)
+            parallel.convert_file(str(source), str(plain), MORSE_TO_TEXT)
+            parallel.convert_file(str(source), str(packed), MORSE_TO_TEXT)
+            assert gzip.decompress(packed.read_bytes()).decode() == plain.read_text()
+
+    def test_failed_stitch_keeps_previous_output(self, tmp_path, monkeypatch):
+        """Un fallo al unir las partes deja intacta la salida anterior."""
+        source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+        source.write_text("SOS HELLO")
+        target.write_text("previous")
+
+        def fail(part, output):
+            output.write(b"partial")
+            raise OSError("disk full")
+        monkeypatch.setattr("morse_converter.core.parallel.shutil.copyfileobj", fail)
+        with pytest.raises(OSError):
+            ParallelConverter(workers=1).convert_file(str(source), str(target), TEXT_TO_MORSE)
+        assert target.read_text() == "previous"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["in.txt", "out.txt"]
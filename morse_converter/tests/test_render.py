@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from morse_converter.core.audio import AudioGenerator, read_wav
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.render import BatchRenderer, build_carrier, carrier_cycle
+
+class TestBatchRenderer:
+    """Test suite for parallel clip rendering."""
+
+    def test_carrier_template_matches_oscillator(self):
+        """La plantilla se repite con el ciclo exacto de la portadora."""
+        cycle = carrier_cycle(800, 44100)
+        assert cycle == 441
+        carrier = build_carrier(800, 44100, 1000)
+        np.testing.assert_allclose(carrier[cycle:], carrier[:1000], atol=1e-9)
+        with pytest.raises(ValueError):
+            carrier_cycle(700.5, 44100)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_clips_match_render_to_file(self, tmp_path, workers):
+        """Cada clip coincide con el renderizado de AudioGenerator."""
+        messages = ["SOS", "CQ DX", "HELLO WORLD"]
+        results = BatchRenderer(tmp_path / "out", workers=workers, frequency=700, wpm=20).render(messages)
+        assert [r.index for r in results] == [1, 2, 3]
+        assert not any(r.error for r in results)
+
+        generator = AudioGenerator(frequency=700)
+        generator.set_wpm(20)
+        for message, result in zip(messages, results):
+            assert result.output_path.name == f"clip-{result.index:05d}.wav"
+            generator.render_to_file(MorseConverter().text_to_morse(message), tmp_path / "expected.wav")
+            samples, sample_rate = read_wav(result.output_path)
+            expected, _ = read_wav(tmp_path / "expected.wav")
+            assert sample_rate == 44100
+            assert len(samples) == result.samples == len(expected)
+            np.testing.assert_allclose(samples, expected, atol=2 / 32767)
+
+    def test_render_file_and_failures(self, tmp_path):
+        """Las líneas vacías se omiten y un mensaje inválido no detiene el lote."""
+        source = tmp_path / "messages.txt"
+        source.write_text("SOS\n\n... ---\n")
+        seen = []
+        renderer = BatchRenderer(tmp_path / "out", workers=2, prefix="msg", on_result=seen.append)
+        results = renderer.render_file(source)
+        assert [r.index for r in seen] == [1, 2]
+        assert results[0].error is None and (tmp_path / "out" / "msg-00001.wav").exists()
+        assert results[1].error and not results[1].output_path.exists()
+
+        summary = BatchRenderer.summary(results)
+        assert summary["clips"] == 2 and summary["failed"] == 1
+        assert summary["audio_seconds"] == pytest.approx(results[0].duration, abs=1e-3)
+        assert summary["max_ms"] >= summary["mean_ms"] > 0
+
+    def test_morse_messages(self, tmp_path):
+        """Con morse=True los mensajes se renderizan sin convertir."""
+        results = BatchRenderer(tmp_path, workers=1, morse=True).render(["... --- ..."])
+        assert results[0].error is None
+        assert results[0].duration == pytest.approx(AudioGenerator().timeline("... --- ...").duration, abs=1e-4)
@@ -0,0 +1,81 @@
+import json
+import os
+import pytest
+from unittest.mock import Mock
+from morse_converter.cli.output import Output
+from morse_converter.cli.repl import Repl
+from morse_converter.config import DEFAULT_CONFIG, ConfigService
+from morse_converter.core.audio import AudioGenerator
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.validator import InputValidator
+
+class TestRepl:
+    """Test suite for the interactive REPL."""
+
+    @pytest.fixture
+    def player(self):
+        return Mock()
+
+    @pytest.fixture
+    def make_repl(self, player):
+        def make(output_format="ndjson", config_service=None):
+            return Repl(MorseConverter(), InputValidator(), AudioGenerator(), player,
+                        Output(output_format), config_service=config_service)
+        return make
+
+    def records(self, capsys):
+        out, err = capsys.readouterr()
+        return [json.loads(line) for line in out.splitlines()], err
+
+    def test_encode_decode_with_latency(self, make_repl, capsys):
+        """Cada resultado incluye la latencia del comando."""
+        repl = make_repl()
+        repl.run(["encode SOS", "decode ... --- ...", "quit", "encode IGNORED"])
+        records, _ = self.records(capsys)
+        assert [r["output"] for r in records] == ["... --- ...", "SOS"]
+        assert [r["command"] for r in records] == ["encode", "decode"]
+        assert all(r["elapsed_ms"] >= 0 for r in records)
+
+    def test_play_reuses_generator(self, make_repl, player, capsys):
+        """play sin argumento reproduce el último resultado codificado."""
+        repl = make_repl()
+        generator = repl.generator
+        repl.run(["encode E", "play", "play -"])
+        assert player.play_audio.call_count == 2
+        assert repl.generator is generator
+        assert [r["command"] for r in self.records(capsys)[0]] == ["encode", "play", "play"]
+
+    def test_settings(self, make_repl, capsys):
+        """set-wpm y set-frequency cambian el generador."""
+        repl = make_repl()
+        repl.run(["set-wpm 24", "set-frequency 700", "status"])
+        assert repl.generator.timings.DOT_DURATION == pytest.approx(0.05)
+        assert repl.generator.frequency == 700
+        status = self.records(capsys)[0][-1]
+        assert status["wpm"] == 24 and status["frequency"] == 700
+
+    def test_errors_keep_session(self, make_repl, player, capsys):
+        """Los errores se informan y la sesión continúa."""
+        repl = make_repl()
+        repl.run(["bogus", "encode", "play", "set-wpm fast", "set-frequency 5", "decode ...---", "encode OK"])
+        records, err = self.records(capsys)
+        assert [r["output"] for r in records] == ["--- -.-"]
+        errors = [json.loads(line)["error"] for line in err.splitlines() if line.startswith("{")]
+        assert errors == ["Unknown Command", "Missing Argument"] + ["Validation Error"] * 3 + ["Error"]
+        player.play_audio.assert_not_called()
+
+    def test_follows_config_reload(self, make_repl, tmp_path, capsys):
+        """Los cambios de audio en config.json se aplican sin reiniciar."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(DEFAULT_CONFIG))
+        service = ConfigService(path, environ={}, watch=True, check_interval=0)
+        repl = make_repl(config_service=service)
+        assert repl.generator.frequency == 800 and repl.wpm == 20
+
+        data = json.loads(path.read_text())
+        data["audio"].update(frequency=650, wpm=30)
+        path.write_text(json.dumps(data))
+        os.utime(path, ns=(10**18, 10**18))
+        repl.execute("status")
+        status = self.records(capsys)[0][-1]
+        assert status["frequency"] == 650 and status["wpm"] == 30
@@ -0,0 +1,83 @@
+import io
+import json
+import numpy as np
+import pytest
+from morse_converter.core.audio import AudioGenerator, MorseTimings
+from morse_converter.core.converter import MorseConverter
+from morse_converter.core.timeline import MorseTimeline
+
+class TestMorseTimeline:
+    """Test suite for the keying timeline."""
+
+    @pytest.fixture
+    def timings(self):
+        return MorseTimings()
+
+    def test_from_morse_letter_and_word_gaps(self, timings):
+        """Los espacios de letra y palabra se fusionan con el silencio anterior."""
+        timeline = MorseTimeline.from_morse(".-  .", timings)
+        np.testing.assert_array_equal(timeline.states, [1, 0, 1, 0, 1, 0])
+        np.testing.assert_allclose(timeline.durations, [
+            timings.DOT_DURATION,
+            timings.SYMBOL_SPACE,
+            timings.DASH_DURATION,
+            timings.WORD_SPACE,
+            timings.DOT_DURATION,
+            timings.SYMBOL_SPACE,
+        ])
+        assert timeline.key_down_time == pytest.approx(0.5)
+
+    def test_invalid_symbols_are_ignored(self):
+        """Los símbolos desconocidos no producen eventos."""
+        assert MorseTimeline.from_morse(".#.") == MorseTimeline.from_morse("..")
+        assert len(MorseTimeline.from_morse("")) == 0
+
+    def test_constructor_merges_runs(self):
+        """Eventos vacíos se descartan y estados iguales se unen."""
+        timeline = MorseTimeline([1, 1, 0, 0, 1, 0], [0.1, 0.2, 0.1, 0.0, 0.0, 0.3])
+        np.testing.assert_array_equal(timeline.states, [1, 0])
+        np.testing.assert_allclose(timeline.durations, [0.3, 0.4])
+        with pytest.raises(ValueError):
+            MorseTimeline([1], [0.1, 0.2])
+        with pytest.raises(ValueError):
+            MorseTimeline([1], [-0.1])
+
+    def test_sample_counts_do_not_drift(self):
+        """El redondeo por fronteras mantiene la duración total exacta."""
+        generator = AudioGenerator()
+        generator.set_wpm(27)
+        timeline = generator.timeline(MorseConverter().text_to_morse("PARIS " * 200))
+        counts = timeline.sample_counts(44100)
+        assert counts.sum() == round(timeline.duration * 44100)
+        assert timeline.milliseconds().sum() == round(timeline.duration * 1000)
+
+    def test_intervals(self):
+        """Inicio y fin de cada pulsación."""
+        starts, ends = MorseTimeline.from_morse("..").intervals()
+        np.testing.assert_allclose(starts, [0.0, 0.2])
+        np.testing.assert_allclose(ends, [0.1, 0.3])
+
+    def test_serialization(self, tmp_path):
+        """La línea de tiempo se guarda en JSON y en .npz sin pérdidas."""
+        timeline = MorseTimeline.from_morse(MorseConverter().text_to_morse("SOS HELP"))
+        assert MorseTimeline.from_dict(json.loads(json.dumps(timeline.to_dict()))) == timeline
+        path = tmp_path / "sos.npz"
+        timeline.save(path)
+        assert MorseTimeline.load(path) == timeline
+        buffer = io.BytesIO()
+        timeline.save(buffer)
+        buffer.seek(0)
+        assert MorseTimeline.load(buffer) == timeline
+        with pytest.raises(ValueError):
+            MorseTimeline.load(tmp_path / "missing.npz")
+
+    def test_generator_renders_timeline(self):
+        """El audio de una línea de tiempo coincide con generate_audio."""
+        generator = AudioGenerator()
+        morse = MorseConverter().text_to_morse("CQ DX")
+        generator.generate_audio(morse)
+        expected = generator._audio_buffer.copy()
+        timeline = generator.timeline(morse)
+        generator.render_timeline(timeline)
+        np.testing.assert_array_equal(generator._audio_buffer, expected)
+        assert len(expected) == timeline.sample_counts(generator.sample_rate).sum()
@@ -0,0 +1,112 @@
+import os
+import threading
+import pytest
+from morse_converter.core.parallel import MORSE_TO_TEXT
+from morse_converter.core.watcher import DirectoryWatcher, ProcessedStore, STATUS_DONE, STATUS_FAILED
+from morse_converter.utils.metrics import metrics
+
+class TestDirectoryWatcher:
+    """Test suite for DirectoryWatcher."""
+
+    @pytest.fixture
+    def dirs(self, tmp_path):
+        spool = tmp_path / "spool"
+        spool.mkdir()
+        return spool, tmp_path / "out"
+
+    def test_run_once_converts_and_records(self, dirs):
+        """Los archivos se convierten una sola vez aunque se reinicie."""
+        spool, out = dirs
+        (spool / "a.txt").write_text("SOS")
+        (spool / "b.txt").write_text("HELLO WORLD")
+        (spool / ".partial").write_text("IGNORED")
+
+        with DirectoryWatcher(spool, out, workers=2) as watcher:
+            results = watcher.run_once()
+        assert sorted(r.input_path.name for r in results) == ["a.txt", "b.txt"]
+        assert (out / "a.txt").read_text() == "... --- ..."
+        assert (out / "b.txt").read_text() == ".... . .-.. .-.. ---  .-- --- .-. .-.. -.."
+        assert not (out / ".partial").exists()
+
+        # Un reinicio no vuelve a convertir los archivos sin cambios
+        with DirectoryWatcher(spool, out) as watcher:
+            assert watcher.run_once() == []
+            (spool / "a.txt").write_text("SOS SOS")
+            results = watcher.run_once()
+        assert [r.input_path.name for r in results] == ["a.txt"]
+        assert (out / "a.txt").read_text() == "... --- ...  ... --- ..."
+
+    def test_failed_files_are_recorded(self, dirs):
+        """Un archivo no válido se registra como fallido y no se reintenta."""
+        spool, out = dirs
+        (spool / "bad.morse").write_text("...---...---")
+        (spool / "good.morse").write_text("... --- ...")
+
+        with DirectoryWatcher(spool, out, MORSE_TO_TEXT, pattern="*.morse") as watcher:
+            results = {r.input_path.name: r for r in watcher.run_once()}
+            assert results["bad.morse"].status == STATUS_FAILED
+            assert results["good.morse"].status == STATUS_DONE
+            assert watcher.store.count(STATUS_FAILED) == 1
+            assert watcher.run_once() == []
+        assert (out / "good.morse").read_text() == "SOS"
+        assert not (out / "bad.morse").exists()
+
+    def test_poll_waits_for_stable_files(self, dirs):
+        """poll sólo encola archivos que no cambian entre dos exploraciones."""
+        spool, out = dirs
+        path = spool / "growing.txt"
+        path.write_text("SOS")
+        with DirectoryWatcher(spool, out) as watcher:
+            assert watcher.scan() == []
+            path.write_text("SOS SOS")
+            os.utime(path, ns=(10**18, 10**18))
+            assert watcher.scan() == []
+            assert [p.name for p, _ in watcher.scan()] == ["growing.txt"]
+
+    def test_run_until_stopped_reports_metrics(self, dirs):
+        """run procesa en segundo plano y publica profundidad de cola y totales."""
+        spool, out = dirs
+        for i in range(5):
+            (spool / f"{i}.txt").write_text("E " * 100)
+        results = []
+        stop = threading.Event()
+        metrics.reset()
+        metrics.enable()
+        try:
+            with DirectoryWatcher(spool, out, poll_interval=0.01, max_pending=2,
+                                  on_result=results.append) as watcher:
+                thread = threading.Thread(target=watcher.run, args=(stop,))
+                thread.start()
+                for _ in range(500):
+                    if len(results) == 5:
+                        break
+                    stop.wait(0.01)
+                stop.set()
+                thread.join()
+            assert len(results) == 5
+            assert metrics.counters[("watch_files_total", (("status", "done"),))] >= 5
+            assert ("watch_queue_depth", ()) in metrics.gauges
+        finally:
+            metrics.disable()
+            metrics.reset()
+
+    def test_invalid_directories(self, dirs, tmp_path):
+        """El directorio de salida no puede ser el de entrada."""
+        spool, _ = dirs
+        with pytest.raises(ValueError):
+            DirectoryWatcher(spool, spool)
+        with pytest.raises(ValueError):
+            DirectoryWatcher(tmp_path / "missing", tmp_path / "out")
+
+class TestProcessedStore:
+    """Test suite for ProcessedStore."""
+
+    def test_signature_match(self, tmp_path):
+        """Un archivo cuenta como procesado mientras su firma no cambie."""
+        with ProcessedStore(tmp_path / "state.sqlite3") as store:
+            store.mark(tmp_path / "a", (3, 100), STATUS_DONE, tmp_path / "out")
+            assert store.is_processed(tmp_path / "a", (3, 100))
+            assert not store.is_processed(tmp_path / "a", (4, 100))
+            assert not store.is_processed(tmp_path / "b", (3, 100))
+        with ProcessedStore(tmp_path / "state.sqlite3") as store:
+            assert store.count() == 1
@@ -8,11 +8,17 @@ This package contains utility modules for the Morse Code Converter application.
 Modules:
     logger: Provides logging functionality for the application.
     file_handler: Provides file operations functionality.
+    metrics: Provides counters, histograms and timers for profiling.
+    cache: Provides a persistent cache of conversion results.
 
 Classes:
     LoggerError: Custom exception for logging errors.
     FileOperationError: Custom exception for file operation errors.
     FileHandler: Handles file read/write operations.
+    FileWriter: Streaming, optionally atomic, file writer.
+    MetricsRegistry: Registry of counters, histograms and timers.
+    ConversionCache: Content-addressed on-disk cache of conversion results.
+    CacheError: Custom exception for cache errors.
 """
 
 from morse_converter.utils.logger import (
@@ -21,9 +27,25 @@ from morse_converter.utils.logger import (
     LoggerError,
 )
 
+from morse_converter.utils.metrics import (
+    MetricsRegistry,
+    MetricsServer,
+    Histogram,
+    metrics,
+    render_prometheus,
+    write_prometheus,
+)
+
 from morse_converter.utils.file_handler import (
     FileHandler,
+    FileWriter,
     FileOperationError,
+    detect_compression,
+)
+
+from morse_converter.utils.cache import (
+    ConversionCache,
+    CacheError,
 )
 
 __all__ = [
@@ -34,5 +56,19 @@ __all__ = [
     
     # File Handler exports
     'FileHandler',
+    'FileWriter',
     'FileOperationError',
+    'detect_compression',
+
+    # Metrics exports
+    'MetricsRegistry',
+    'MetricsServer',
+    'Histogram',
+    'metrics',
+    'render_prometheus',
+    'write_prometheus',
+
+    # Cache exports
+    'ConversionCache',
+    'CacheError',
 ]
@@ -0,0 +1,334 @@
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from morse_converter.utils.logger import setup_logger
+from morse_converter.utils.metrics import metrics
+
+# Configurar logger para este módulo
+logger = setup_logger(__name__)
+
+DEFAULT_CACHE_DIR = "~/.cache/morse_converter"
+DEFAULT_MAX_SIZE = "256MB"
+
+# Tipos de entrada almacenados en la caché
+TEXT_TO_MORSE = "text-to-morse"
+MORSE_TO_TEXT = "morse-to-text"
+
+# Límite de parámetros por consulta en versiones antiguas de SQLite
+_QUERY_BATCH = 500
+
+_SIZE_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?B?)\s*$', re.IGNORECASE)
+_SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+class CacheError(Exception):
+    """Custom exception for conversion cache errors."""
+    pass
+
+def parse_size(size: Union[int, str]) -> int:
+    """
+    Parses a size such as ``"256MB"`` or ``"1.5G"`` into bytes.
+
+    Parameters:
+        size (int | str): Size in bytes or with a K/M/G/T suffix.
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    if isinstance(size, int):
+        return size
+    match = _SIZE_PATTERN.match(size)
+    if not match:
+        raise ValueError(f"Invalid size: '{size}'")
+    unit = match.group(2).upper().rstrip('B') or 'B'
+    return int(float(match.group(1)) * _SIZE_UNITS[unit])
+
+def make_key(kind: str, content: Union[str, bytes], **params: Any) -> str:
+    """
+    Builds the content-addressed key of a cache entry.
+
+    Parameters:
+        kind (str): Type of entry, e.g. ``TEXT_TO_MORSE``.
+        content (str | bytes): The input being converted.
+        **params: Any other value the result depends on (e.g. the code table).
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256(kind.encode('utf-8') + b'\0')
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8') + b'\0')
+    digest.update(content.encode('utf-8') if isinstance(content, str) else content)
+    return digest.hexdigest()
+
+def file_key(kind: str, file_path: Union[str, Path], **params: Any) -> str:
+    """Like ``make_key`` but hashes the content of a file in blocks."""
+    digest = hashlib.sha256(kind.encode('utf-8') + b'\0')
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8') + b'\0')
+    with open(file_path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def table_fingerprint(compiled: Any) -> str:
+    """Returns a digest of a compiled code table's mappings and punctuation."""
+    payload = json.dumps(
+        [sorted(compiled.encode.items()), sorted(compiled.punctuation)], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class ConversionCache:
+    """
+    Persistent content-addressed cache of conversion results.
+
+    Entries are stored in a SQLite database under the cache directory and
+    keyed by a hash of the input, the code table and any other parameters,
+    so unchanged inputs are never converted twice. When the total size of
+    the entries exceeds ``max_size`` the least recently used are evicted.
+
+    Methods:
+        get(key: str) -> Optional[bytes]
+            Returns a cached value and marks it as recently used.
+        put(key: str, value: bytes, kind: str) -> None
+            Stores a value, evicting old entries if needed.
+        text_to_morse(converter, text: str) -> str
+            Cached ``MorseConverter.text_to_morse``.
+        encode_many(converter, records) -> List[str]
+            Cached batch encoding; only the misses are converted.
+    """
+
+    DB_NAME = "cache.sqlite3"
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_size: Union[int, str] = DEFAULT_MAX_SIZE
+    ):
+        """
+        Initialize the ConversionCache.
+
+        Parameters:
+            directory (str | Path): Cache directory (default: ~/.cache/morse_converter)
+            max_size (int | str): Size limit, in bytes or e.g. "256MB" (default: "256MB")
+
+        Raises:
+            CacheError: If the cache database cannot be opened.
+        """
+        self.directory = Path(directory).expanduser()
+        self.max_size = parse_size(max_size)
+        self.hits = 0
+        self.misses = 0
+        logger.debug(f"Opening conversion cache in {self.directory} (max_size={self.max_size})")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.directory / self.DB_NAME))
+            # WAL permite lectores concurrentes de otros procesos
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Could not open cache in {self.directory}: {str(e)}")
+            metrics.increment("errors_total", component="cache", type=type(e).__name__)
+            raise CacheError(f"Could not open cache: {str(e)}")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ConversionCache":
+        """Creates a cache from the ``cache`` section of the configuration."""
+        section = config.get('cache', {})
+        return cls(section.get('directory', DEFAULT_CACHE_DIR), section.get('max_size', DEFAULT_MAX_SIZE))
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached values in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self._db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def __enter__(self) -> "ConversionCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._db.close()
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        logger.info(f"Clearing conversion cache in {self.directory}")
+        with self._db:
+            self._db.execute("DELETE FROM entries")
+        self._size = 0
+
+    def _record(self, kind: str, hits: int, misses: int) -> None:
+        """Updates the hit and miss counters."""
+        self.hits += hits
+        self.misses += misses
+        if hits:
+            metrics.increment("cache_hits_total", hits, kind=kind)
+        if misses:
+            metrics.increment("cache_misses_total", misses, kind=kind)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, bytes]:
+        """
+        Looks up many keys at once and marks the found ones as recently used.
+
+        Returns:
+            Dict[str, bytes]: Values of the keys present in the cache.
+        """
+        found: Dict[str, bytes] = {}
+        unique = list(dict.fromkeys(keys))
+        try:
+            for i in range(0, len(unique), _QUERY_BATCH):
+                batch = unique[i:i + _QUERY_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                found.update(self._db.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders})", batch
+                ))
+            if found:
+                now = time.time_ns()
+                with self._db:
+                    self._db.executemany(
+                        "UPDATE entries SET accessed = ? WHERE key = ?", ((now, key) for key in found)
+                    )
+        except sqlite3.Error as e:
+            # Un fallo de la caché no debe impedir la conversión
+            logger.warning(f"Cache lookup failed: {str(e)}")
+            metrics.increment("errors_total", component="cache", type=type(e).__name__)
+            return {}
+        return found
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached value for ``key`` or None."""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: Iterable[tuple], kind: str) -> None:
+        """
+        Stores many ``(key, value)`` pairs, evicting old entries if needed.
+
+        Values larger than ``max_size`` are not stored.
+        """
+        now = time.time_ns()
+        rows = [(key, kind, value, len(value), now) for key, value in items if len(value) <= self.max_size]
+        if not rows:
+            return
+        try:
+            with self._db:
+                replaced = self._sizes([row[0] for row in rows])
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO entries (key, kind, value, size, accessed) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+            self._size += sum(row[3] for row in rows) - replaced
+            if self._size > self.max_size:
+                self._evict()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache store failed: {str(e)}")
+            metrics.increment("errors_total", component="cache", type=type(e).__name__)
+
+    def put(self, key: str, value: bytes, kind: str) -> None:
+        """Stores a value under ``key``."""
+        self.put_many([(key, value)], kind)
+
+    def _sizes(self, keys: List[str]) -> int:
+        """Returns the total size of the existing entries among ``keys``."""
+        total = 0
+        for i in range(0, len(keys), _QUERY_BATCH):
+            batch = keys[i:i + _QUERY_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            total += self._db.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM entries WHERE key IN ({placeholders})", batch
+            ).fetchone()[0]
+        return total
+
+    def _evict(self) -> None:
+        """Deletes the least recently used entries until the cache fits ``max_size``."""
+        with self._db:
+            # Otros procesos pueden haber escrito: recalcular el total
+            self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            excess = self._size - self.max_size
+            victims = []
+            for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+                if excess <= 0:
+                    break
+                victims.append((key,))
+                excess -= size
+                self._size -= size
+            self._db.executemany("DELETE FROM entries WHERE key = ?", victims)
+        logger.debug(f"Evicted {len(victims)} cache entries")
+        metrics.increment("cache_evictions_total", len(victims))
+
+    def stats(self) -> Dict[str, int]:
+        """Returns entry count, total size, hits and misses."""
+        return {"entries": len(self), "size": self._size, "hits": self.hits, "misses": self.misses}
+
+    @metrics.timed("cache.text_to_morse")
+    def text_to_morse(self, converter: Any, text: str) -> str:
+        """
+        Cached ``converter.text_to_morse(text)``.
+
+        Parameters:
+            converter (MorseConverter): Converter whose code table is part of the key.
+            text (str): The text to convert.
+
+        Returns:
+            str: The Morse code.
+        """
+        return self.encode_many(converter, [text])[0]
+
+    @metrics.timed("cache.encode_many")
+    def encode_many(self, converter: Any, records: Iterable[str]) -> List[str]:
+        """
+        Cached ``converter.encode_many(records)``.
+
+        Only the records missing from the cache are converted, in one batch.
+
+        Parameters:
+            converter (MorseConverter): Converter whose code table is part of the key.
+            records (Iterable[str]): Texts to encode.
+
+        Returns:
+            List[str]: Morse code per record in the original order.
+        """
+        return self._convert_many(converter, list(records), TEXT_TO_MORSE, converter.encode_many)
+
+    @metrics.timed("cache.decode_many")
+    def decode_many(self, converter: Any, records: Iterable[str]) -> List[str]:
+        """Cached ``converter.decode_many(records)``, see ``encode_many``."""
+        return self._convert_many(converter, list(records), MORSE_TO_TEXT, converter.decode_many)
+
+    def _convert_many(self, converter: Any, records: List[str], kind: str, convert: Any) -> List[str]:
+        """Looks up every record and converts the misses in one batch."""
+        table = table_fingerprint(converter.table)
+        keys = [make_key(kind, record, table=table) for record in records]
+        found = self.get_many(keys)
+        missing = [i for i, key in enumerate(keys) if key not in found]
+        self._record(kind, len(records) - len(missing), len(missing))
+        if missing:
+            converted = convert([records[i] for i in missing])
+            new = {keys[i]: result.encode('utf-8') for i, result in zip(missing, converted)}
+            self.put_many(new.items(), kind)
+            found.update(new)
+        return [found[key].decode('utf-8') for key in keys]
@@ -1,25 +1,245 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import secrets
+import shutil
 from pathlib import Path
+from typing import IO, Any, Iterator, Optional
 from morse_converter.utils import setup_logger
+from morse_converter.utils.metrics import metrics
 
 # Configurar logger para este módulo
 logger = setup_logger(__name__)
 
+# Políticas de fsync al cerrar un archivo
+FSYNC_NONE = "none"
+FSYNC_FILE = "file"
+FSYNC_DIR = "dir"
+FSYNC_POLICIES = (FSYNC_NONE, FSYNC_FILE, FSYNC_DIR)
+
+# Compresión transparente: por extensión al escribir y por firma al leer
+COMPRESSORS = {'gzip': gzip, 'bz2': bz2, 'xz': lzma}
+_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+_MAGIC = ((b'\x1f\x8b', 'gzip'), (b'BZh', 'bz2'), (b'\xfd7zXZ\x00', 'xz'))
+
+# Errores de descompresión que no derivan de OSError
+_DECOMPRESSION_ERRORS = (EOFError, lzma.LZMAError)
+
+DEFAULT_READ_CHUNK = 1024 * 1024  # caracteres
+
 class FileOperationError(Exception):
     """Custom exception for file operation errors."""
     pass
 
+def _fsync_dir(directory: Path) -> None:
+    """Flushes a directory entry (e.g. after a rename) to disk."""
+    fd = os.open(str(directory), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def compression_for(file_path: str) -> Optional[str]:
+    """
+    Returns the compression implied by a file name's extension.
+
+    Returns:
+        str | None: "gzip", "bz2", "xz" or None for plain files.
+    """
+    return _EXTENSIONS.get(Path(file_path).suffix.lower())
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """
+    Detects the compression of an existing file from its magic bytes.
+
+    Returns:
+        str | None: "gzip", "bz2", "xz" or None for plain files.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with Path(file_path).open('rb') as file:
+        header = file.read(6)
+    for magic, compression in _MAGIC:
+        if header.startswith(magic):
+            return compression
+    return None
+
+class FileWriter:
+    """
+    Streaming text writer returned by ``FileHandler.open_writer``.
+
+    Files ending in ``.gz``, ``.bz2`` or ``.xz`` are compressed on the fly.
+    In atomic mode the content goes to a temporary file next to the target,
+    which replaces the target only when the writer is closed successfully,
+    so readers never see a partial file. Used as a context manager, an
+    exception discards the temporary file and leaves the target untouched.
+
+    Methods:
+        write(text: str) -> int
+            Writes text and returns the number of characters written.
+        close() -> None
+            Flushes, applies the fsync policy and publishes the file.
+        abort() -> None
+            Discards an atomic write.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        append: bool = False,
+        atomic: bool = False,
+        buffer_size: int = -1,
+        fsync: str = FSYNC_NONE
+    ):
+        """
+        Initialize the FileWriter and open the file.
+
+        Parameters:
+            path (Path): The file to write.
+            append (bool): Append to the file instead of replacing it (default: False)
+            atomic (bool): Write to a temporary file and rename it on close (default: False)
+            buffer_size (int): Buffer size in bytes, -1 for the default (default: -1)
+            fsync (str): "none", "file" or "dir" (default: "none")
+
+        Raises:
+            ValueError: If the fsync policy is unknown or atomic is combined with append.
+            OSError: If the file cannot be opened.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync}'. Use one of: {', '.join(FSYNC_POLICIES)}")
+        if atomic and append:
+            raise ValueError("Atomic writes cannot append to a file")
+        self.path = path
+        self.atomic = atomic
+        self.fsync = fsync
+        self.written = 0
+        self.closed = False
+        # El archivo temporal está en el mismo directorio para que os.replace sea atómico
+        self._temp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp") if atomic else None
+        mode = 'a' if append else ('x' if atomic else 'w')
+        target = self._temp_path or path
+        self.compression = compression_for(str(path))
+        if self.compression is None:
+            self._raw: Optional[IO[bytes]] = None
+            self._file = target.open(mode, buffering=buffer_size, encoding='utf-8')
+        else:
+            # El compresor escribe sobre el archivo binario, que se cierra aparte
+            self._raw = target.open(mode + 'b', buffering=buffer_size)
+            if self.compression == 'gzip':
+                # La cabecera gzip guarda el nombre del destino, no el del temporal
+                stream = gzip.GzipFile(filename=path.name, mode='ab' if append else 'wb', fileobj=self._raw)
+                self._file = io.TextIOWrapper(stream, encoding='utf-8')
+            else:
+                compressor = COMPRESSORS[self.compression]
+                self._file = compressor.open(self._raw, 'at' if append else 'wt', encoding='utf-8')
+
+    def write(self, text: str) -> int:
+        """Writes text and returns the number of characters written."""
+        count = self._file.write(text)
+        self.written += count
+        return count
+
+    def close(self) -> None:
+        """Flushes, applies the fsync policy and, in atomic mode, replaces the target."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._file.flush()
+            if self._raw is not None:
+                # Cerrar el compresor escribe el final del flujo comprimido
+                self._file.close()
+                self._raw.flush()
+            if self.fsync != FSYNC_NONE:
+                os.fsync((self._raw or self._file).fileno())
+        except BaseException:
+            self._close_files()
+            self._discard()
+            raise
+        self._close_files()
+        if self._temp_path is not None:
+            try:
+                if self.path.exists():
+                    shutil.copymode(self.path, self._temp_path)
+                os.replace(self._temp_path, self.path)
+            except BaseException:
+                self._discard()
+                raise
+        if self.fsync == FSYNC_DIR:
+            _fsync_dir(self.path.parent)
+
+    def abort(self) -> None:
+        """Closes the file; an atomic write is discarded and the target left untouched."""
+        if self.closed:
+            return
+        self.closed = True
+        self._close_files()
+        self._discard()
+
+    def _close_files(self) -> None:
+        """Closes the text stream and the underlying binary file."""
+        try:
+            self._file.close()
+        finally:
+            if self._raw is not None:
+                self._raw.close()
+
+    def _discard(self) -> None:
+        """Removes the temporary file of an atomic write."""
+        if self._temp_path is not None:
+            self._temp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "FileWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is not None and self.atomic:
+            self.abort()
+        else:
+            self.close()
+
 class FileHandler:
     """
     Manages file operations for input/output and configuration.
 
+    Writes can be atomic (temporary file plus ``os.replace``), so a file
+    that exists is always complete and interrupted batch jobs can skip the
+    outputs already written. gzip, bz2 and xz files are decompressed when
+    read (detected by magic bytes) and compressed when written (by extension).
+
     Methods:
         read_file(file_path: str) -> str
             Reads content from a file.
         
         write_file(file_path: str, content: str) -> None
             Writes content to a file.
+
+        open_writer(file_path: str, append: bool = False) -> FileWriter
+            Opens a streaming writer.
+
+        iter_chunks(file_path: str, chunk_size: int) -> Iterator[str]
+            Reads a file in chunks with bounded memory.
     """
 
+    def __init__(self, atomic: bool = False, buffer_size: int = -1, fsync: str = FSYNC_NONE):
+        """
+        Initialize the FileHandler.
+
+        Parameters:
+            atomic (bool): Default for atomic writes (default: False)
+            buffer_size (int): Default write buffer size in bytes, -1 for the system default
+            fsync (str): Default fsync policy: "none", "file" or "dir" (default: "none")
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync}'. Use one of: {', '.join(FSYNC_POLICIES)}")
+        self.atomic = atomic
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+
+    @metrics.timed("file_handler.read_file")
     def read_file(self, file_path: str) -> str:
         """
         Reads content from a file.
@@ -50,22 +270,74 @@ class FileHandler:
                 logger.error(f"Path is not a file: {file_path}")
                 raise FileOperationError(f"Path is not a file: {file_path}")
                 
-            with path.open('r', encoding='utf-8') as file:
+            with self._open_text(path) as file:
                 content = file.read()
                 logger.debug(f"Successfully read {len(content)} characters from {file_path}")
                 return content
                 
-        except (PermissionError, OSError) as e:
+        except (PermissionError, OSError, *_DECOMPRESSION_ERRORS) as e:
             logger.error(f"Error reading file {file_path}: {str(e)}")
+            metrics.increment("errors_total", component="file_handler", type=type(e).__name__)
             raise FileOperationError(f"Error reading file: {str(e)}")
 
-    def write_file(self, file_path: str, content: str) -> None:
+    @staticmethod
+    def _open_text(path: Path) -> IO[str]:
+        """Opens a file for reading text, decompressing it if needed."""
+        compression = detect_compression(str(path))
+        if compression is None:
+            return path.open('r', encoding='utf-8')
+        logger.debug(f"Reading {compression}-compressed file: {path}")
+        return COMPRESSORS[compression].open(str(path), 'rt', encoding='utf-8')
+
+    def iter_chunks(self, file_path: str, chunk_size: int = DEFAULT_READ_CHUNK) -> Iterator[str]:
+        """
+        Reads a file in chunks of at most ``chunk_size`` characters.
+
+        Compressed files are decompressed on the fly, so memory use stays
+        bounded by the chunk size.
+
+        Parameters:
+            file_path (str): The path to the file to read.
+            chunk_size (int): Characters per chunk (default: 1 Mi)
+
+        Yields:
+            str: The next chunk of the file.
+
+        Raises:
+            FileOperationError: If the file cannot be read.
+        """
+        logger.info(f"Attempting to stream file: {file_path}")
+        path = Path(file_path)
+        if not path.is_file():
+            logger.error(f"File not found: {file_path}")
+            raise FileOperationError(f"File not found: {file_path}")
+        try:
+            with self._open_text(path) as file:
+                for chunk in iter(lambda: file.read(chunk_size), ''):
+                    yield chunk
+        except (PermissionError, OSError, *_DECOMPRESSION_ERRORS) as e:
+            logger.error(f"Error reading file {file_path}: {str(e)}")
+            metrics.increment("errors_total", component="file_handler", type=type(e).__name__)
+            raise FileOperationError(f"Error reading file: {str(e)}")
+
+    @metrics.timed("file_handler.write_file")
+    def write_file(
+        self,
+        file_path: str,
+        content: str,
+        atomic: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+        fsync: Optional[str] = None
+    ) -> None:
         """
         Writes content to a file.
 
         Parameters:
             file_path (str): The path to the file to write.
             content (str): The content to write to the file.
+            atomic (bool, optional): Override the handler's atomic mode.
+            buffer_size (int, optional): Override the handler's buffer size.
+            fsync (str, optional): Override the handler's fsync policy.
 
         Raises:
             FileOperationError: If the file cannot be written.
@@ -76,15 +348,68 @@ class FileHandler:
         """
         logger.info(f"Attempting to write to file: {file_path}")
         try:
-            path = Path(file_path)
-            
-            # Crear directorio si no existe
-            path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with path.open('w', encoding='utf-8') as file:
-                file.write(content)
-                logger.debug(f"Successfully wrote {len(content)} characters to {file_path}")
+            with self._open_writer(file_path, False, atomic, buffer_size, fsync) as writer:
+                writer.write(content)
+            logger.debug(f"Successfully wrote {len(content)} characters to {file_path}")
                 
         except (PermissionError, OSError) as e:
             logger.error(f"Error writing to file {file_path}: {str(e)}")
+            metrics.increment("errors_total", component="file_handler", type=type(e).__name__)
             raise FileOperationError(f"Error writing to file: {str(e)}")
+
+    def open_writer(
+        self,
+        file_path: str,
+        append: bool = False,
+        atomic: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+        fsync: Optional[str] = None
+    ) -> FileWriter:
+        """
+        Opens a streaming writer, creating the parent directory if needed.
+
+        Parameters:
+            file_path (str): The path to the file to write.
+            append (bool): Append instead of replacing the file (default: False)
+            atomic (bool, optional): Override the handler's atomic mode; ignored when appending.
+            buffer_size (int, optional): Override the handler's buffer size.
+            fsync (str, optional): Override the handler's fsync policy.
+
+        Returns:
+            FileWriter: The writer, usable as a context manager.
+
+        Raises:
+            FileOperationError: If the file cannot be opened.
+
+        Example:
+            >>> handler = FileHandler(atomic=True)
+            >>> with handler.open_writer("out.txt") as writer:
+            ...     writer.write("... --- ...")
+        """
+        logger.info(f"Opening writer for file: {file_path}")
+        try:
+            return self._open_writer(file_path, append, atomic, buffer_size, fsync)
+        except (PermissionError, OSError) as e:
+            logger.error(f"Error opening file {file_path}: {str(e)}")
+            metrics.increment("errors_total", component="file_handler", type=type(e).__name__)
+            raise FileOperationError(f"Error opening file: {str(e)}")
+
+    def _open_writer(
+        self,
+        file_path: str,
+        append: bool,
+        atomic: Optional[bool],
+        buffer_size: Optional[int],
+        fsync: Optional[str]
+    ) -> FileWriter:
+        """Opens a FileWriter with the handler's defaults applied."""
+        path = Path(file_path)
+        # Crear directorio si no existe
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return FileWriter(
+            path,
+            append=append,
+            atomic=(self.atomic if atomic is None else atomic) and not append,
+            buffer_size=self.buffer_size if buffer_size is None else buffer_size,
+            fsync=self.fsync if fsync is None else fsync
+        )
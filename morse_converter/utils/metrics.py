@@ -0,0 +1,418 @@
+import functools
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Clave de una métrica: nombre y etiquetas ordenadas
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+def _key(name: str, labels: Dict[str, Any]) -> MetricKey:
+    """Builds the registry key for a metric name and its labels."""
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+class Histogram:
+    """
+    Bucketed histogram of observed values.
+
+    Attributes:
+        buckets (Tuple[float, ...]): Upper bounds of the buckets.
+        bucket_counts (List[int]): Observations per bucket (non-cumulative);
+            the last entry counts values above the largest bound.
+        count (int): Number of observations.
+        sum (float): Sum of all observations.
+        min (float): Smallest observation.
+        max (float): Largest observation.
+    """
+
+    # Límites por defecto pensados para latencias en segundos
+    DEFAULT_BUCKETS: Tuple[float, ...] = (
+        0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0
+    )
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        """
+        Initialize the Histogram.
+
+        Parameters:
+            buckets (Tuple[float, ...], optional): Ascending bucket upper bounds.
+        """
+        self.buckets = tuple(buckets or self.DEFAULT_BUCKETS)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float) -> None:
+        """Records one observation."""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[index] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    @property
+    def mean(self) -> float:
+        """Mean of the observations (0.0 when empty)."""
+        return self.sum / self.count if self.count else 0.0
+
+class MetricsRegistry:
+    """
+    Process-wide registry of counters, histograms and timers.
+
+    The registry is disabled by default; while disabled every recording call
+    returns immediately, so instrumented code pays only an attribute check.
+
+    Methods:
+        enable() -> None
+            Starts recording metrics.
+        disable() -> None
+            Stops recording metrics.
+        increment(name: str, amount: float = 1, **labels) -> None
+            Adds to a counter.
+        observe(name: str, value: float, **labels) -> None
+            Records a value in a histogram.
+        set_gauge(name: str, value: float, **labels) -> None
+            Sets a value that can go up and down.
+        timer(name: str, **labels) -> ContextManager
+            Times a block of code into a histogram.
+        timed(name: str) -> Callable
+            Decorator that times every call of a function.
+    """
+
+    def __init__(self):
+        """Initialize an empty, disabled MetricsRegistry."""
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.counters: Dict[MetricKey, float] = {}
+        self.histograms: Dict[MetricKey, Histogram] = {}
+        self.gauges: Dict[MetricKey, float] = {}
+
+    def enable(self) -> None:
+        """Starts recording metrics."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops recording metrics. Recorded values are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discards every recorded metric."""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.gauges.clear()
+
+    def increment(self, name: str, amount: float = 1, **labels: Any) -> None:
+        """
+        Adds ``amount`` to a counter.
+
+        Parameters:
+            name (str): The counter name.
+            amount (float): The value to add (default: 1).
+            **labels: Label values distinguishing series of the same counter.
+        """
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """
+        Records a value in a histogram.
+
+        Parameters:
+            name (str): The histogram name.
+            value (float): The observed value.
+            **labels: Label values distinguishing series of the same histogram.
+        """
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        """
+        Sets a gauge, a value that can go up and down such as a queue depth.
+
+        Parameters:
+            name (str): The gauge name.
+            value (float): The current value.
+            **labels: Label values distinguishing series of the same gauge.
+        """
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self.gauges[key] = value
+
+    @contextmanager
+    def _timer(self, name: str, labels: Dict[str, Any]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @contextmanager
+    def _null_timer(self) -> Iterator[None]:
+        yield
+
+    def timer(self, name: str, **labels: Any):
+        """
+        Times a block of code into the histogram ``name`` (in seconds).
+
+        Example:
+            >>> with metrics.timer("audio.render"):
+            ...     render()
+        """
+        if not self.enabled:
+            return self._null_timer()
+        return self._timer(name, labels)
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        """
+        Decorator that records the duration of every call in seconds.
+
+        Parameters:
+            name (str): The histogram name, usually ``component.method``.
+        """
+        def decorator(func: F) -> F:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start)
+            return wrapper  # type: ignore[return-value]
+        return decorator
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Returns a per-stage breakdown of the recorded histograms.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per histogram with calls, total,
+            mean and max duration and its share of the summed total, sorted
+            by total time descending.
+        """
+        with self._lock:
+            items = list(self.histograms.items())
+        grand_total = sum(h.sum for _, h in items) or 1.0
+        rows = [
+            {
+                "name": name,
+                "labels": dict(labels),
+                "calls": histogram.count,
+                "total": histogram.sum,
+                "mean": histogram.mean,
+                "max": histogram.max,
+                "share": histogram.sum / grand_total,
+            }
+            for (name, labels), histogram in items
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+# Registro global compartido por todos los módulos
+metrics = MetricsRegistry()
+
+# Prefijo común de las métricas expuestas
+PROMETHEUS_PREFIX = "morse_converter_"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def _prometheus_name(name: str) -> str:
+    """Converts a registry name such as ``converter.text_to_morse`` to a metric name."""
+    return PROMETHEUS_PREFIX + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+def _escape_label(value: str) -> str:
+    """Escapes backslashes, quotes and newlines in a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _prometheus_labels(labels: Tuple[Tuple[str, str], ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    """Formats a label set as ``{key="value",...}`` with escaping."""
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs) + "}"
+
+def _format_value(value: float) -> str:
+    """Formats a sample value the way Prometheus expects."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    """
+    Renders a registry in the Prometheus text exposition format.
+
+    Counters keep their registry name (which should end in ``_total``) and
+    gauges are exposed as they are.
+    Histograms are recorded by timers, so they are exposed as latency
+    histograms with a ``_seconds`` suffix and cumulative buckets.
+
+    Parameters:
+        registry (MetricsRegistry, optional): Registry to render (default: the global one).
+
+    Returns:
+        str: The exposition text.
+    """
+    registry = registry or metrics
+    with registry._lock:
+        counters = sorted(registry.counters.items())
+        gauges = sorted(registry.gauges.items())
+        histograms = sorted(
+            (key, (h.buckets, list(h.bucket_counts), h.sum, h.count))
+            for key, h in registry.histograms.items()
+        )
+
+    lines: List[str] = []
+    declared = set()
+    for (name, labels), value in counters:
+        metric = _prometheus_name(name)
+        if metric not in declared:
+            lines.append(f"# TYPE {metric} counter")
+            declared.add(metric)
+        lines.append(f"{metric}{_prometheus_labels(labels)} {_format_value(value)}")
+
+    for (name, labels), value in gauges:
+        metric = _prometheus_name(name)
+        if metric not in declared:
+            lines.append(f"# TYPE {metric} gauge")
+            declared.add(metric)
+        lines.append(f"{metric}{_prometheus_labels(labels)} {_format_value(value)}")
+
+    for (name, labels), (buckets, bucket_counts, total, count) in histograms:
+        metric = _prometheus_name(name) + "_seconds"
+        if metric not in declared:
+            lines.append(f"# TYPE {metric} histogram")
+            declared.add(metric)
+        cumulative = 0
+        for bound, bucket_count in zip(buckets + (float("inf"),), bucket_counts):
+            cumulative += bucket_count
+            le = (("le", _format_value(bound)),)
+            lines.append(f"{metric}_bucket{_prometheus_labels(labels, le)} {cumulative}")
+        lines.append(f"{metric}_sum{_prometheus_labels(labels)} {_format_value(total)}")
+        lines.append(f"{metric}_count{_prometheus_labels(labels)} {count}")
+
+    return "\n".join(lines) + "\n" if lines else ""
+
+def write_prometheus(file_path: Union[str, Path], registry: Optional[MetricsRegistry] = None) -> None:
+    """
+    Writes the exposition text to a file, e.g. for node_exporter's textfile collector.
+
+    The file is replaced atomically so scrapers never read a partial file.
+
+    Parameters:
+        file_path (str | Path): Destination file.
+        registry (MetricsRegistry, optional): Registry to render (default: the global one).
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(render_prometheus(registry))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+class MetricsServer:
+    """
+    Local HTTP endpoint serving the registry in Prometheus text format.
+
+    The server runs in a daemon thread and answers ``GET /metrics``.
+
+    Methods:
+        start() -> None
+            Starts serving in the background.
+        stop() -> None
+            Stops the server.
+    """
+
+    def __init__(self, port: int = 9464, host: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None):
+        """
+        Initialize the MetricsServer.
+
+        Parameters:
+            port (int): TCP port to listen on; 0 picks a free port (default: 9464)
+            host (str): Interface to bind (default: 127.0.0.1)
+            registry (MetricsRegistry, optional): Registry to expose (default: the global one)
+        """
+        self.host = host
+        self.port = port
+        self.registry = registry or metrics
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint."""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> None:
+        """Starts serving in a background thread."""
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render_prometheus(registry).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                # Evitar que cada scrape escriba en stderr
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the server and waits for the thread to exit."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "MetricsServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()